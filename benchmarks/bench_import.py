@@ -0,0 +1,100 @@
+"""
+========================================================================================================================
+Name: bench_import.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Times the import of the headless packages in a fresh interpreter, and checks they do not pull Qt or query the screen
+PPI. Exits with 1 if an import is slower than --max-ms or imports Qt, so it can guard against regressions.
+
+Usage: mayapy -m benchmarks.bench_import [--modules maurice_texture_connector.core ...] [--repeat 5] [--max-ms 250]
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import subprocess
+import argparse
+import json
+import sys
+import os
+
+
+MODULES = ('maurice_texture_connector', 'maurice_texture_connector.utils', 'maurice_texture_connector.core')
+
+QT_MODULES = ('PySide2', 'PySide6', 'shiboken2', 'shiboken6')
+
+IMPORT_CODE = '''
+import json
+import sys
+import time
+
+start_time = time.perf_counter()
+import {module}
+import_time = time.perf_counter() - start_time
+
+maurice = sys.modules['maurice_texture_connector']
+
+print(json.dumps({{
+    'time': import_time,
+    'qt_modules': sorted(name for name in sys.modules if name.split('.')[0] in {qt_modules!r}),
+    'ppi_queried': 'PPI' in vars(maurice)
+}}))
+'''
+
+
+def time_import(module: str, repeat: int) -> dict:
+    """Imports the module in fresh interpreters, returning the best time and what the import pulled."""
+    root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (root_path, os.environ.get('PYTHONPATH')))))
+
+    code = IMPORT_CODE.format(module=module, qt_modules=QT_MODULES)
+    result = {}
+
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env)
+
+        if output.returncode:
+            raise RuntimeError(f'import {module} failed:\n{output.stderr}')
+
+        run_result = json.loads(output.stdout.strip().splitlines()[-1])
+
+        if not result or run_result['time'] < result['time']:
+            result = run_result
+
+    return result
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmarks the import of the headless packages.')
+    parser.add_argument('--modules', nargs='+', default=MODULES, help='modules to import')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported')
+    parser.add_argument('--max-ms', type=float, default=0.0, help='fails if an import is slower, 0 to disable')
+    args = parser.parse_args()
+
+    failed = False
+
+    for module in args.modules:
+        result = time_import(module, args.repeat)
+        import_time = result['time'] * 1000
+
+        status = []
+
+        if result['qt_modules']:
+            status.append(f'imports {", ".join(result["qt_modules"])}')
+            failed = True
+
+        if result['ppi_queried']:
+            status.append('queries the PPI')
+
+        if args.max_ms and import_time > args.max_ms:
+            status.append(f'slower than {args.max_ms:g}ms')
+            failed = True
+
+        print(f'{module}: {import_time:.2f}ms{" (" + "; ".join(status) + ")" if status else ""}')
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
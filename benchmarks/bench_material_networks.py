@@ -0,0 +1,155 @@
+"""
+========================================================================================================================
+Name: bench_material_networks.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Creates and resolves the material networks of every render engine and backend on the fake Maya, reporting their time
+and Maya calls.
+
+Usage: python -m benchmarks.bench_material_networks [--texture-sets 100] [--latency-us 0] [--triplanar] [--calls 5]
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import argparse
+import importlib
+import tempfile
+import shutil
+import time
+import sys
+
+import benchmarks.synthetic_textures as synthetic_textures
+import benchmarks.fake_maya as fake_maya
+
+
+BACKENDS = ('cmds', 'open_maya')
+
+# {render engine: (EditMaterialNetwork module, class name)}
+EDIT_MATERIAL_NETWORKS = {
+    'arnold': ('edit_material_network_arnold', 'EditMaterialNetworkArnold'),
+    'redshift': ('edit_material_network_redshift', 'EditMaterialNetworkRedshift'),
+    'vray': ('edit_material_network_v_ray', 'EditMaterialNetworkVRay')
+}
+
+
+def run_render_engine(graph: any, render_engine: str, backend: str, folder: str, use_triplanar: bool) -> dict:
+    """Creates the material networks of the folder then resolves their file nodes, returning the results."""
+    import maya.cmds as cmds
+
+    from maurice_texture_connector.core.network_backend_open_maya import NetworkBackendOpenMaya
+    from maurice_texture_connector.core.material_network_preset import MaterialNetworkPreset
+    from maurice_texture_connector.core.create_material_network import CreateMaterialNetwork
+    from maurice_texture_connector.core.network_backend_cmds import NetworkBackendCmds
+    from maurice_texture_connector.cli.build_command import RENDER_ENGINES
+
+    plugin_name, module_name, class_name = RENDER_ENGINES[render_engine]
+    edit_module_name, edit_class_name = EDIT_MATERIAL_NETWORKS[render_engine]
+
+    graph.reset()
+    graph.messages.clear()
+    CreateMaterialNetwork.plans.clear()
+
+    for plugin in (plugin_name, 'lookdevKit'):
+        cmds.loadPlugin(plugin, quiet=True)
+
+    material_network = getattr(importlib.import_module(f'maurice_texture_connector.core.{module_name}'), class_name)()
+    edit_material_network_class = getattr(
+        importlib.import_module(f'maurice_texture_connector.core.{edit_module_name}'),
+        edit_class_name)
+
+    MaterialNetworkPreset().set_material_network_settings(material_network)
+    material_network.set_backend(NetworkBackendOpenMaya() if backend == 'open_maya' else NetworkBackendCmds())
+
+    nodes_count = len(graph.nodes)
+    graph.calls.clear()
+
+    start_time = time.perf_counter()
+    materials = material_network.create_batch(folder_path=folder, recursive=False, use_triplanar=use_triplanar)
+    create_time = time.perf_counter() - start_time
+    create_calls = graph.calls.copy()
+
+    graph.calls.clear()
+
+    start_time = time.perf_counter()
+    resolved = sum(1 for material in materials
+                   if all(edit_material_network_class(material).get_file_nodes().values()))
+    edit_time = time.perf_counter() - start_time
+    edit_calls = graph.calls.copy()
+
+    results = {
+        'render_engine': render_engine,
+        'backend': backend,
+        'materials': len(materials),
+        'nodes': len(graph.nodes) - nodes_count,
+        'create_time': create_time,
+        'create_calls': create_calls,
+        'edit_time': edit_time,
+        'edit_calls': edit_calls,
+        'resolved': resolved,
+        'errors': [message for level, message in graph.messages if level == 'error']
+    }
+
+    return results
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmarks the material networks on the fake Maya.')
+    parser.add_argument('--texture-sets', type=int, default=100, help='number of texture sets of the folder')
+    parser.add_argument('--latency-us', type=float, default=0.0, help='latency added to each Maya call')
+    parser.add_argument('--triplanar', action='store_true', help='create triplanar networks')
+    parser.add_argument('--calls', type=int, default=0, help='print the most called commands of each run')
+    args = parser.parse_args()
+
+    graph = fake_maya.install()
+    graph.call_latency = args.latency_us / 1e6
+
+    temp_folder = tempfile.mkdtemp(prefix='bench_material_networks_')
+    synthetic_textures.create_texture_folder(
+        temp_folder,
+        files=args.texture_sets * len(synthetic_textures.SUFFIXES),
+        layout='flat')
+
+    results = []
+
+    try:
+        for render_engine in sorted(EDIT_MATERIAL_NETWORKS):
+            for backend in BACKENDS:
+                results.append(run_render_engine(
+                    graph=graph,
+                    render_engine=render_engine,
+                    backend=backend,
+                    folder=temp_folder,
+                    use_triplanar=args.triplanar))
+    finally:
+        shutil.rmtree(temp_folder, ignore_errors=True)
+
+    print(f'texture sets: {args.texture_sets}, latency: {args.latency_us}us, triplanar: {args.triplanar}')
+    print(f'{"engine":<10}{"backend":<11}{"materials":>10}{"nodes":>8}{"create":>10}{"calls":>9}{"calls/mat":>11}'
+          f'{"edit":>10}{"calls":>9}{"resolved":>10}')
+
+    failed = False
+
+    for result in results:
+        create_calls = sum(result['create_calls'].values())
+        materials = result['materials']
+
+        print(f'{result["render_engine"]:<10}{result["backend"]:<11}{materials:>10}{result["nodes"]:>8}'
+              f'{result["create_time"]:>9.3f}s{create_calls:>9}{create_calls / materials if materials else 0:>11.1f}'
+              f'{result["edit_time"]:>9.3f}s{sum(result["edit_calls"].values()):>9}{result["resolved"]:>10}')
+
+        for calls_name in ('create_calls', 'edit_calls') if args.calls else ():
+            most_common = ', '.join(f'{name} {count}' for name, count in result[calls_name].most_common(args.calls))
+            print(f'    {calls_name}: {most_common}')
+
+        for error in result['errors']:
+            print(f'    error: {error}')
+
+        failed = failed or result['errors'] or result['resolved'] != materials
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
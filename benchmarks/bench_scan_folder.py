@@ -0,0 +1,104 @@
+"""
+========================================================================================================================
+Name: bench_scan_folder.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Compares the glob + is_image listing against scan_folder on a synthetic folder.
+
+Usage: mayapy -m benchmarks.bench_scan_folder [--files 50000] [--folder PATH] [--repeat 3]
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from pathlib import Path
+from glob import glob
+import argparse
+import tempfile
+import shutil
+import time
+import os
+
+import maurice_texture_connector.utils as maurice_utils
+
+
+EXTENSIONS = ('.exr', '.png', '.tif', '.jpg', '.tx', '.txt', '.mb')
+
+
+def create_synthetic_folder(path: str, files: int) -> None:
+    """Creates a folder with empty files of mixed extensions."""
+    os.makedirs(path, exist_ok=True)
+
+    for i in range(files):
+        extension = EXTENSIONS[i % len(EXTENSIONS)]
+
+        with open(os.path.join(path, f'asset{i // 7:05d}_baseColor{extension}'), 'wb'):
+            pass
+
+
+def list_images_glob(path: str) -> list:
+    """Lists the images of the folder the way it was done before scan_folder."""
+    images = []
+
+    for file_path in glob(os.path.join(path, '*')):
+        file_path = file_path.replace('\\', '/')
+
+        if os.path.isfile(file_path):
+            if Path(file_path).suffix in ['.exr', '.gif', '.hdr', '.jpg', '.jpeg', '.png', '.tif', '.tiff']:
+                images.append((os.path.basename(file_path), file_path, os.path.getsize(file_path)))
+
+    return images
+
+
+def list_images_scandir(path: str) -> list:
+    """Lists the images of the folder with scan_folder."""
+    return [(entry.name, entry.path, entry.size) for entry in maurice_utils.scan_folder(
+        path=path,
+        extensions=maurice_utils.IMAGE_EXTENSIONS)]
+
+
+def time_function(function: callable, path: str, repeat: int) -> tuple:
+    """Times the function, returning the best time and the number of images listed."""
+    best_time = float('inf')
+    images = []
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        images = function(path)
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    return best_time, len(images)
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmarks the folder listing.')
+    parser.add_argument('--files', type=int, default=50000, help='number of files of the synthetic folder')
+    parser.add_argument('--folder', default='', help='existing folder to list instead of a synthetic one')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    temp_folder = ''
+    folder = args.folder
+
+    if not folder:
+        temp_folder = tempfile.mkdtemp(prefix='bench_scan_folder_')
+        folder = temp_folder
+
+        create_synthetic_folder(folder, args.files)
+
+    try:
+        glob_time, glob_images = time_function(list_images_glob, folder, args.repeat)
+        scandir_time, scandir_images = time_function(list_images_scandir, folder, args.repeat)
+    finally:
+        if temp_folder:
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+    print(f'folder: {folder}')
+    print(f'glob + is_image: {glob_time:.4f}s ({glob_images} images)')
+    print(f'scan_folder:     {scandir_time:.4f}s ({scandir_images} images)')
+    print(f'speedup:         {glob_time / scandir_time if scandir_time else float("inf"):.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+"""
+========================================================================================================================
+Name: bench_suite.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Times the texture discovery and the material networks creation on synthetic texture folders, on the fake Maya, and
+writes the results as JSON. Comparing with the results of a previous release shows the regressions.
+
+Usage: python -m benchmarks.bench_suite [--files 1000 10000 100000] [--layouts flat udim mixed] [--output results.json]
+       [--baseline previous.json] [--threshold 1.25] [--materials 50] [--repeat 3] [--latency-us 0]
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import importlib
+import argparse
+import platform
+import tempfile
+import shutil
+import time
+import json
+import sys
+import os
+
+import benchmarks.synthetic_textures as synthetic_textures
+import benchmarks.fake_maya as fake_maya
+
+
+RENDER_ENGINES = ('arnold', 'redshift', 'vray')
+
+
+def compare_results(results: list, baseline_results: list, threshold: float) -> list:
+    """Prints the ratio of every result to its baseline, returning the names of the ones slower than the threshold."""
+    baseline_times = {result['name']: result['time'] for result in baseline_results}
+    regressions = []
+
+    print(f'\n{"benchmark":<48}{"baseline":>12}{"current":>12}{"ratio":>8}')
+
+    for result in results:
+        baseline_time = baseline_times.get(result['name'])
+
+        if not baseline_time:
+            continue
+
+        ratio = result['time'] / baseline_time
+        is_regression = ratio > threshold
+
+        if is_regression:
+            regressions.append(result['name'])
+
+        print(f'{result["name"]:<48}{baseline_time:>11.4f}s{result["time"]:>11.4f}s{ratio:>7.2f}x'
+              f'{"  REGRESSION" if is_regression else ""}')
+
+    return regressions
+
+
+def get_material_network(render_engine: str) -> any:
+    """Gets the CreateMaterialNetwork of the render engine with the default preset, its plugins loaded."""
+    import maya.cmds as cmds
+
+    from maurice_texture_connector.core.material_network_preset import MaterialNetworkPreset
+    from maurice_texture_connector.cli.build_command import RENDER_ENGINES as BUILD_RENDER_ENGINES
+
+    plugin_name, module_name, class_name = BUILD_RENDER_ENGINES[render_engine]
+
+    for plugin in (plugin_name, 'lookdevKit'):
+        cmds.loadPlugin(plugin, quiet=True)
+
+    material_network = getattr(importlib.import_module(f'maurice_texture_connector.core.{module_name}'), class_name)()
+    MaterialNetworkPreset().set_material_network_settings(material_network)
+
+    return material_network
+
+
+def run_folder(graph: any, folder: str, base_color_paths: list, layout: str, files: int, args: any) -> list:
+    """Runs the benchmarks of a folder, returning their results."""
+    from maurice_texture_connector.core.create_material_network import CreateMaterialNetwork
+    from maurice_texture_connector.core.texture_set_index import TextureSetIndex
+    import maurice_texture_connector.utils as maurice_utils
+
+    results = []
+    name = f'{layout}/{files}'
+    images_paths = sorted(path for path in maurice_utils.get_files_in_folder(folder).values()
+                          if maurice_utils.is_image(path))
+    sample_paths = [path for path in base_color_paths if maurice_utils.is_image(path)][:args.materials]
+    material_network = get_material_network(RENDER_ENGINES[0])
+
+    # get_files_in_folder
+    results.append(time_function(
+        name=f'get_files_in_folder/{name}',
+        function=lambda: maurice_utils.get_files_in_folder(folder),
+        repeat=args.repeat,
+        items=len(images_paths)))
+
+    # get_texture_base_name
+    results.append(time_function(
+        name=f'get_texture_base_name/{name}',
+        function=lambda: [material_network.get_texture_base_name(path) for path in images_paths],
+        repeat=args.repeat,
+        items=len(images_paths)))
+
+    # get_textures_paths, the first call of the folder indexes it.
+    def get_textures_paths_cold() -> None:
+        TextureSetIndex.clear_indexes()
+
+        for path in sample_paths:
+            material_network.get_textures_paths(path)
+
+    results.append(time_function(
+        name=f'get_textures_paths_cold/{name}',
+        function=get_textures_paths_cold,
+        repeat=args.repeat,
+        items=len(sample_paths)))
+
+    results.append(time_function(
+        name=f'get_textures_paths/{name}',
+        function=lambda: [material_network.get_textures_paths(path) for path in sample_paths],
+        repeat=args.repeat,
+        items=len(sample_paths)))
+
+    # create
+    for render_engine in RENDER_ENGINES:
+        material_network = get_material_network(render_engine)
+        best_result = None
+
+        for _ in range(args.repeat):
+            graph.reset()
+            graph.messages.clear()
+            CreateMaterialNetwork.plans.clear()
+
+            nodes_count = len(graph.nodes)
+            graph.calls.clear()
+
+            start_time = time.perf_counter()
+
+            for path in sample_paths:
+                material_network.create(name='', image_path=path, use_texture_base_name=True, use_triplanar=False)
+
+            result = {
+                'name': f'create/{render_engine}/{name}',
+                'time': time.perf_counter() - start_time,
+                'items': len(sample_paths),
+                'nodes': len(graph.nodes) - nodes_count,
+                'calls': dict(graph.calls.most_common()),
+                'errors': [message for level, message in graph.messages if level == 'error']
+            }
+
+            if not best_result or result['time'] < best_result['time']:
+                best_result = result
+
+        results.append(best_result)
+
+    return results
+
+
+def time_function(name: str, function: callable, repeat: int, items: int) -> dict:
+    """Times the function, returning the result of the best run."""
+    best_time = float('inf')
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    return {'name': name, 'time': best_time, 'items': items}
+
+
+def main() -> None:
+    """Runs the benchmark suite."""
+    parser = argparse.ArgumentParser(description='Benchmarks the texture discovery and the material networks.')
+    parser.add_argument('--files', type=int, nargs='+', default=[1000, 10000], help='files of the synthetic folders')
+    parser.add_argument('--layouts', nargs='+', default=list(synthetic_textures.LAYOUTS),
+                        choices=synthetic_textures.LAYOUTS, help='layouts of the synthetic folders')
+    parser.add_argument('--materials', type=int, default=50, help='texture sets resolved and created by folder')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs, the best one is reported')
+    parser.add_argument('--latency-us', type=float, default=0.0, help='latency added to each Maya call')
+    parser.add_argument('--output', default='', help='.json file the results are written to')
+    parser.add_argument('--baseline', default='', help='.json results of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=1.25, help='ratio to the baseline reported as regression')
+    args = parser.parse_args()
+
+    graph = fake_maya.install()
+    graph.call_latency = args.latency_us / 1e6
+
+    import maurice_texture_connector as maurice
+
+    results = []
+
+    for layout in args.layouts:
+        for files in args.files:
+            temp_folder = tempfile.mkdtemp(prefix='bench_suite_')
+
+            try:
+                base_color_paths = synthetic_textures.create_texture_folder(temp_folder, files=files, layout=layout)
+                results.extend(run_folder(
+                    graph=graph,
+                    folder=temp_folder,
+                    base_color_paths=base_color_paths,
+                    layout=layout,
+                    files=files,
+                    args=args))
+            finally:
+                shutil.rmtree(temp_folder, ignore_errors=True)
+
+    print(f'{"benchmark":<48}{"time":>12}{"items":>8}{"us/item":>10}{"calls":>9}')
+
+    for result in results:
+        items = result['items']
+        calls = sum(result.get('calls', {}).values())
+
+        print(f'{result["name"]:<48}{result["time"]:>11.4f}s{items:>8}'
+              f'{result["time"] * 1e6 / items if items else 0:>10.1f}{calls if calls else "":>9}')
+
+        for error in result.get('errors', ()):
+            print(f'    error: {error}')
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+
+        with open(args.output, 'w') as f:
+            json.dump({
+                'version': maurice.VERSION,
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'latency_us': args.latency_us,
+                'results': results
+            }, f, indent=4)
+
+        print(f'results: {args.output}')
+
+    regressions = []
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_results(results, json.load(f)['results'], args.threshold)
+
+    sys.exit(1 if regressions or any(result.get('errors') for result in results) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+========================================================================================================================
+Name: bench_widgets_style.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Compares the style work done while building the Texture Connector window with a MauriceWidgetsStyle per widget, each
+listing the icons folder and building its style sheet, against the shared, memoized style.
+
+Usage: mayapy -m benchmarks.bench_widgets_style [--repeat 5]
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import argparse
+import time
+
+from maurice_texture_connector.ui.maurice_qt.maurice_widgets_styles import MauriceWidgetsStyle
+import maurice_texture_connector.utils as maurice_utils
+
+
+# Style sheets built while creating the window, '' for the widgets and layouts only reading the style constants.
+WINDOW_STYLES = {
+    '': 44,
+    'check_box': 11,
+    'combo_box': 2,
+    'group_box': 10,
+    'label': 18,
+    'line_edit': 17,
+    'list_widget': 1,
+    'menu_bar': 1,
+    'push_button': 21,
+    'scroll_area': 1,
+    'splitter': 2,
+    'tree_view': 1,
+    'tree_widget': 1
+}
+
+
+def build_styles_per_widget() -> None:
+    """Builds the window styles the way it was done before, a new style and icons listing per widget."""
+    for style_name, count in WINDOW_STYLES.items():
+        for _ in range(count):
+            maurice_widgets_style = MauriceWidgetsStyle.__new__(MauriceWidgetsStyle)
+            maurice_widgets_style.icons = maurice_utils.get_icons.__wrapped__()
+
+            if not style_name:
+                continue
+
+            style_function = MauriceWidgetsStyle.__dict__[style_name]
+
+            if isinstance(style_function, staticmethod):
+                style_function.__func__.__wrapped__()
+            else:
+                style_function.__wrapped__(maurice_widgets_style)
+
+
+def build_styles_shared() -> None:
+    """Builds the window styles with the shared style."""
+    for style_name, count in WINDOW_STYLES.items():
+        for _ in range(count):
+            maurice_widgets_style = MauriceWidgetsStyle.get_instance()
+
+            if style_name:
+                getattr(maurice_widgets_style, style_name)()
+
+
+def time_function(function: callable, repeat: int) -> float:
+    """Times the function, returning the best time."""
+    best_time = float('inf')
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    return best_time
+
+
+def main() -> None:
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmarks the widgets style of the window construction.')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported')
+    args = parser.parse_args()
+
+    # The first shared run builds the cache, as the first window of a session does.
+    first_shared_time = time_function(build_styles_shared, 1)
+
+    per_widget_time = time_function(build_styles_per_widget, args.repeat)
+    shared_time = time_function(build_styles_shared, args.repeat)
+
+    print(f'icons folder: {maurice_utils.get_icons_folder_path()}')
+    print(f'style per widget:     {per_widget_time * 1000:.3f}ms')
+    print(f'shared, first window: {first_shared_time * 1000:.3f}ms')
+    print(f'shared, next windows: {shared_time * 1000:.3f}ms')
+    print(f'speedup:              {per_widget_time / first_shared_time if first_shared_time else float("inf"):.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+========================================================================================================================
+Name: __init__.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+In-memory stand-in for maya.cmds and maya.api.OpenMaya, to run and benchmark core/ without Maya.
+
+Usage: import benchmarks.fake_maya as fake_maya
+       graph = fake_maya.install()  # Before importing maurice_texture_connector.core.
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import sys
+import os
+
+
+FAKE_MAYA_PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+def install() -> any:
+    """Puts the fake 'maya' package first in sys.path and returns its FakeDependencyGraph.
+
+    Raises a RuntimeError if the real Maya is already imported.
+    """
+    maya = sys.modules.get('maya')
+
+    if maya and not getattr(maya, 'IS_FAKE', False):
+        raise RuntimeError('The real Maya is already imported, the fake Maya can not be installed.')
+
+    if FAKE_MAYA_PATH not in sys.path:
+        sys.path.insert(0, FAKE_MAYA_PATH)
+
+    from maya.fake_dependency_graph import graph
+
+    return graph
@@ -0,0 +1,12 @@
+"""
+========================================================================================================================
+Name: __init__.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Fake 'maya' package, put first in sys.path by benchmarks.fake_maya.install().
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+IS_FAKE = True
@@ -0,0 +1,465 @@
+"""
+========================================================================================================================
+Name: OpenMaya.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Fake maya.api.OpenMaya: the classes of the Python API 2.0 used by the package, run on the in-memory fake dependency
+graph.
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from maya.fake_dependency_graph import FakeDependencyGraph
+from maya.fake_dependency_graph import DAG_TYPES
+from maya.fake_dependency_graph import FakeNode
+from maya.fake_dependency_graph import graph
+
+
+class MObject(object):
+    """Fake MObject, a reference to a node."""
+    kNullObj = None
+
+    def __init__(self, node: FakeNode = None) -> None:
+        """Initializes class attributes."""
+        self.node = node
+
+    def __eq__(self, other: any) -> bool:
+        """Checks if both objects reference the same node."""
+        return isinstance(other, MObject) and self.node is other.node
+
+    def __hash__(self) -> int:
+        """Gets the hash of the node."""
+        return id(self.node)
+
+    def hasFn(self, fn: int) -> bool:
+        """Checks if the node is compatible with a function set, only MFn.kDagNode is checked."""
+        return fn == MFn.kDagNode and self.node is not None and self.node.node_type in DAG_TYPES
+
+    def isNull(self) -> bool:
+        """Checks if the object does not reference a node."""
+        return self.node is None
+
+
+MObject.kNullObj = MObject()
+
+
+class MObjectHandle(object):
+    """Fake MObjectHandle."""
+
+    def __init__(self, obj: MObject) -> None:
+        """Initializes class attributes."""
+        self.obj = obj
+
+    def hashCode(self) -> int:
+        """Gets the hash code of the node."""
+        graph.count('MObjectHandle.hashCode')
+
+        return id(self.obj.node)
+
+    def isAlive(self) -> bool:
+        """Checks if the node still exists."""
+        return self.obj.node is not None and self.obj.node.alive
+
+    def isValid(self) -> bool:
+        """Checks if the node still exists."""
+        return self.isAlive()
+
+
+class MPlug(object):
+    """Fake MPlug, a (node, attribute) pair."""
+
+    def __init__(self, node: FakeNode = None, attr: str = '') -> None:
+        """Initializes class attributes."""
+        self.fake_node = node
+        self.attr = attr
+
+    def __eq__(self, other: any) -> bool:
+        """Checks if both plugs are the same attribute of the same node."""
+        return isinstance(other, MPlug) and self.fake_node is other.fake_node and self.attr == other.attr
+
+    def __hash__(self) -> int:
+        """Gets the hash of the plug."""
+        return hash((id(self.fake_node), self.attr))
+
+    def __repr__(self) -> str:
+        """Gets the representation of the plug."""
+        return f'MPlug({self.name()!r})'
+
+    @property
+    def isCompound(self) -> bool:
+        """Checks if the plug has children."""
+        return bool(FakeDependencyGraph.get_compound_children(self.attr))
+
+    @property
+    def isDestination(self) -> bool:
+        """Checks if the plug has an incoming connection."""
+        graph.count('MPlug.isDestination')
+
+        return (self.fake_node, self.attr) in graph.sources
+
+    @property
+    def isNull(self) -> bool:
+        """Checks if the plug does not reference an attribute."""
+        return self.fake_node is None
+
+    @property
+    def isSource(self) -> bool:
+        """Checks if the plug has outgoing connections."""
+        return (self.fake_node, self.attr) in graph.destinations
+
+    def asBool(self) -> bool:
+        """Gets the value of the plug as a boolean."""
+        return bool(graph.get_value(self.fake_node, self.attr))
+
+    def asDouble(self) -> float:
+        """Gets the value of the plug as a float."""
+        return float(graph.get_value(self.fake_node, self.attr))
+
+    def asInt(self) -> int:
+        """Gets the value of the plug as an integer."""
+        return int(graph.get_value(self.fake_node, self.attr))
+
+    def asString(self) -> str:
+        """Gets the value of the plug as a string."""
+        return str(graph.get_value(self.fake_node, self.attr))
+
+    def child(self, index: int) -> 'MPlug':
+        """Gets a child of the compound plug."""
+        return MPlug(self.fake_node, FakeDependencyGraph.get_compound_children(self.attr)[index])
+
+    def destinations(self) -> list:
+        """Gets the plugs connected from this plug."""
+        graph.count('MPlug.destinations')
+
+        return [MPlug(node, attr) for node, attr in graph.destinations.get((self.fake_node, self.attr), ())]
+
+    def elementByLogicalIndex(self, index: int) -> 'MPlug':
+        """Gets an element of the array plug."""
+        return MPlug(self.fake_node, f'{self.attr}[{index}]')
+
+    def getExistingArrayAttributeIndices(self) -> list:
+        """Gets the indices of the elements of the array plug with a value or a connection."""
+        graph.count('MPlug.getExistingArrayAttributeIndices')
+
+        return graph.get_array_indices(self.fake_node, self.attr)
+
+    def name(self) -> str:
+        """Gets the 'node.attr' name of the plug."""
+        return graph.get_plug_name(self.fake_node, self.attr) if self.fake_node else ''
+
+    def node(self) -> MObject:
+        """Gets the node of the plug."""
+        return MObject(self.fake_node)
+
+    def numChildren(self) -> int:
+        """Gets the number of children of the compound plug."""
+        return len(FakeDependencyGraph.get_compound_children(self.attr))
+
+    def partialName(self, *args, **kwargs) -> str:
+        """Gets the name of the attribute."""
+        return self.attr
+
+    def source(self) -> 'MPlug':
+        """Gets the plug connected to this plug, a null plug if there is none."""
+        graph.count('MPlug.source')
+
+        return MPlug(*graph.sources.get((self.fake_node, self.attr), (None, '')))
+
+
+class MArgList(object):
+    """Fake MArgList."""
+
+    def __init__(self, *args) -> None:
+        """Initializes class attributes."""
+        self.args = list(args)
+
+    def __len__(self) -> int:
+        """Gets the number of arguments."""
+        return len(self.args)
+
+
+class MDGMessage(object):
+    """Fake MDGMessage."""
+
+    @staticmethod
+    def addConnectionCallback(function: callable, client_data: any = None) -> int:
+        """Adds a callback called when a connection is made or broken."""
+        return graph.add_callback(
+            'connection',
+            lambda source, destination, made: function(MPlug(*source), MPlug(*destination), made, client_data))
+
+    @staticmethod
+    def addNodeAddedCallback(function: callable, node_type: str = 'dependNode', client_data: any = None) -> int:
+        """Adds a callback called when a node is added."""
+        return graph.add_callback('node_added', lambda node: function(MObject(node), client_data))
+
+    @staticmethod
+    def addNodeRemovedCallback(function: callable, node_type: str = 'dependNode', client_data: any = None) -> int:
+        """Adds a callback called when a node is removed."""
+        return graph.add_callback('node_removed', lambda node: function(MObject(node), client_data))
+
+
+class MDGModifier(object):
+    """Fake MDGModifier.
+
+    Queues the operations and runs them on doIt(), keeping their inverse to undo them.
+    """
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        self.operations = []
+        self.undo_operations = []
+
+    def connect(self, source_plug: MPlug, destination_plug: MPlug) -> 'MDGModifier':
+        """Queues a connection."""
+        graph.count('MDGModifier.connect')
+        self.operations.append(('connect', source_plug, destination_plug))
+
+        return self
+
+    def createNode(self, node_type: str) -> MObject:
+        """Queues the creation of a node and returns it."""
+        graph.count('MDGModifier.createNode')
+        node = FakeNode(node_type, '')
+        self.operations.append(('create', node))
+
+        return MObject(node)
+
+    def disconnect(self, source_plug: MPlug, destination_plug: MPlug) -> 'MDGModifier':
+        """Queues a disconnection."""
+        graph.count('MDGModifier.disconnect')
+        self.operations.append(('disconnect', source_plug, destination_plug))
+
+        return self
+
+    def doIt(self) -> None:
+        """Runs the queued operations."""
+        graph.count('MDGModifier.doIt')
+
+        for operation, *args in self.operations:
+            if operation == 'create':
+                graph.add_node(args[0])
+                self.undo_operations.append(('delete', args[0]))
+            elif operation == 'rename':
+                self.undo_operations.append(('rename', args[0], args[0].name))
+                graph.rename_node(args[0], args[1])
+            elif operation == 'connect':
+                graph.connect(args[0].fake_node, args[0].attr, args[1].fake_node, args[1].attr)
+                self.undo_operations.append(('disconnect', args[0], args[1]))
+            elif operation == 'disconnect':
+                graph.disconnect(args[0].fake_node, args[0].attr, args[1].fake_node, args[1].attr)
+                self.undo_operations.append(('connect', args[0], args[1]))
+            else:
+                node, attr = args[0].fake_node, args[0].attr
+                self.undo_operations.append(('value', args[0], node.values.get(attr)))
+                graph.set_value(node, attr, args[1])
+
+        self.operations = []
+
+    def newPlugValueBool(self, plug: MPlug, value: bool) -> 'MDGModifier':
+        """Queues a boolean value."""
+        return self.queue_plug_value(plug, bool(value))
+
+    def newPlugValueDouble(self, plug: MPlug, value: float) -> 'MDGModifier':
+        """Queues a float value."""
+        return self.queue_plug_value(plug, float(value))
+
+    def newPlugValueInt(self, plug: MPlug, value: int) -> 'MDGModifier':
+        """Queues an integer value."""
+        return self.queue_plug_value(plug, int(value))
+
+    def newPlugValueString(self, plug: MPlug, value: str) -> 'MDGModifier':
+        """Queues a string value."""
+        return self.queue_plug_value(plug, str(value))
+
+    def queue_plug_value(self, plug: MPlug, value: any) -> 'MDGModifier':
+        """Queues a value."""
+        graph.count('MDGModifier.newPlugValue')
+        self.operations.append(('value', plug, value))
+
+        return self
+
+    def renameNode(self, node: MObject, name: str) -> 'MDGModifier':
+        """Queues the renaming of a node."""
+        graph.count('MDGModifier.renameNode')
+        self.operations.append(('rename', node.node, name))
+
+        return self
+
+    def undoIt(self) -> None:
+        """Undoes the operations run."""
+        graph.count('MDGModifier.undoIt')
+
+        for operation, *args in reversed(self.undo_operations):
+            if operation == 'delete':
+                graph.delete_node(args[0])
+            elif operation == 'rename':
+                graph.rename_node(args[0], args[1])
+            elif operation == 'connect':
+                graph.connect(args[0].fake_node, args[0].attr, args[1].fake_node, args[1].attr)
+            elif operation == 'disconnect':
+                graph.disconnect(args[0].fake_node, args[0].attr, args[1].fake_node, args[1].attr)
+            elif args[1] is None:
+                args[0].fake_node.values.pop(args[0].attr, None)
+            else:
+                graph.set_value(args[0].fake_node, args[0].attr, args[1])
+
+        self.undo_operations = []
+
+
+class MFn(object):
+    """Fake MFn, the function set types."""
+    kDagNode = 107
+
+
+class MFnDagNode(object):
+    """Fake MFnDagNode, the nodes are all under the world."""
+
+    def __init__(self, obj: MObject = None) -> None:
+        """Initializes class attributes."""
+        self.obj = obj
+
+    def fullPathName(self) -> str:
+        """Gets the full DAG path of the node."""
+        return f'|{self.obj.node.name}'
+
+
+class MFnDependencyNode(object):
+    """Fake MFnDependencyNode."""
+
+    def __init__(self, obj: MObject = None) -> None:
+        """Initializes class attributes."""
+        self.obj = obj
+
+    @property
+    def typeName(self) -> str:
+        """Gets the type of the node."""
+        return self.obj.node.node_type
+
+    def findPlug(self, attr: str, want_networked_plug: bool = False) -> MPlug:
+        """Gets the plug of an attribute of the node."""
+        graph.count('MFnDependencyNode.findPlug')
+
+        return MPlug(self.obj.node, FakeDependencyGraph.get_attr_name(attr))
+
+    def getConnections(self) -> list:
+        """Gets the plugs of the node with a connection."""
+        graph.count('MFnDependencyNode.getConnections')
+
+        return [MPlug(self.obj.node, attr) for attr in sorted(self.obj.node.connected_attrs)]
+
+    def name(self) -> str:
+        """Gets the name of the node."""
+        return self.obj.node.name
+
+    def setObject(self, obj: MObject) -> 'MFnDependencyNode':
+        """Sets the node of the function set."""
+        self.obj = obj
+
+        return self
+
+
+class MFnPlugin(object):
+    """Fake MFnPlugin, registers the commands as functions of the fake maya.cmds."""
+
+    def __init__(self, obj: MObject = None, vendor: str = '', version: str = '', api_version: str = 'Any') -> None:
+        """Initializes class attributes."""
+        self.obj = obj
+
+    @staticmethod
+    def deregisterCommand(name: str) -> None:
+        """Deregisters a command."""
+        import maya.cmds as cmds
+
+        cmds.deregister_command(name)
+
+    @staticmethod
+    def registerCommand(name: str, creator: callable, syntax_creator: callable = None) -> None:
+        """Registers a command, each call creates the command and runs its doIt()."""
+        import maya.cmds as cmds
+
+        cmds.register_command(name, lambda *args, **kwargs: creator().doIt(MArgList(*args)))
+
+
+class MGlobal(object):
+    """Fake MGlobal, the messages are kept in the graph."""
+
+    @staticmethod
+    def displayError(message: str) -> None:
+        """Displays an error."""
+        graph.messages.append(('error', message))
+
+    @staticmethod
+    def displayInfo(message: str) -> None:
+        """Displays an information."""
+        graph.messages.append(('info', message))
+
+    @staticmethod
+    def displayWarning(message: str) -> None:
+        """Displays a warning."""
+        graph.messages.append(('warning', message))
+
+
+class MMessage(object):
+    """Fake MMessage."""
+
+    @staticmethod
+    def removeCallback(callback_id: int) -> None:
+        """Removes a callback."""
+        for callbacks in graph.callbacks.values():
+            callbacks.pop(callback_id, None)
+
+    @staticmethod
+    def removeCallbacks(callbacks_ids: list) -> None:
+        """Removes the callbacks."""
+        for callback_id in callbacks_ids:
+            MMessage.removeCallback(callback_id)
+
+
+class MNodeMessage(object):
+    """Fake MNodeMessage."""
+
+    @staticmethod
+    def addNameChangedCallback(obj: MObject, function: callable, client_data: any = None) -> int:
+        """Adds a callback called when the node, or any node if 'obj' is null, is renamed."""
+        def name_changed(node: FakeNode, previous_name: str) -> None:
+            if obj.isNull() or obj.node is node:
+                function(MObject(node), previous_name, client_data)
+
+        return graph.add_callback('name_changed', name_changed)
+
+
+class MPxCommand(object):
+    """Fake MPxCommand."""
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        pass
+
+
+class MSelectionList(object):
+    """Fake MSelectionList."""
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        self.nodes = []
+
+    def add(self, name: str) -> 'MSelectionList':
+        """Adds a node by its name, raises a RuntimeError if it does not exist."""
+        graph.count('MSelectionList.add')
+
+        try:
+            self.nodes.append(graph.get_node(name))
+        except ValueError:
+            raise RuntimeError(f'(kInvalidParameter): Object \'{name}\' does not exist.')
+
+        return self
+
+    def getDependNode(self, index: int) -> MObject:
+        """Gets a node of the list."""
+        return MObject(self.nodes[index])
+
+    def length(self) -> int:
+        """Gets the number of nodes of the list."""
+        return len(self.nodes)
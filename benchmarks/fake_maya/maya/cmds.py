@@ -0,0 +1,377 @@
+"""
+========================================================================================================================
+Name: cmds.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Fake maya.cmds: the commands used by the package, run on the in-memory fake dependency graph.
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from functools import wraps
+import importlib.util
+import tempfile
+import fnmatch
+import sys
+import os
+
+from maya.fake_dependency_graph import FakeDependencyGraph
+from maya.fake_dependency_graph import MATERIALS_TYPES
+from maya.fake_dependency_graph import DEFAULT_VALUES
+from maya.fake_dependency_graph import graph
+
+
+# Plugins that can be loaded by name.
+AVAILABLE_PLUGINS = {'lookdevKit', 'mtoa', 'redshift4maya', 'vrayformaya'}
+
+# Lists the nodes are added to by 'shadingNode' and 'sets -renderable': {flag: (list node, list attr)}.
+DEFAULT_LISTS = {
+    'asShader': ('defaultShaderList1', 'shaders'),
+    'asTexture': ('defaultTextureList1', 'textures'),
+    'asUtility': ('defaultRenderUtilityList1', 'utilities'),
+    'renderable': ('renderPartition', 'sets')
+}
+
+# Connections made by 'shadingNode -isColorManaged': (defaultColorMgtGlobals attribute, node attribute).
+COLOR_MANAGEMENT_CONNECTIONS = (('cme', 'cme'), ('cfe', 'cmcf'), ('cfp', 'cmcp'), ('wsn', 'ws'))
+
+
+def command(function: callable) -> callable:
+    """Counts the calls of the command."""
+    @wraps(function)
+    def wrapper(*args, **kwargs) -> any:
+        graph.count(function.__name__)
+
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def add_to_default_list(node: any, flag: str) -> None:
+    """Connects the node to the default list of its kind."""
+    list_node = graph.get_node(DEFAULT_LISTS[flag][0])
+    list_attr = DEFAULT_LISTS[flag][1]
+
+    graph.connect(node, 'message', list_node, f'{list_attr}[{graph.get_next_array_index(list_node, list_attr)}]')
+
+
+def deregister_command(name: str) -> None:
+    """Deregisters a plugin command."""
+    if hasattr(sys.modules[__name__], name):
+        delattr(sys.modules[__name__], name)
+
+
+def register_command(name: str, function: callable) -> None:
+    """Registers a plugin command as a function of this module."""
+    def plugin_command(*args, **kwargs) -> any:
+        graph.count(name)
+
+        return function(*args, **kwargs)
+
+    setattr(sys.modules[__name__], name, plugin_command)
+
+
+@command
+def about(batch: bool = False, version: bool = False, **kwargs) -> any:
+    """Gets information about the application, always in batch mode."""
+    if version:
+        return '2025'
+
+    return True
+
+
+@command
+def colorManagementFileRules(*args, **kwargs) -> str:
+    """Gets the color space of a file rule, the default one of the file nodes."""
+    return DEFAULT_VALUES['colorSpace']
+
+
+@command
+def connectAttr(source: str, destination: str, force: bool = False, nextAvailable: bool = False, **kwargs) -> None:
+    """Connects the source plug to the destination plug."""
+    destination_node, destination_attr = graph.get_plug(destination)
+
+    if nextAvailable:
+        destination_attr = f'{destination_attr}[{graph.get_next_array_index(destination_node, destination_attr)}]'
+
+    graph.connect(*graph.get_plug(source), destination_node, destination_attr, force=force)
+
+
+@command
+def createNode(node_type: str, name: str = '', **kwargs) -> str:
+    """Creates a node and returns its name."""
+    return graph.create_node(node_type, name).name
+
+
+@command
+def delete(*names, **kwargs) -> None:
+    """Deletes the nodes."""
+    for name in names if names else list(graph.selection):
+        for node_name in [name] if isinstance(name, str) else name:
+            graph.delete_node(graph.get_node(node_name))
+
+    graph.selection = [name for name in graph.selection if name in graph.nodes]
+
+
+@command
+def disconnectAttr(source: str, destination: str, **kwargs) -> None:
+    """Disconnects the source plug from the destination plug."""
+    graph.disconnect(*graph.get_plug(source), *graph.get_plug(destination))
+
+
+@command
+def file(*args, new: bool = False, rename: str = '', save: bool = False, query: bool = False,
+         sceneName: bool = False, **kwargs) -> any:
+    """Opens, renames, saves or queries the scene. Saving and importing do nothing."""
+    if query and sceneName:
+        return graph.scene_name
+    elif new:
+        graph.reset()
+    elif rename:
+        graph.scene_name = rename.replace('\\', '/')
+
+    return graph.scene_name
+
+
+@command
+def getAttr(plug_name: str, **kwargs) -> any:
+    """Gets the value of the plug, compound values are returned in a list as Maya does."""
+    value = graph.get_value(*graph.get_plug(plug_name))
+
+    return [value] if isinstance(value, tuple) else value
+
+
+@command
+def internalVar(userAppDir: bool = False, **kwargs) -> str:
+    """Gets the folder of the user preferences, a temporary folder."""
+    return tempfile.gettempdir().replace('\\', '/') + '/'
+
+
+@command
+def listConnections(name: str, source: bool = True, destination: bool = True, plugs: bool = False,
+                    type: str = '', **kwargs) -> list:
+    """Gets the nodes, or plugs, connected to the node or plug. Returns None if there are none, as Maya does."""
+    if '.' in name:
+        node, attr = graph.get_plug(name)
+        attrs = [attr]
+    else:
+        node = graph.get_node(name)
+        attrs = sorted(node.connected_attrs)
+
+    connections = []
+
+    for attr in attrs:
+        if source and (node, attr) in graph.sources:
+            connections.append(graph.sources[(node, attr)])
+
+        if destination:
+            connections.extend(sorted(graph.destinations.get((node, attr), ()), key=lambda plug: plug[0].name))
+
+    if type:
+        connections = [plug for plug in connections if plug[0].node_type == type]
+
+    if plugs:
+        result = [graph.get_plug_name(*plug) for plug in connections]
+    else:
+        result = list(dict.fromkeys(plug[0].name for plug in connections))
+
+    return result or None
+
+
+@command
+def listHistory(name: str, **kwargs) -> list:
+    """Gets the node and every node upstream of it."""
+    return [node.name for node in graph.get_upstream_nodes(graph.get_node(name.split('.', 1)[0]))]
+
+
+@command
+def loadPlugin(name: str, quiet: bool = False, **kwargs) -> list:
+    """Loads a plugin, by its name or by the path of a Python plugin whose 'initializePlugin' is run."""
+    from maya.api.OpenMaya import MObject
+
+    plugin_name = os.path.basename(name)
+
+    if plugin_name in graph.loaded_plugins:
+        return [plugin_name]
+
+    if os.path.isfile(name):
+        spec = importlib.util.spec_from_file_location(os.path.splitext(plugin_name)[0], name)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        module.initializePlugin(MObject())
+    elif plugin_name not in AVAILABLE_PLUGINS:
+        raise RuntimeError(f'Plug-in, "{name}", was not found on MAYA_PLUG_IN_PATH.')
+
+    graph.loaded_plugins.add(plugin_name)
+
+    return [plugin_name]
+
+
+@command
+def ls(*names, selection: bool = False, long: bool = False, type: str = '', materials: bool = False,
+       **kwargs) -> list:
+    """Lists the nodes, filtered by names, which can have wildcards, selection, type or material."""
+    if selection:
+        nodes_names = list(graph.selection)
+    elif names:
+        nodes_names = []
+
+        for name in names:
+            for pattern in [name] if isinstance(name, str) else name:
+                if any(character in pattern for character in '*?['):
+                    nodes_names.extend(fnmatch.filter(graph.nodes, pattern))
+                elif pattern.rsplit('|', 1)[-1] in graph.nodes:
+                    nodes_names.append(pattern.rsplit('|', 1)[-1])
+    else:
+        nodes_names = list(graph.nodes)
+
+    if type:
+        types = {type} if isinstance(type, str) else set(type)
+        nodes_names = [name for name in nodes_names if graph.nodes[name].node_type in types]
+
+    if materials:
+        nodes_names = [name for name in nodes_names if graph.nodes[name].node_type in MATERIALS_TYPES]
+
+    return list(dict.fromkeys(nodes_names))
+
+
+@command
+def nodeType(name: str, **kwargs) -> str:
+    """Gets the type of the node."""
+    return graph.get_node(name).node_type
+
+
+@command
+def objExists(name: str) -> bool:
+    """Checks if the node, or plug, exists."""
+    return bool(name) and name.split('.', 1)[0].rsplit('|', 1)[-1] in graph.nodes
+
+
+@command
+def objectType(name: str, isType: str = '', **kwargs) -> any:
+    """Gets the type of the node, or checks if it is of a type."""
+    node_type = graph.get_node(name).node_type
+
+    return node_type == isType if isType else node_type
+
+
+@command
+def pluginInfo(name: str = '', query: bool = False, loaded: bool = False, listPlugins: bool = False,
+               **kwargs) -> any:
+    """Queries the loaded plugins."""
+    if listPlugins:
+        return sorted(graph.loaded_plugins)
+
+    return os.path.basename(name) in graph.loaded_plugins
+
+
+@command
+def progressWindow(*args, query: bool = False, isCancelled: bool = False, **kwargs) -> any:
+    """Does nothing, the progress window is never cancelled."""
+    return False
+
+
+@command
+def rename(name: str, new_name: str, **kwargs) -> str:
+    """Renames the node and returns its new name."""
+    return graph.rename_node(graph.get_node(name), new_name)
+
+
+@command
+def scriptJob(*args, kill: int = 0, **kwargs) -> int:
+    """Does nothing, returns a script job id."""
+    return 0 if kill else next(graph.callbacks_ids)
+
+
+@command
+def select(*names, clear: bool = False, replace: bool = True, add: bool = False, **kwargs) -> None:
+    """Selects the nodes."""
+    nodes_names = [name for items in names for name in ([items] if isinstance(items, str) else items)]
+
+    for name in nodes_names:
+        graph.get_node(name)
+
+    if clear:
+        graph.selection = []
+    elif add:
+        graph.selection.extend(name for name in nodes_names if name not in graph.selection)
+    else:
+        graph.selection = nodes_names
+
+
+@command
+def sets(*objects, renderable: bool = False, noSurfaceShader: bool = False, empty: bool = False, name: str = '',
+         edit: bool = False, forceElement: str = '', **kwargs) -> any:
+    """Creates a set, a shading engine if it is renderable, or adds the objects to a set."""
+    if edit and forceElement:
+        shading_engine = graph.get_node(forceElement)
+        members = shading_engine.values.setdefault('dagSetMembers', [])
+
+        for items in objects:
+            members.extend([items] if isinstance(items, str) else items)
+
+        return None
+
+    node = graph.create_node('shadingEngine' if renderable else 'objectSet', name or 'set1')
+
+    if renderable:
+        add_to_default_list(node, 'renderable')
+
+    return node.name
+
+
+@command
+def setAttr(plug_name: str, *values, type: str = '', **kwargs) -> None:
+    """Sets the value of the plug, several values are set as a compound value."""
+    graph.set_value(*graph.get_plug(plug_name), values[0] if len(values) == 1 else tuple(values))
+
+
+@command
+def shadingNode(node_type: str, asShader: bool = False, asTexture: bool = False, asUtility: bool = False,
+                isColorManaged: bool = False, name: str = '', **kwargs) -> str:
+    """Creates a rendering node, adds it to its default list and returns its name."""
+    node = graph.create_node(node_type, name)
+
+    add_to_default_list(node, 'asShader' if asShader else 'asTexture' if asTexture else 'asUtility')
+
+    if isColorManaged:
+        color_management_node = graph.get_node('defaultColorMgtGlobals')
+
+        for source_attr, destination_attr in COLOR_MANAGEMENT_CONNECTIONS:
+            graph.connect(
+                color_management_node,
+                FakeDependencyGraph.get_attr_name(source_attr),
+                node,
+                FakeDependencyGraph.get_attr_name(destination_attr))
+
+    return node.name
+
+
+@command
+def undoInfo(state: bool = None, query: bool = False, openChunk: bool = False, closeChunk: bool = False,
+             **kwargs) -> any:
+    """Opens and closes the undo chunks, or enables the undo queue."""
+    if query:
+        return graph.undo_enabled
+    elif openChunk:
+        graph.undo_chunks += 1
+    elif closeChunk:
+        graph.undo_chunks -= 1
+    elif state is not None:
+        graph.undo_enabled = state
+
+    return None
+
+
+@command
+def workspace(path: str = '', query: bool = False, rootDirectory: bool = False, openWorkspace: bool = False,
+              fileRuleEntry: str = '', **kwargs) -> any:
+    """Queries or opens the project."""
+    if openWorkspace and path:
+        graph.workspace_path = path.replace('\\', '/').rstrip('/') + '/'
+    elif fileRuleEntry:
+        return 'sourceimages'
+
+    return graph.workspace_path
@@ -0,0 +1,407 @@
+"""
+========================================================================================================================
+Name: fake_dependency_graph.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+In-memory dependency graph behind the fake maya.cmds and maya.api.OpenMaya: nodes, attribute values and connections,
+with the call counts of every command.
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from collections import Counter
+import itertools
+import time
+import re
+
+
+# Short names of the attributes used by the package.
+ATTRIBUTES_ALIASES = {
+    'cs': 'colorSpace',
+    'ftn': 'fileTextureName',
+    'icsr': 'ignoreColorSpaceFileRules',
+    's': 'shaders',
+    'st': 'sets',
+    'tx': 'textures',
+    'u': 'utilities'
+}
+
+# (end of the attribute name, children suffixes) of the compound attributes.
+COMPOUND_SUFFIXES = (
+    ('Color', 'RGB'),
+    ('_color', 'RGB'),
+    ('color', 'RGB'),
+    ('opacity', 'RGB'),
+    ('opacityMap', 'RGB'),
+    ('input', 'RGB'),
+    ('Camera', 'XYZ'),
+    ('Normal', 'XYZ'),
+    ('UV', 'UV'),
+    ('uv', 'UV'),
+    ('scale', '012')
+)
+
+# Nodes of an empty scene: (name, type).
+DEFAULT_NODES = (
+    ('defaultColorMgtGlobals', 'colorManagementGlobals'),
+    ('defaultRenderGlobals', 'renderGlobals'),
+    ('defaultRenderUtilityList1', 'renderUtilityList'),
+    ('defaultShaderList1', 'shaderList'),
+    ('defaultTextureList1', 'textureList'),
+    ('initialShadingGroup', 'shadingEngine'),
+    ('lambert1', 'lambert'),
+    ('renderPartition', 'partition')
+)
+
+# Attributes values of the nodes not set yet.
+DEFAULT_VALUES = {
+    'colorSpace': 'sRGB',
+    'coverage': (1.0, 1.0),
+    'currentRenderer': 'arnold',
+    'fileTextureName': '',
+    'noiseUV': (0.0, 0.0),
+    'offset': (0.0, 0.0),
+    'repeatUV': (1.0, 1.0),
+    'translateFrame': (0.0, 0.0),
+    'wrapU': True,
+    'wrapV': True
+}
+
+# Types of the DAG nodes, the other nodes are DG nodes.
+DAG_TYPES = {
+    'mesh',
+    'place3dTexture',
+    'transform'
+}
+
+MATERIALS_TYPES = {
+    'aiStandardSurface',
+    'blinn',
+    'lambert',
+    'phong',
+    'RedshiftMaterial',
+    'RedshiftStandardMaterial',
+    'standardSurface',
+    'VRayMtl'
+}
+
+ARRAY_ELEMENT_PATTERN = re.compile(r'^(.+)\[(\d+)]$')
+TRAILING_DIGITS_PATTERN = re.compile(r'\d+$')
+
+
+class FakeNode(object):
+    """Fake node."""
+
+    def __init__(self, node_type: str, name: str) -> None:
+        """Initializes class attributes."""
+        self.node_type = node_type
+        self.name = name
+
+        # {attr: value}
+        self.values = {}
+
+        # Attributes with a connection.
+        self.connected_attrs = set()
+
+        # {array attr: next free index}
+        self.next_indices = {}
+
+        self.alive = False
+
+    def __repr__(self) -> str:
+        """Gets the representation of the node."""
+        return f'FakeNode({self.node_type!r}, {self.name!r})'
+
+
+class FakeDependencyGraph(object):
+    """Fake dependency graph.
+
+    Keeps the nodes, attribute values and connections of the scene in dictionaries, and counts the calls of every
+    command. A latency can be added to each call to model the cost of a Maya command.
+    """
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        self.calls = Counter()
+        self.call_latency = 0.0
+
+        # {event: {callback id: function}}
+        self.callbacks = {'connection': {}, 'node_added': {}, 'node_removed': {}, 'name_changed': {}}
+        self.callbacks_ids = itertools.count(1)
+
+        # (level, message) of MGlobal.
+        self.messages = []
+
+        self.loaded_plugins = set()
+        self.workspace_path = ''
+
+        self.nodes = {}
+
+        # {(destination node, destination attr): (source node, source attr)}
+        self.sources = {}
+
+        # {(source node, source attr): {(destination node, destination attr)}}
+        self.destinations = {}
+
+        self.scene_name = ''
+        self.selection = []
+        self.undo_enabled = True
+        self.undo_chunks = 0
+
+        self.reset()
+
+    @staticmethod
+    def get_compound_children(attr: str) -> tuple:
+        """Gets the children of a compound attribute, or an empty tuple if it is not one."""
+        for end, suffixes in COMPOUND_SUFFIXES:
+            if attr.endswith(end):
+                return tuple(f'{attr}{suffix}' for suffix in suffixes)
+
+        return ()
+
+    @staticmethod
+    def get_attr_name(attr: str) -> str:
+        """Gets the long name of the attribute, the last one of a compound path such as 'scale.scale0'."""
+        attr = attr.rsplit('.', 1)[-1]
+        match = ARRAY_ELEMENT_PATTERN.match(attr)
+
+        if match:
+            return f'{ATTRIBUTES_ALIASES.get(match.group(1), match.group(1))}[{match.group(2)}]'
+
+        return ATTRIBUTES_ALIASES.get(attr, attr)
+
+    def add_callback(self, event: str, function: callable) -> int:
+        """Adds a callback to an event and returns its id."""
+        callback_id = next(self.callbacks_ids)
+        self.callbacks[event][callback_id] = function
+
+        return callback_id
+
+    def add_node(self, node: FakeNode) -> FakeNode:
+        """Adds a node created outside the graph, by a DG modifier, giving it a unique name."""
+        node.name = self.get_unique_name(node.name or f'{node.node_type}1')
+        node.alive = True
+
+        self.nodes[node.name] = node
+
+        for function in list(self.callbacks['node_added'].values()):
+            function(node)
+
+        return node
+
+    def connect(self, source_node: FakeNode, source_attr: str, destination_node: FakeNode, destination_attr: str,
+                force: bool = False) -> None:
+        """Connects the source attribute to the destination attribute.
+
+        Raises a RuntimeError if the destination is already connected and 'force' is False.
+        """
+        destination = (destination_node, destination_attr)
+        source = (source_node, source_attr)
+        current_source = self.sources.get(destination)
+
+        if current_source == source:
+            if force:
+                return
+
+            raise RuntimeError(f'Connection not made: \'{self.get_plug_name(*source)}\' is already connected to '
+                               f'\'{self.get_plug_name(*destination)}\'.')
+        elif current_source:
+            if not force:
+                raise RuntimeError(f'Connection not made: \'{self.get_plug_name(*destination)}\' already has an '
+                                   f'incoming connection.')
+
+            self.disconnect(*current_source, *destination)
+
+        self.sources[destination] = source
+        self.destinations.setdefault(source, set()).add(destination)
+
+        source_node.connected_attrs.add(source_attr)
+        destination_node.connected_attrs.add(destination_attr)
+
+        match = ARRAY_ELEMENT_PATTERN.match(destination_attr)
+
+        if match and match.group(1) in destination_node.next_indices:
+            array_attr = match.group(1)
+            destination_node.next_indices[array_attr] = max(
+                destination_node.next_indices[array_attr],
+                int(match.group(2)) + 1)
+
+        for function in list(self.callbacks['connection'].values()):
+            function(source, destination, True)
+
+    def count(self, command: str) -> None:
+        """Counts a call of a command, waiting the call latency."""
+        self.calls[command] += 1
+
+        if self.call_latency:
+            end_time = time.perf_counter() + self.call_latency
+
+            while time.perf_counter() < end_time:
+                pass
+
+    def create_node(self, node_type: str, name: str = '') -> FakeNode:
+        """Creates a node."""
+        return self.add_node(FakeNode(node_type, name))
+
+    def delete_node(self, node: FakeNode) -> None:
+        """Deletes a node and its connections."""
+        for function in list(self.callbacks['node_removed'].values()):
+            function(node)
+
+        for attr in list(node.connected_attrs):
+            source = self.sources.get((node, attr))
+
+            if source:
+                self.disconnect(*source, node, attr)
+
+            for destination in list(self.destinations.get((node, attr), ())):
+                self.disconnect(node, attr, *destination)
+
+        node.alive = False
+        del self.nodes[node.name]
+
+    def disconnect(self, source_node: FakeNode, source_attr: str, destination_node: FakeNode,
+                   destination_attr: str) -> None:
+        """Disconnects the source attribute from the destination attribute."""
+        destination = (destination_node, destination_attr)
+        source = (source_node, source_attr)
+
+        if self.sources.get(destination) != source:
+            raise RuntimeError(f'\'{self.get_plug_name(*source)}\' is not connected to '
+                               f'\'{self.get_plug_name(*destination)}\'.')
+
+        del self.sources[destination]
+
+        destinations = self.destinations[source]
+        destinations.discard(destination)
+
+        if not destinations:
+            del self.destinations[source]
+            self.update_connected_attr(source_node, source_attr)
+
+        self.update_connected_attr(destination_node, destination_attr)
+
+        for function in list(self.callbacks['connection'].values()):
+            function(source, destination, False)
+
+    def get_array_indices(self, node: FakeNode, attr: str) -> list:
+        """Gets the indices of the elements of an array attribute with a value or a connection."""
+        indices = set()
+
+        for element_attr in itertools.chain(node.connected_attrs, node.values):
+            match = ARRAY_ELEMENT_PATTERN.match(element_attr)
+
+            if match and match.group(1) == attr:
+                indices.add(int(match.group(2)))
+
+        return sorted(indices)
+
+    def get_next_array_index(self, node: FakeNode, attr: str) -> int:
+        """Gets the next free index of an array attribute, as 'connectAttr -nextAvailable' does."""
+        if attr not in node.next_indices:
+            indices = self.get_array_indices(node, attr)
+            node.next_indices[attr] = indices[-1] + 1 if indices else 0
+
+        return node.next_indices[attr]
+
+    def get_node(self, name: str) -> FakeNode:
+        """Gets a node by its name, raises a ValueError if it does not exist."""
+        node = self.nodes.get(name.rsplit('|', 1)[-1])
+
+        if not node:
+            raise ValueError(f'No object matches name: {name}')
+
+        return node
+
+    def get_plug(self, plug_name: str) -> tuple:
+        """Gets the (node, attr) of a 'node.attr' plug name."""
+        node_name, attr = plug_name.split('.', 1)
+
+        return self.get_node(node_name), self.get_attr_name(attr)
+
+    @staticmethod
+    def get_plug_name(node: FakeNode, attr: str) -> str:
+        """Gets the 'node.attr' name of a plug."""
+        return f'{node.name}.{attr}'
+
+    def get_unique_name(self, name: str) -> str:
+        """Gets the name, or the name with the next free number if a node already has it."""
+        if name not in self.nodes:
+            return name
+
+        base_name = TRAILING_DIGITS_PATTERN.sub('', name)
+
+        for i in itertools.count(1):
+            if f'{base_name}{i}' not in self.nodes:
+                return f'{base_name}{i}'
+
+    def get_upstream_nodes(self, node: FakeNode) -> list:
+        """Gets the node and every node upstream of it, as 'listHistory' does."""
+        upstream_nodes = [node]
+        visited = {node}
+
+        for upstream_node in upstream_nodes:
+            for attr in sorted(upstream_node.connected_attrs):
+                source = self.sources.get((upstream_node, attr))
+
+                if source and source[0] not in visited:
+                    visited.add(source[0])
+                    upstream_nodes.append(source[0])
+
+        return upstream_nodes
+
+    def get_value(self, node: FakeNode, attr: str) -> any:
+        """Gets the value of the attribute, the one of its source if it is connected, else its value or default one."""
+        source = self.sources.get((node, attr))
+
+        if source:
+            return self.get_value(*source)
+
+        return node.values.get(attr, DEFAULT_VALUES.get(attr, 0))
+
+    def rename_node(self, node: FakeNode, name: str) -> str:
+        """Renames the node, returning its new unique name."""
+        previous_name = node.name
+
+        if name == previous_name:
+            return name
+
+        del self.nodes[previous_name]
+
+        node.name = self.get_unique_name(name)
+        self.nodes[node.name] = node
+
+        for function in list(self.callbacks['name_changed'].values()):
+            function(node, previous_name)
+
+        return node.name
+
+    def reset(self) -> None:
+        """Empties the scene, keeping the call counts, callbacks and plugins."""
+        for node in self.nodes.values():
+            node.alive = False
+
+        self.nodes = {}
+        self.sources = {}
+        self.destinations = {}
+
+        self.scene_name = ''
+        self.selection = []
+        self.undo_enabled = True
+        self.undo_chunks = 0
+
+        for name, node_type in DEFAULT_NODES:
+            self.create_node(node_type, name)
+
+    def set_value(self, node: FakeNode, attr: str, value: any) -> None:
+        """Sets the value of the attribute."""
+        node.values[attr] = value
+
+    def update_connected_attr(self, node: FakeNode, attr: str) -> None:
+        """Removes the attribute from the connected attributes of the node if it has no connection left."""
+        if (node, attr) not in self.sources and (node, attr) not in self.destinations:
+            node.connected_attrs.discard(attr)
+
+
+graph = FakeDependencyGraph()
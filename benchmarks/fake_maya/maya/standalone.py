@@ -0,0 +1,20 @@
+"""
+========================================================================================================================
+Name: standalone.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from maya.fake_dependency_graph import graph
+
+
+def initialize(name: str = 'python') -> None:
+    """Initializes the fake Maya with an empty scene."""
+    graph.reset()
+
+
+def uninitialize() -> None:
+    """Does nothing."""
+    pass
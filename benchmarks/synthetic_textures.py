@@ -0,0 +1,56 @@
+"""
+========================================================================================================================
+Name: synthetic_textures.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Synthetic texture folders for the benchmarks: empty files named like the exports of texturing applications.
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import os
+
+
+# Default suffixes of the Texture Connector presets.
+SUFFIXES = ('BaseColor', 'Roughness', 'Metallic', 'Normal', 'Height', 'Emissive', 'Opacity')
+
+# 'flat': one .png per channel, 'udim': ten .exr tiles per channel, 'mixed': images of several extensions with
+# non-image files and suffixes in other cases.
+LAYOUTS = ('flat', 'udim', 'mixed')
+
+MIXED_EXTENSIONS = ('.png', '.exr', '.tif', '.jpg', '.tx', '.txt', '.mb')
+
+UDIM_TILES = 10
+
+
+def create_texture_folder(path: str, files: int, layout: str) -> list:
+    """Creates a folder with about 'files' empty textures of the layout.
+
+    Returns the base color path of every texture set, the first tile for UDIMs.
+    """
+    os.makedirs(path, exist_ok=True)
+
+    files_per_texture_set = len(SUFFIXES) * (UDIM_TILES if layout == 'udim' else 1)
+    base_color_paths = []
+
+    for i in range(max(1, files // files_per_texture_set)):
+        base_name = f'asset{i:06d}'
+
+        for j, suffix in enumerate(SUFFIXES):
+            if layout == 'udim':
+                files_names = [f'{base_name}_{suffix}.{1001 + tile}.exr' for tile in range(UDIM_TILES)]
+            elif layout == 'mixed':
+                extension = MIXED_EXTENSIONS[(i + j) % len(MIXED_EXTENSIONS)]
+                files_names = [f'{base_name}_{suffix.lower() if i % 2 else suffix}{extension}']
+            else:
+                files_names = [f'{base_name}_{suffix}.png']
+
+            for file_name in files_names:
+                with open(os.path.join(path, file_name), 'wb'):
+                    pass
+
+            if j == 0:
+                base_color_paths.append(f'{path}/{files_names[0]}'.replace('\\', '/'))
+
+    return base_color_paths
@@ -7,12 +7,21 @@ Updated Date: 11-11-2024
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
-from maurice_texture_connector.utils import get_ppi
-
-
 AUTHOR = 'Mauricio Gonzalez Soto'
 VERSION = '1.1.4'
-PPI = get_ppi()
 
 TEXTURE_CONNECTOR_WINDOW_NAME = 'mauriceTextureConnector'
 TEXTURE_CONNECTOR = 'Texture Connector'
+
+
+def __getattr__(name: str) -> any:
+    """Gets the PPI the first time it is used, so importing the core and utils does not query the screen."""
+    if name == 'PPI':
+        from maurice_texture_connector.utils.maurice_screen import get_ppi
+
+        global PPI
+        PPI = get_ppi()
+
+        return PPI
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
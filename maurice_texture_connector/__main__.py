@@ -0,0 +1,18 @@
+"""
+========================================================================================================================
+Name: __main__.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Usage: mayapy -m maurice_texture_connector <command> --help
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import sys
+
+from maurice_texture_connector.cli import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,11 @@
+"""
+========================================================================================================================
+Name: __init__.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+# command_line.py
+from maurice_texture_connector.cli.command_line import main
@@ -0,0 +1,169 @@
+"""
+========================================================================================================================
+Name: audit_command.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Reports the textures of the file nodes of Maya ASCII scenes, as the Files tab does for the open scene, without Maya.
+
+Usage: python -m maurice_texture_connector audit SCENE_OR_FOLDER [...] [--output report.json|report.csv]
+       [--project PATH] [--jobs 8] [--problems-only]
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import time
+import json
+import csv
+import sys
+import os
+
+import maurice_texture_connector.utils as maurice_utils
+
+
+REPORT_FIELDS = ('scene', 'file_node', 'file_texture_name', 'path', 'status')
+
+STATUSES = ('check', 'warning', 'cross')
+
+
+def add_parser(subparsers: any) -> None:
+    """Adds the 'audit' command."""
+    parser = subparsers.add_parser(
+        'audit',
+        help='report the textures of Maya ASCII scenes without Maya',
+        description='Reports the file nodes textures of Maya ASCII scenes: check if they are in the project, warning '
+                    'if they are not, cross if they are missing.')
+    parser.add_argument('paths', nargs='+', help='.ma scenes, or folders searched recursively for them')
+    parser.add_argument('--output', default='', help='.json or .csv report, a summary is printed if not given')
+    parser.add_argument('--project', default='', help='Maya project, the one of every scene by default')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='processes reading the scenes')
+    parser.add_argument('--problems-only', action='store_true', help='report only the warning and cross textures')
+
+    parser.set_defaults(run=run)
+
+
+def audit_scene(scene_path: str, project_path: str = '') -> list:
+    """Audits the textures of a scene, returning a report row for each file node with a texture."""
+    project_path = project_path or maurice_utils.find_project_path(scene_path)
+    rows = []
+
+    for file_node, file_texture_name in maurice_utils.get_maya_ascii_file_textures(scene_path):
+        if not file_texture_name:
+            continue
+
+        path = os.path.expandvars(file_texture_name)
+
+        if not os.path.isabs(path) and project_path:
+            path = os.path.join(project_path, path)
+
+        path = path.replace('\\', '/')
+
+        rows.append({
+            'scene': scene_path,
+            'file_node': file_node,
+            'file_texture_name': file_texture_name,
+            'path': path,
+            'status': maurice_utils.get_texture_status(
+                file_path=path,
+                exists=texture_exists(path),
+                project_path=project_path)
+        })
+
+    return rows
+
+
+def get_scenes_paths(paths: list) -> list:
+    """Gets the Maya ASCII scenes of the paths, searching the folders recursively."""
+    scenes_paths = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, dir_names, file_names in os.walk(path):
+                dir_names.sort()
+
+                scenes_paths.extend(os.path.join(dir_path, file_name) for file_name in sorted(file_names)
+                                    if file_name.lower().endswith('.ma'))
+        elif path.lower().endswith('.ma'):
+            scenes_paths.append(path)
+        else:
+            sys.stderr.write(f'Skipped \'{path}\', only Maya ASCII scenes can be read.\n')
+
+    return scenes_paths
+
+
+def run(args: argparse.Namespace) -> int:
+    """Runs the 'audit' command."""
+    start_time = time.perf_counter()
+
+    scenes_paths = get_scenes_paths(args.paths)
+    rows = []
+    failed_scenes = 0
+
+    if args.jobs > 1 and len(scenes_paths) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [executor.submit(audit_scene, scene_path, args.project) for scene_path in scenes_paths]
+
+            for scene_path, future in zip(scenes_paths, futures):
+                try:
+                    rows.extend(future.result())
+                except (OSError, ValueError) as e:
+                    sys.stderr.write(f'Could not read \'{scene_path}\': {e}\n')
+                    failed_scenes += 1
+    else:
+        for scene_path in scenes_paths:
+            try:
+                rows.extend(audit_scene(scene_path, args.project))
+            except (OSError, ValueError) as e:
+                sys.stderr.write(f'Could not read \'{scene_path}\': {e}\n')
+                failed_scenes += 1
+
+    if args.problems_only:
+        rows = [row for row in rows if row['status'] != 'check']
+
+    summary = {status: 0 for status in STATUSES}
+
+    for row in rows:
+        summary[row['status']] += 1
+
+    if args.output:
+        write_report(path=args.output, rows=rows, summary=summary, scenes=len(scenes_paths))
+
+    total_time = time.perf_counter() - start_time
+
+    print(f'scenes:   {len(scenes_paths)}{f" ({failed_scenes} failed)" if failed_scenes else ""}')
+    print(f'textures: {len(rows)} ({", ".join(f"{summary[status]} {status}" for status in STATUSES)})')
+    print(f'time:     {total_time:.2f}s ({len(scenes_paths) / total_time if total_time else 0:.1f} scenes/s)')
+
+    if args.output:
+        print(f'report:   {args.output}')
+
+    return 1 if failed_scenes else 0
+
+
+def texture_exists(path: str) -> bool:
+    """Checks if the texture exists, or one of its files if it is named with a tile or frame token."""
+    file_name = os.path.basename(path)
+
+    if not maurice_utils.is_sequence_pattern(file_name):
+        return os.path.isfile(path)
+
+    sequence_key = maurice_utils.get_sequence_key(file_name)
+
+    return any(maurice_utils.get_sequence_key(folder_file_name) == sequence_key
+               for folder_file_name in maurice_utils.get_files_in_folder(os.path.dirname(path)))
+
+
+def write_report(path: str, rows: list, summary: dict, scenes: int) -> None:
+    """Writes the report, as CSV if the path ends with '.csv', as JSON otherwise."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    if path.lower().endswith('.csv'):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'scenes': scenes, 'summary': summary, 'textures': rows}, f, indent=4)
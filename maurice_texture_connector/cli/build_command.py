@@ -0,0 +1,332 @@
+"""
+========================================================================================================================
+Name: build_command.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Builds the material networks of every texture set of a texture root into a Maya scene, in mayapy.
+
+Usage: mayapy -m maurice_texture_connector build TEXTURE_ROOT --render-engine arnold --output materials.ma
+       [--preset NAME] [--config PATH] [--jobs 4] [--triplanar] [--dg-modifier] [--no-recursive]
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import subprocess
+import argparse
+import importlib
+import tempfile
+import shutil
+import heapq
+import time
+import json
+import sys
+import os
+
+import maurice_texture_connector as maurice
+
+
+# {render engine: (plugin name, CreateMaterialNetwork class module, class name)}
+RENDER_ENGINES = {
+    'arnold': ('mtoa', 'create_material_network_arnold', 'CreateMaterialNetworkArnold'),
+    'redshift': ('redshift4maya', 'create_material_network_redshift', 'CreateMaterialNetworkRedshift'),
+    'vray': ('vrayformaya', 'create_network_network_v_ray', 'CreateMaterialNetworkVRay')
+}
+
+SCENE_TYPES = {'.ma': 'mayaAscii', '.mb': 'mayaBinary'}
+
+
+def add_parser(subparsers: any) -> None:
+    """Adds the 'build' command."""
+    parser = subparsers.add_parser(
+        'build',
+        help='build the material networks of a texture root into a scene',
+        description='Builds a material network for every texture set of the texture root and saves them in a scene.')
+    parser.add_argument('texture_root', help='folder of the textures')
+    parser.add_argument('--render-engine', required=True, choices=sorted(RENDER_ENGINES))
+    parser.add_argument('--output', required=True, help='.ma or .mb scene to save')
+    parser.add_argument('--preset', default='', help='preset of the .ini file, its current preset by default')
+    parser.add_argument('--config', default='', help='.ini file, the Texture Connector one by default')
+    parser.add_argument('--jobs', type=int, default=1, help='mayapy processes building the texture sets')
+    parser.add_argument('--triplanar', action='store_true', help='use triplanar, also enabled by the .ini settings')
+    parser.add_argument('--dg-modifier', action='store_true', help='use the DG modifier backend')
+    parser.add_argument('--no-recursive', action='store_true', help='ignore the subfolders of the texture root')
+
+    # Set by the main process on its workers.
+    parser.add_argument('--folders-file', default='', help=argparse.SUPPRESS)
+    parser.add_argument('--stats-file', default='', help=argparse.SUPPRESS)
+
+    parser.set_defaults(run=run)
+
+
+def assign_shards(folders_weights: list, jobs: int) -> list:
+    """Splits the (folder, weight) pairs in balanced shards, the heaviest folders first."""
+    shards = [[] for _ in range(jobs)]
+    shards_weights = [(0, i) for i in range(jobs)]
+
+    for folder, weight in sorted(folders_weights, key=lambda folder_weight: -folder_weight[1]):
+        shard_weight, i = heapq.heappop(shards_weights)
+        shards[i].append(folder)
+
+        heapq.heappush(shards_weights, (shard_weight + weight, i))
+
+    return [shard for shard in shards if shard]
+
+
+def build(material_network: any, texture_root: str, folders_paths: list, use_triplanar: bool, output: str) -> dict:
+    """Builds the texture sets of the folders and saves the scene, returning the statistics."""
+    import maya.cmds as cmds
+
+    nodes_count = len(cmds.ls())
+
+    start_time = time.perf_counter()
+    materials = material_network.create_batch(
+        folder_path=texture_root,
+        recursive=True,
+        use_triplanar=use_triplanar,
+        folders_paths=folders_paths)
+    build_time = time.perf_counter() - start_time
+
+    stats = {
+        'folders': len(folders_paths),
+        'materials': len(materials),
+        'nodes': len(cmds.ls()) - nodes_count,
+        'build_time': build_time
+    }
+
+    start_time = time.perf_counter()
+    save_scene(output)
+    stats['save_time'] = time.perf_counter() - start_time
+
+    return stats
+
+
+def build_sharded(args: argparse.Namespace, material_network: any, folders_paths: list, preset_name: str,
+                  config_path: str) -> dict:
+    """Builds the folders in mayapy workers, each saving a shard scene, and imports the shards in the output."""
+    import maya.cmds as cmds
+
+    start_time = time.perf_counter()
+    folders_weights = [
+        (folder_path, len(material_network.get_folder_texture_sets(
+            folder_path=folder_path,
+            recursive=False,
+            folders_paths=[folder_path])))
+        for folder_path in folders_paths]
+    shards = assign_shards([folder_weight for folder_weight in folders_weights if folder_weight[1]], args.jobs)
+    scan_time = time.perf_counter() - start_time
+
+    extension = os.path.splitext(args.output)[1].lower()
+    temp_folder = tempfile.mkdtemp(prefix='maurice_texture_connector_build_')
+
+    try:
+        start_time = time.perf_counter()
+        workers = []
+
+        for i, shard in enumerate(shards):
+            shard_path = os.path.join(temp_folder, f'shard_{i}')
+
+            with open(f'{shard_path}.json', 'w') as f:
+                json.dump(shard, f)
+
+            command = [
+                sys.executable, '-m', 'maurice_texture_connector', 'build', args.texture_root,
+                '--render-engine', args.render_engine,
+                '--output', f'{shard_path}{extension}',
+                '--preset', preset_name,
+                '--config', config_path,
+                '--folders-file', f'{shard_path}.json',
+                '--stats-file', f'{shard_path}_stats.json']
+
+            if args.triplanar:
+                command.append('--triplanar')
+
+            if args.dg_modifier:
+                command.append('--dg-modifier')
+
+            log_file = open(f'{shard_path}.log', 'w')
+            workers.append((shard_path, log_file, subprocess.Popen(command, stdout=log_file, stderr=subprocess.STDOUT)))
+
+        stats = {'folders': 0, 'materials': 0, 'nodes': 0, 'scan_time': scan_time, 'jobs': len(shards)}
+        failed = False
+
+        for shard_path, log_file, worker in workers:
+            worker.wait()
+            log_file.close()
+
+            if worker.returncode or not os.path.isfile(f'{shard_path}_stats.json'):
+                with open(f'{shard_path}.log') as f:
+                    sys.stderr.write(f.read())
+
+                failed = True
+                continue
+
+            with open(f'{shard_path}_stats.json') as f:
+                shard_stats = json.load(f)
+
+            for key in ('folders', 'materials', 'nodes'):
+                stats[key] += shard_stats[key]
+
+        stats['build_time'] = time.perf_counter() - start_time
+
+        if failed:
+            return {}
+
+        start_time = time.perf_counter()
+
+        for shard_path, log_file, worker in workers:
+            cmds.file(f'{shard_path}{extension}', i=True, defaultNamespace=True, type=SCENE_TYPES[extension])
+
+        stats['merge_time'] = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        save_scene(args.output)
+        stats['save_time'] = time.perf_counter() - start_time
+    finally:
+        shutil.rmtree(temp_folder, ignore_errors=True)
+
+    return stats
+
+
+def get_material_network(render_engine: str, use_triplanar: bool) -> any:
+    """Loads the plugins of the render engine and gets its CreateMaterialNetwork, or None if they can not be loaded."""
+    from maya.api.OpenMaya import MGlobal
+    import maya.cmds as cmds
+
+    plugin_name, module_name, class_name = RENDER_ENGINES[render_engine]
+
+    for plugin in (plugin_name, 'lookdevKit') if use_triplanar else (plugin_name,):
+        try:
+            cmds.loadPlugin(plugin, quiet=True)
+        except RuntimeError:
+            MGlobal.displayError(f'[{maurice.TEXTURE_CONNECTOR}] \'{plugin}\' plugin could not be loaded.')
+            return None
+
+    module = importlib.import_module(f'maurice_texture_connector.core.{module_name}')
+
+    return getattr(module, class_name)()
+
+
+def print_stats(stats: dict, texture_root: str, output: str) -> None:
+    """Prints the statistics of the build."""
+    build_time = stats['build_time']
+    total_time = stats['total_time']
+
+    print(f'texture root: {texture_root}')
+    print(f'output:       {output}')
+    print(f'jobs:         {stats.get("jobs", 1)}')
+    print(f'folders:      {stats["folders"]}')
+    print(f'materials:    {stats["materials"]}')
+    print(f'nodes:        {stats["nodes"]}')
+
+    if 'scan_time' in stats:
+        print(f'scan:         {stats["scan_time"]:.2f}s')
+
+    print(f'build:        {build_time:.2f}s ({stats["materials"] / build_time if build_time else 0:.1f} materials/s, '
+          f'{stats["nodes"] / build_time if build_time else 0:.1f} nodes/s)')
+
+    if 'merge_time' in stats:
+        print(f'merge:        {stats["merge_time"]:.2f}s')
+
+    print(f'save:         {stats["save_time"]:.2f}s')
+    print(f'total:        {total_time:.2f}s ({stats["materials"] / total_time if total_time else 0:.1f} materials/s)')
+
+
+def run(args: argparse.Namespace) -> int:
+    """Runs the 'build' command."""
+    start_time = time.perf_counter()
+
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+
+    try:
+        return run_standalone(args, start_time)
+    finally:
+        maya.standalone.uninitialize()
+
+
+def run_standalone(args: argparse.Namespace, start_time: float) -> int:
+    """Runs the 'build' command once Maya is initialized."""
+    from maya.api.OpenMaya import MGlobal
+    import maya.cmds as cmds
+
+    from maurice_texture_connector.core.network_backend_open_maya import NetworkBackendOpenMaya
+    from maurice_texture_connector.core.material_network_preset import MaterialNetworkPreset
+    from maurice_texture_connector.core.network_backend_cmds import NetworkBackendCmds
+    import maurice_texture_connector.utils as maurice_utils
+
+    if os.path.splitext(args.output)[1].lower() not in SCENE_TYPES:
+        MGlobal.displayError(f'[{maurice.TEXTURE_CONNECTOR}] The output must be a .ma or .mb scene.')
+        return 1
+    elif not os.path.isdir(args.texture_root):
+        MGlobal.displayError(f'[{maurice.TEXTURE_CONNECTOR}] \'{args.texture_root}\' is not a folder.')
+        return 1
+
+    config_path = args.config or os.path.join(
+        maurice_utils.get_data_folder_path(),
+        f'{maurice.TEXTURE_CONNECTOR_WINDOW_NAME}.ini')
+    preset = MaterialNetworkPreset.load(config_path=config_path, preset_name=args.preset)
+
+    if not preset:
+        return 1
+
+    args.triplanar = args.triplanar or preset.use_triplanar
+    args.dg_modifier = args.dg_modifier or preset.use_dg_modifier
+
+    material_network = get_material_network(args.render_engine, args.triplanar)
+
+    if not material_network:
+        return 1
+
+    preset.set_material_network_settings(material_network)
+    material_network.set_backend(NetworkBackendOpenMaya() if args.dg_modifier else NetworkBackendCmds())
+
+    # Nothing built by the command line is undone.
+    cmds.undoInfo(state=False)
+
+    if args.folders_file:
+        with open(args.folders_file) as f:
+            folders_paths = json.load(f)
+    else:
+        folders_paths = material_network.get_folders_paths(
+            folder_path=args.texture_root,
+            recursive=not args.no_recursive)
+
+    if args.jobs > 1 and not args.folders_file:
+        stats = build_sharded(
+            args=args,
+            material_network=material_network,
+            folders_paths=folders_paths,
+            preset_name=preset.name,
+            config_path=config_path)
+
+        if not stats:
+            MGlobal.displayError(f'[{maurice.TEXTURE_CONNECTOR}] A build worker failed.')
+            return 1
+    else:
+        stats = build(
+            material_network=material_network,
+            texture_root=args.texture_root,
+            folders_paths=folders_paths,
+            use_triplanar=args.triplanar,
+            output=args.output)
+
+    stats['total_time'] = time.perf_counter() - start_time
+
+    if args.stats_file:
+        with open(args.stats_file, 'w') as f:
+            json.dump(stats, f)
+    else:
+        print_stats(stats=stats, texture_root=args.texture_root, output=args.output)
+
+    return 0
+
+
+def save_scene(path: str) -> None:
+    """Saves the scene."""
+    import maya.cmds as cmds
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    cmds.file(rename=path)
+    cmds.file(save=True, force=True, type=SCENE_TYPES[os.path.splitext(path)[1].lower()])
@@ -0,0 +1,33 @@
+"""
+========================================================================================================================
+Name: command_line.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import argparse
+
+import maurice_texture_connector.cli.audit_command as audit_command
+import maurice_texture_connector.cli.repath_command as repath_command
+import maurice_texture_connector.cli.build_command as build_command
+import maurice_texture_connector as maurice
+
+
+def main(args: list = None) -> int:
+    """Runs a command of the command line, returning its exit code."""
+    parser = argparse.ArgumentParser(
+        prog='maurice_texture_connector',
+        description=f'{maurice.TEXTURE_CONNECTOR} {maurice.VERSION} command line.')
+
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    audit_command.add_parser(subparsers)
+    build_command.add_parser(subparsers)
+    repath_command.add_parser(subparsers)
+
+    args = parser.parse_args(args)
+
+    return args.run(args)
@@ -0,0 +1,142 @@
+"""
+========================================================================================================================
+Name: repath_command.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Replaces the path prefixes of the file nodes textures of Maya ASCII scenes, as 'Repath Files' does for the open scene,
+without Maya.
+
+Usage: python -m maurice_texture_connector repath SCENE_OR_FOLDER [...] (--replace OLD NEW [...] | --rules rules.csv)
+       [--dry-run] [--ignore-case] [--jobs 8]
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import time
+import json
+import csv
+import sys
+import os
+
+import maurice_texture_connector.cli.audit_command as audit_command
+import maurice_texture_connector.utils as maurice_utils
+
+
+def add_parser(subparsers: any) -> None:
+    """Adds the 'repath' command."""
+    parser = subparsers.add_parser(
+        'repath',
+        help='replace the textures paths prefixes of Maya ASCII scenes without Maya',
+        description='Replaces the path prefixes of the file nodes textures of Maya ASCII scenes. Each scene is '
+                    'rewritten to a temporary file that replaces it only once complete. The first rule whose old '
+                    'prefix matches a texture is applied.')
+    parser.add_argument('paths', nargs='+', help='.ma scenes, or folders searched recursively for them')
+    parser.add_argument('--replace', nargs=2, action='append', default=[], metavar=('OLD', 'NEW'),
+                        help='prefix to replace, can be given several times')
+    parser.add_argument('--rules', default='', help='.csv (old,new rows) or .json ({old: new}) rules, after --replace')
+    parser.add_argument('--dry-run', action='store_true', help='print the changes as a diff without writing them')
+    parser.add_argument('--ignore-case', action='store_true', help='match the prefixes ignoring the case')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='processes rewriting the scenes')
+
+    parser.set_defaults(run=run)
+
+
+def get_diff(scene_path: str, textures_repaths: list) -> str:
+    """Gets the changes of a scene as a unified diff without context."""
+    diff = [f'--- {scene_path}\n', f'+++ {scene_path}\n']
+
+    for texture_repath in textures_repaths:
+        diff.append(f'@@ -{texture_repath.line_number} +{texture_repath.line_number} @@ {texture_repath.file_node}\n')
+        diff.append(f'-{texture_repath.old_line.rstrip()}\n')
+        diff.append(f'+{texture_repath.new_line.rstrip()}\n')
+
+    return ''.join(diff)
+
+
+def get_rules(replace: list, rules_path: str) -> list:
+    """Gets the (old prefix, new prefix) rules, the --replace ones first, then the ones of the rules file."""
+    rules = [tuple(rule) for rule in replace]
+
+    if not rules_path:
+        return rules
+
+    if rules_path.lower().endswith('.json'):
+        with open(rules_path, encoding='utf-8') as f:
+            json_rules = json.load(f)
+
+        rules.extend(json_rules.items() if isinstance(json_rules, dict) else (tuple(rule) for rule in json_rules))
+    else:
+        with open(rules_path, newline='', encoding='utf-8') as f:
+            for row in csv.reader(f):
+                if len(row) < 2 or not row[0] or row[0].startswith('#'):
+                    continue
+
+                rules.append((row[0], row[1]))
+
+    return rules
+
+
+def run(args: argparse.Namespace) -> int:
+    """Runs the 'repath' command."""
+    start_time = time.perf_counter()
+
+    try:
+        rules = get_rules(replace=args.replace, rules_path=args.rules)
+    except (OSError, ValueError, TypeError) as e:
+        sys.stderr.write(f'Could not read the rules \'{args.rules}\': {e}\n')
+        return 1
+
+    if not rules:
+        sys.stderr.write('No rules given, use --replace OLD NEW or --rules.\n')
+        return 1
+
+    scenes_paths = audit_command.get_scenes_paths(args.paths)
+    scenes_repaths = []
+    failed_scenes = 0
+
+    if args.jobs > 1 and len(scenes_paths) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [executor.submit(maurice_utils.repath_maya_ascii_scene, scene_path, rules, args.ignore_case,
+                                       args.dry_run) for scene_path in scenes_paths]
+
+            for scene_path, future in zip(scenes_paths, futures):
+                try:
+                    scenes_repaths.append((scene_path, future.result()))
+                except OSError as e:
+                    sys.stderr.write(f'Could not repath \'{scene_path}\': {e}\n')
+                    failed_scenes += 1
+    else:
+        for scene_path in scenes_paths:
+            try:
+                scenes_repaths.append((scene_path, maurice_utils.repath_maya_ascii_scene(
+                    scene_path=scene_path,
+                    rules=rules,
+                    ignore_case=args.ignore_case,
+                    dry_run=args.dry_run)))
+            except OSError as e:
+                sys.stderr.write(f'Could not repath \'{scene_path}\': {e}\n')
+                failed_scenes += 1
+
+    changed_scenes = 0
+    changed_textures = 0
+
+    for scene_path, textures_repaths in scenes_repaths:
+        if not textures_repaths:
+            continue
+
+        if args.dry_run:
+            sys.stdout.write(get_diff(scene_path, textures_repaths))
+
+        changed_scenes += 1
+        changed_textures += len(textures_repaths)
+
+    total_time = time.perf_counter() - start_time
+
+    print(f'scenes:   {len(scenes_paths)}{f" ({failed_scenes} failed)" if failed_scenes else ""}')
+    print(f'changed:  {changed_textures} textures in {changed_scenes} scenes{" (dry run)" if args.dry_run else ""}')
+    print(f'time:     {total_time:.2f}s ({len(scenes_paths) / total_time if total_time else 0:.1f} scenes/s)')
+
+    return 1 if failed_scenes else 0
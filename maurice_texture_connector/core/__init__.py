@@ -30,3 +30,35 @@ from maurice_texture_connector.core.edit_material_network_redshift import EditMa
 
 # edit_material_network_v_ray.py
 from maurice_texture_connector.core.edit_material_network_v_ray import EditMaterialNetworkVRay
+
+# file_node_index.py
+from maurice_texture_connector.core.file_node_index import FileNodeIndex
+
+# material_network_index.py
+from maurice_texture_connector.core.material_network_index import MaterialNetworkIndex
+
+# material_network_preset.py
+from maurice_texture_connector.core.material_network_preset import MaterialNetworkPreset
+
+# network_backend.py
+from maurice_texture_connector.core.network_backend import NetworkBackend
+
+# network_backend_cmds.py
+from maurice_texture_connector.core.network_backend_cmds import NetworkBackendCmds
+
+# network_backend_open_maya.py
+from maurice_texture_connector.core.network_backend_open_maya import NetworkBackendOpenMaya
+
+# network_plan.py
+from maurice_texture_connector.core.network_plan import NetworkPlan
+from maurice_texture_connector.core.network_plan import PlanNode
+
+# text_filter_index.py
+from maurice_texture_connector.core.text_filter_index import TextFilterIndex
+
+# texture_set_index.py
+from maurice_texture_connector.core.texture_set_index import TextureSetIndex
+
+# texture_memory_report.py
+from maurice_texture_connector.core.texture_memory_report import TextureMemoryReport
+from maurice_texture_connector.core.texture_memory_report import TextureMemory
@@ -2,7 +2,7 @@
 ========================================================================================================================
 Name: create_material_network.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 11-11-2024
+Updated Date: 11-12-2024
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
@@ -12,8 +12,13 @@ import maya.cmds as cmds
 
 from pathlib import Path
 import os
-import re
 
+from maurice_texture_connector.core.network_backend_cmds import NetworkBackendCmds
+from maurice_texture_connector.core.texture_set_index import TextureSetIndex
+from maurice_texture_connector.core.file_node_index import FileNodeIndex
+from maurice_texture_connector.core.network_backend import NetworkBackend
+from maurice_texture_connector.core.network_plan import NetworkPlan
+from maurice_texture_connector.core.network_plan import PlanNode
 import maurice_texture_connector.utils as maurice_utils
 import maurice_texture_connector as maurice
 
@@ -34,13 +39,63 @@ class CreateMaterialNetwork(object):
     TRIPLANAR_ALPHA_OUTPUT_NAME = None
     TRIPLANAR_COLOR_OUTPUT_NAME = None
 
+    # Channels whose textures are colors, the others are data textures.
+    COLOR_CHANNELS = (maurice_utils.BASE_COLOR, maurice_utils.EMISSIVE)
+    DATA_COLOR_SPACE = 'Raw'
+
+    # Channels whose file node is replaced by the value of the material input when their texture is constant.
+    CONSTANT_TEXTURES_CHANNELS = (maurice_utils.ROUGHNESS, maurice_utils.METALNESS, maurice_utils.OPACITY)
+
+    # Attributes holding the nodes of the material network.
+    NODES_ATTRIBUTES = (
+        'float_constant_node',
+        'material',
+        'place_2d_texture_node',
+        'shading_engine_node',
+        'base_color_file_node',
+        'base_color_triplanar_node',
+        'roughness_file_node',
+        'roughness_triplanar_node',
+        'metalness_file_node',
+        'metalness_triplanar_node',
+        'normal_file_node',
+        'normal_triplanar_node',
+        'height_displacement_shader_node',
+        'height_file_node',
+        'height_triplanar_node',
+        'emissive_file_node',
+        'emissive_triplanar_node',
+        'opacity_file_node',
+        'opacity_triplanar_node',
+        'packed_file_node',
+        'packed_triplanar_node'
+    )
+
+    PLANS_CACHE_SIZE = 256
+
+    # Plans already built: {plan key: (plan, {nodes attribute: plan node})}.
+    plans = {}
+
     def __init__(self) -> None:
         """Initializes class attributes."""
         self.file_digits_suffix = None
         self.file_stem = None
         self.name = None
+        self.case_sensitive = False
         self.use_triplanar = False
         self.use_multi_tiled = False
+        self.use_constant_textures = False
+        self.use_existing_file_nodes = False
+
+        # {channel: (r, g, b)} of the constant textures of the current texture set.
+        self.constant_textures = {}
+
+        # {channel: file node} of the file nodes of the scene loading the textures of the current texture set.
+        self.existing_file_nodes = {}
+
+        self.backend = NetworkBackendCmds()
+        self.file_node_index = FileNodeIndex()
+        self.plan = NetworkPlan()
 
         # Maya node class variables.
         self.float_constant_node = ''
@@ -98,6 +153,13 @@ class CreateMaterialNetwork(object):
         self.opacity_triplanar_node = ''
         self.is_opacity_enabled = False
 
+        # Packed class variables.
+        self.packed_file_node = ''
+        self.packed_file_paths = []
+        self.packed_suffix = ''
+        self.packed_triplanar_node = ''
+        self.is_packed_enabled = False
+
     @staticmethod
     def are_plugins_loaded(render_engine_plugin_name: str, use_triplanar: bool) -> bool:
         """Checks if the required plugins are loaded."""
@@ -112,6 +174,11 @@ class CreateMaterialNetwork(object):
         else:
             return True
 
+    def clear_nodes(self) -> None:
+        """Clears the nodes of the last material network created."""
+        for nodes_attribute in self.NODES_ATTRIBUTES:
+            setattr(self, nodes_attribute, '')
+
     def create(self, name: str, image_path: str, use_texture_base_name: bool, use_triplanar: bool) -> None:
         """Creates the material network."""
         self.name = name
@@ -130,72 +197,150 @@ class CreateMaterialNetwork(object):
                 MGlobal.displayError(f'[{maurice.TEXTURE_CONNECTOR}] Suffix not found.')
                 return
 
-        objects = cmds.ls(long=True, selection=True)
+        with maurice_utils.TimingSpan('create'):
+            objects = cmds.ls(long=True, selection=True)
+
+            cmds.undoInfo(chunkName='mgMaterialNetwork', openChunk=True)
 
-        cmds.undoInfo(chunkName='mgMaterialNetwork', openChunk=True)
+            with maurice_utils.TimingSpan('get_textures_paths'):
+                self.update_file_node_index()
+                self.get_textures_paths(image_path)
 
-        self.get_textures_paths(image_path)
-        self.create_material()
+            self.create_material_network()
 
-        if self.is_base_color_enabled and self.base_color_file_paths:
-            self.create_base_color_network()
+            cmds.select(clear=True)
+
+            if objects:
+                with maurice_utils.TimingSpan('assign'):
+                    cmds.sets(objects, edit=True, forceElement=self.shading_engine_node)
+
+            cmds.select(self.material, replace=True)
+
+            MGlobal.displayInfo(f'[{maurice.TEXTURE_CONNECTOR}] Created material network successfully.')
+
+            cmds.undoInfo(chunkName='mgMaterialNetwork', closeChunk=True)
+
+    @maurice_utils.timed()
+    def create_batch(self, folder_path: str, recursive: bool, use_triplanar: bool, folders_paths: list = None) -> list:
+        """Creates a material network for every texture set in the folder.
+
+        The plans of all the networks are merged and executed at once by the backend, inside a single undo chunk. The
+        progress window lets the user cancel the batch, keeping the materials already planned. 'folders_paths' replaces
+        the folders found in 'folder_path', to create a part of a batch.
+        """
+        self.use_triplanar = use_triplanar
 
-        if self.is_roughness_enabled and self.roughness_file_paths:
-            self.create_roughness_network()
+        texture_sets = self.get_folder_texture_sets(
+            folder_path=folder_path,
+            recursive=recursive,
+            folders_paths=folders_paths)
 
-        if self.is_metalness_enabled and self.metalness_file_paths:
-            self.create_metalness_network()
+        if not texture_sets:
+            MGlobal.displayWarning(f'[{maurice.TEXTURE_CONNECTOR}] No texture sets found in \'{folder_path}\'.')
+            return []
 
-        if self.is_normal_enabled and self.normal_file_paths:
-            self.create_normal_network()
+        self.update_file_node_index()
 
-        if self.is_height_enabled and self.height_file_paths:
-            self.create_height_network()
+        if self.use_constant_textures:
+            with maurice_utils.TimingSpan('analyze_constant_textures'):
+                maurice_utils.analyze_constant_textures([
+                    path for base_name, texture_set in texture_sets
+                    for path in self.get_constant_textures_paths(texture_set).values()])
 
-        if self.is_emissive_enabled and self.emissive_file_paths:
-            self.create_emissive_network()
+        batch_plan = NetworkPlan()
+        materials = []
+        offset = 0
+        texture_sets_count = len(texture_sets)
+        use_progress_window = not cmds.about(batch=True)
 
-        if self.is_opacity_enabled and self.opacity_file_paths:
-            self.create_opacity_network()
+        if use_progress_window:
+            cmds.progressWindow(
+                title=maurice.TEXTURE_CONNECTOR,
+                progress=0,
+                maxValue=texture_sets_count,
+                status='Creating material networks...',
+                isInterruptable=True)
 
-        cmds.select(clear=True)
+        cmds.undoInfo(chunkName='mgMaterialNetworks', openChunk=True)
 
-        if objects:
-            cmds.sets(objects, edit=True, forceElement=self.shading_engine_node)
+        try:
+            for i, (base_name, texture_set) in enumerate(texture_sets):
+                if use_progress_window and cmds.progressWindow(query=True, isCancelled=True):
+                    MGlobal.displayWarning(f'[{maurice.TEXTURE_CONNECTOR}] Batch cancelled by the user.')
+                    break
 
-        cmds.select(self.material, replace=True)
+                self.name = base_name
+                self.set_textures_paths(texture_set)
 
-        MGlobal.displayInfo(f'[{maurice.TEXTURE_CONNECTOR}] Created material network successfully.')
+                offset = batch_plan.extend(self.get_material_network_plan())
 
-        cmds.undoInfo(chunkName='mgMaterialNetwork', closeChunk=True)
+                materials.append(self.material.index + offset)
 
-    def create_standard_network(self, material_input_name: str, suffix: str, out_alpha: bool = False) -> tuple:
-        """Creates the standard network."""
+                if use_progress_window:
+                    cmds.progressWindow(
+                        edit=True,
+                        progress=i + 1,
+                        status=f'{base_name} ({i + 1}/{texture_sets_count})')
+
+            # Cancelled before the first texture set: the nodes are still the names of the last network created.
+            if not materials:
+                return []
+
+            with maurice_utils.TimingSpan('execute'):
+                nodes_names = self.backend.execute(batch_plan)
+
+            self.get_nodes_names(nodes_names, offset=offset)
+
+            materials = [nodes_names[material] for material in materials]
+        finally:
+            cmds.undoInfo(chunkName='mgMaterialNetworks', closeChunk=True)
+
+            if use_progress_window:
+                cmds.progressWindow(endProgress=True)
+
+        if materials:
+            cmds.select(materials, replace=True)
+
+        MGlobal.displayInfo(f'[{maurice.TEXTURE_CONNECTOR}] Created {len(materials)} material networks successfully.')
+
+        return materials
+
+    def create_standard_network(self, material_input_name: str, suffix: str, out_alpha: bool = False,
+                                component: str = '', nodes: tuple = None, channel: str = '') -> tuple:
+        """Creates the standard network.
+
+        'component' is the 'R', 'G' or 'B' component of the color connected to the material input, for the packed
+        textures. 'nodes' are the (file node, triplanar node) of a network already created to connect again, so the
+        channels of a packed texture share one file node. 'channel' is the one of the texture, to reuse its existing
+        file node.
+        """
         name = f'{self.name}_{suffix}'
 
-        file_node = self.create_file_node_network(name=name)
-        triplanar_node = ''
+        if nodes:
+            file_node, triplanar_node = nodes
+        else:
+            file_node = self.create_file_node_network(name=name, channel=channel)
+            triplanar_node = ''
+
+            if self.use_triplanar:
+                triplanar_node = self.create_triplanar_node_network(name=name)
+
+                self.plan.connect_attr(file_node, 'outColor', triplanar_node, self.TRIPLANAR_INPUT_NAME)
 
         if self.use_triplanar:
-            triplanar_node = self.create_triplanar_node_network(name=name)
-            out = self.TRIPLANAR_ALPHA_OUTPUT_NAME if out_alpha else self.TRIPLANAR_COLOR_OUTPUT_NAME
-
-            cmds.connectAttr(
-                f'{file_node}.outColor',
-                f'{triplanar_node}.{self.TRIPLANAR_INPUT_NAME}',
-                force=True)
-
-            cmds.connectAttr(
-                f'{triplanar_node}.{out}',
-                f'{self.material}.{material_input_name}',
-                force=True)
+            if component:
+                out = f'{self.TRIPLANAR_COLOR_OUTPUT_NAME}{component}'
+            else:
+                out = self.TRIPLANAR_ALPHA_OUTPUT_NAME if out_alpha else self.TRIPLANAR_COLOR_OUTPUT_NAME
+
+            self.plan.connect_attr(triplanar_node, out, self.material, material_input_name)
         else:
-            out = 'outAlpha' if out_alpha else 'outColor'
+            if component:
+                out = f'outColor{component}'
+            else:
+                out = 'outAlpha' if out_alpha else 'outColor'
 
-            cmds.connectAttr(
-                f'{file_node}.{out}',
-                f'{self.material}.{material_input_name}',
-                force=True)
+            self.plan.connect_attr(file_node, out, self.material, material_input_name)
 
         return file_node, triplanar_node
 
@@ -203,7 +348,8 @@ class CreateMaterialNetwork(object):
         """Create the base color network."""
         self.base_color_file_node, self.base_color_triplanar_node = self.create_standard_network(
             material_input_name=self.BASE_COLOR_MATERIAL_INPUT_NAME,
-            suffix=self.base_color_suffix)
+            suffix=self.base_color_suffix,
+            channel=maurice_utils.BASE_COLOR)
 
         if self.base_color_file_paths:
             self.set_color_texture_file_node_settings(
@@ -211,10 +357,10 @@ class CreateMaterialNetwork(object):
                 file_texture_name=self.base_color_file_paths[0],
                 use_multi_tiled=self.use_multi_tiled)
 
-    def create_bump_2d_node(self) -> str:
+    def create_bump_2d_node(self) -> PlanNode:
         """Creates the bump 2D node."""
-        bump_2d_node = cmds.shadingNode('bump2d', asUtility=True, name=f'{self.name}_bump2d')
-        cmds.setAttr(f'{bump_2d_node}.bumpInterp', 1)
+        bump_2d_node = self.plan.create_node('bump2d', name=f'{self.name}_bump2d', kind=NetworkBackend.UTILITY)
+        self.plan.set_attr(bump_2d_node, 'bumpInterp', 1)
 
         return bump_2d_node
 
@@ -222,7 +368,8 @@ class CreateMaterialNetwork(object):
         """Create the emissive network."""
         self.emissive_file_node, self.emissive_triplanar_node = self.create_standard_network(
             material_input_name=self.EMISSIVE_MATERIAL_INPUT_NAME,
-            suffix=self.emissive_suffix)
+            suffix=self.emissive_suffix,
+            channel=maurice_utils.EMISSIVE)
 
         if self.emissive_file_paths:
             self.set_color_texture_file_node_settings(
@@ -230,76 +377,82 @@ class CreateMaterialNetwork(object):
                 file_texture_name=self.emissive_file_paths[0],
                 use_multi_tiled=self.use_multi_tiled)
 
-    def create_file_node_network(self, name: str) -> str:
-        """Creates the file node network."""
-        if not cmds.objExists(self.place_2d_texture_node):
+    def create_file_node_network(self, name: str, channel: str = '') -> PlanNode:
+        """Creates the file node network, or references the existing file node of the texture of the channel."""
+        if channel in self.existing_file_nodes:
+            return self.plan.create_node('file', name=self.existing_file_nodes[channel], kind=NetworkBackend.EXISTING)
+
+        if not self.place_2d_texture_node:
             self.create_place_2d_texture_node()
 
-        file_node = cmds.shadingNode('file', asTexture=True, isColorManaged=True, name=f'{name}_file')
+        file_node = self.plan.create_node(
+            'file',
+            name=f'{name}_file',
+            kind=NetworkBackend.TEXTURE,
+            is_color_managed=True)
 
         attributes = (
-            '.coverage',
-            '.translateFrame',
-            '.rotateFrame',
-            '.mirrorU',
-            '.mirrorV',
-            '.stagger',
-            '.wrapU',
-            '.wrapV',
-            '.repeatUV',
-            '.offset',
-            '.rotateUV',
-            '.noiseUV',
-            '.vertexUvOne',
-            '.vertexUvTwo',
-            '.vertexUvThree',
-            '.vertexCameraOne'
+            'coverage',
+            'translateFrame',
+            'rotateFrame',
+            'mirrorU',
+            'mirrorV',
+            'stagger',
+            'wrapU',
+            'wrapV',
+            'repeatUV',
+            'offset',
+            'rotateUV',
+            'noiseUV',
+            'vertexUvOne',
+            'vertexUvTwo',
+            'vertexUvThree',
+            'vertexCameraOne'
         )
 
         for attr in attributes:
-            cmds.connectAttr(f'{self.place_2d_texture_node}{attr}', f'{file_node}{attr}', force=True)
+            self.plan.connect_attr(self.place_2d_texture_node, attr, file_node, attr)
 
-        cmds.connectAttr(f'{self.place_2d_texture_node}.outUvFilterSize', f'{file_node}.uvFilterSize')
-        cmds.connectAttr(f'{self.place_2d_texture_node}.outUV', f'{file_node}.uv')
+        self.plan.connect_attr(self.place_2d_texture_node, 'outUvFilterSize', file_node, 'uvFilterSize')
+        self.plan.connect_attr(self.place_2d_texture_node, 'outUV', file_node, 'uv')
 
         return file_node
 
     def create_float_constant_node(self) -> None:
         """Creates the float constant node."""
-        self.float_constant_node = cmds.shadingNode('floatConstant', asUtility=True, name=f'{self.name}_floatConstant')
+        self.float_constant_node = self.plan.create_node(
+            'floatConstant',
+            name=f'{self.name}_floatConstant',
+            kind=NetworkBackend.UTILITY)
 
     def create_height_network(self) -> None:
         """Creates the height network."""
         name = f'{self.name}_{self.height_suffix}'
 
-        self.height_displacement_shader_node = cmds.shadingNode(
+        self.height_displacement_shader_node = self.plan.create_node(
             'displacementShader',
-            asShader=True,
-            name=f'{name}_displacementShader')
+            name=f'{name}_displacementShader',
+            kind=NetworkBackend.SHADER)
 
-        self.height_file_node = self.create_file_node_network(name=name)
+        self.height_file_node = self.create_file_node_network(name=name, channel=maurice_utils.HEIGHT)
 
         if self.use_triplanar:
             self.height_triplanar_node = self.create_triplanar_node_network(name)
 
-            cmds.connectAttr(
-                f'{self.height_file_node}.outColor',
-                f'{self.height_triplanar_node}.{self.TRIPLANAR_INPUT_NAME}',
-                force=True)
-            cmds.connectAttr(
-                f'{self.height_triplanar_node}.{self.TRIPLANAR_ALPHA_OUTPUT_NAME}',
-                f'{self.height_displacement_shader_node}.displacement',
-                force=True)
+            self.plan.connect_attr(
+                self.height_file_node, 'outColor',
+                self.height_triplanar_node, self.TRIPLANAR_INPUT_NAME)
+            self.plan.connect_attr(
+                self.height_triplanar_node, self.TRIPLANAR_ALPHA_OUTPUT_NAME,
+                self.height_displacement_shader_node, 'displacement')
         else:
-            cmds.connectAttr(
-                f'{self.height_file_node}.outAlpha',
-                f'{self.height_displacement_shader_node}.displacement',
-                force=True)
+            self.plan.connect_attr(
+                self.height_file_node, 'outAlpha',
+                self.height_displacement_shader_node, 'displacement')
 
-        cmds.connectAttr(
-            f'{self.height_displacement_shader_node}.displacement',
-            f'{self.shading_engine_node}.displacementShader',
-            force=True)
+        self.plan.connect_attr(
+            self.height_displacement_shader_node, 'displacement',
+            self.shading_engine_node, 'displacementShader')
 
         if self.height_file_paths:
             self.set_data_texture_file_node_settings(
@@ -309,24 +462,60 @@ class CreateMaterialNetwork(object):
 
     def create_material(self):
         """Creates the material."""
-        self.material = cmds.shadingNode(
+        self.material = self.plan.create_node(
             self.MATERIAL_NODE,
-            asShader=True,
-            name=f'{self.name}_{self.MATERIAL_NODE}')
+            name=f'{self.name}_{self.MATERIAL_NODE}',
+            kind=NetworkBackend.SHADER)
+
+        self.shading_engine_node = self.plan.create_node(
+            'shadingEngine',
+            name=f'{self.name}SG',
+            kind=NetworkBackend.SHADING_ENGINE)
+
+        self.plan.connect_attr(self.material, 'outColor', self.shading_engine_node, 'surfaceShader')
+
+    def create_material_network(self) -> None:
+        """Creates the material and the network of every enabled channel found, executing its plan with the backend."""
+        plan = self.get_material_network_plan()
 
-        self.shading_engine_node = cmds.sets(renderable=True, noSurfaceShader=True, empty=True, name=f'{self.name}SG')
+        with maurice_utils.TimingSpan('execute'):
+            nodes_names = self.backend.execute(plan)
 
-        cmds.connectAttr(
-            f'{self.material}.outColor',
-            f'{self.shading_engine_node}.surfaceShader',
-            force=True)
+        self.get_nodes_names(nodes_names)
+
+    def create_material_network_nodes(self) -> None:
+        """Plans the nodes of the material and the network of every enabled channel found."""
+        with maurice_utils.TimingSpan('create_material'):
+            self.create_material()
+
+        packed_channels = self.get_packed_channels()
+
+        for channel, is_enabled, file_paths, create_network in (
+                ('base_color', self.is_base_color_enabled, self.base_color_file_paths, self.create_base_color_network),
+                ('packed', bool(packed_channels), self.packed_file_paths, self.create_packed_network),
+                ('roughness', self.is_roughness_enabled, self.roughness_file_paths, self.create_roughness_network),
+                ('metalness', self.is_metalness_enabled, self.metalness_file_paths, self.create_metalness_network),
+                ('normal', self.is_normal_enabled, self.normal_file_paths, self.create_normal_network),
+                ('height', self.is_height_enabled, self.height_file_paths, self.create_height_network),
+                ('emissive', self.is_emissive_enabled, self.emissive_file_paths, self.create_emissive_network),
+                ('opacity', self.is_opacity_enabled, self.opacity_file_paths, self.create_opacity_network)):
+            if is_enabled and file_paths and channel not in packed_channels:
+                with maurice_utils.TimingSpan(f'create_{channel}_network'):
+                    create_network()
 
     def create_metalness_network(self) -> None:
-        """Creates the metalness network."""
+        """Creates the metalness network, or sets the metalness of the material if its texture is constant."""
+        if maurice_utils.METALNESS in self.constant_textures:
+            self.set_constant_texture_input(
+                material_input_name=self.METALNESS_MATERIAL_INPUT_NAME,
+                channel=maurice_utils.METALNESS)
+            return
+
         self.metalness_file_node, self.metalness_triplanar_node = self.create_standard_network(
             material_input_name=self.METALNESS_MATERIAL_INPUT_NAME,
             out_alpha=True,
-            suffix=self.metalness_suffix)
+            suffix=self.metalness_suffix,
+            channel=maurice_utils.METALNESS)
 
         if self.metalness_file_paths:
             self.set_data_texture_file_node_settings(
@@ -339,39 +528,35 @@ class CreateMaterialNetwork(object):
         name = f'{self.name}_{self.normal_suffix}'
         bump_2d_node = ''
 
-        self.normal_file_node = self.create_file_node_network(name=name)
+        self.normal_file_node = self.create_file_node_network(name=name, channel=maurice_utils.NORMAL)
 
         if self.USE_BUMP_2D_NODE:
             bump_2d_node = self.create_bump_2d_node()
 
-            cmds.connectAttr(f'{self.normal_file_node}.outColorR',
-                             f'{bump_2d_node}.bumpValue',
-                             force=True)
+            self.plan.connect_attr(self.normal_file_node, 'outColorR', bump_2d_node, 'bumpValue')
 
         if self.use_triplanar:
             self.normal_triplanar_node = self.create_triplanar_node_network(name=name)
 
             if self.USE_BUMP_2D_NODE:
-                cmds.connectAttr(f'{bump_2d_node}.outNormal',
-                                 f'{self.normal_triplanar_node}.{self.TRIPLANAR_INPUT_NAME}',
-                                 force=True)
+                self.plan.connect_attr(
+                    bump_2d_node, 'outNormal',
+                    self.normal_triplanar_node, self.TRIPLANAR_INPUT_NAME)
             else:
-                cmds.connectAttr(f'{self.normal_file_node}.outColor',
-                                 f'{self.normal_triplanar_node}.{self.TRIPLANAR_INPUT_NAME}',
-                                 force=True)
+                self.plan.connect_attr(
+                    self.normal_file_node, 'outColor',
+                    self.normal_triplanar_node, self.TRIPLANAR_INPUT_NAME)
 
-            cmds.connectAttr(f'{self.normal_triplanar_node}.outColor',
-                             f'{self.material}.{self.NORMAL_MATERIAL_INPUT_NAME}',
-                             force=True)
+            self.plan.connect_attr(
+                self.normal_triplanar_node, 'outColor',
+                self.material, self.NORMAL_MATERIAL_INPUT_NAME)
         else:
             if self.USE_BUMP_2D_NODE:
-                cmds.connectAttr(f'{bump_2d_node}.outNormal',
-                                 f'{self.material}.{self.NORMAL_MATERIAL_INPUT_NAME}',
-                                 force=True)
+                self.plan.connect_attr(bump_2d_node, 'outNormal', self.material, self.NORMAL_MATERIAL_INPUT_NAME)
             else:
-                cmds.connectAttr(f'{self.normal_file_node}.outColor',
-                                 f'{self.material}.{self.NORMAL_MATERIAL_INPUT_NAME}',
-                                 force=True)
+                self.plan.connect_attr(
+                    self.normal_file_node, 'outColor',
+                    self.material, self.NORMAL_MATERIAL_INPUT_NAME)
 
         if self.normal_file_paths:
             self.set_data_texture_file_node_settings(
@@ -381,16 +566,24 @@ class CreateMaterialNetwork(object):
 
     def create_place_2d_texture_node(self) -> None:
         """Creates the place 2D texture node."""
-        self.place_2d_texture_node = cmds.shadingNode(
+        self.place_2d_texture_node = self.plan.create_node(
             'place2dTexture',
-            asUtility=True,
-            name=f'{self.name}_place2dTexture')
+            name=f'{self.name}_place2dTexture',
+            kind=NetworkBackend.UTILITY)
 
     def create_opacity_network(self) -> None:
-        """Creates the opacity network."""
+        """Creates the opacity network, or sets the opacity of the material if its texture is constant."""
+        if maurice_utils.OPACITY in self.constant_textures:
+            self.set_constant_texture_input(
+                material_input_name=self.OPACITY_MATERIAL_INPUT_NAME,
+                channel=maurice_utils.OPACITY,
+                is_color=True)
+            return
+
         self.opacity_file_node, self.opacity_triplanar_node = self.create_standard_network(
             material_input_name=self.OPACITY_MATERIAL_INPUT_NAME,
-            suffix=self.opacity_suffix)
+            suffix=self.opacity_suffix,
+            channel=maurice_utils.OPACITY)
 
         if self.opacity_file_paths:
             self.set_data_texture_file_node_settings(
@@ -398,12 +591,44 @@ class CreateMaterialNetwork(object):
                 file_texture_name=self.opacity_file_paths[0],
                 use_multi_tiled=self.use_multi_tiled)
 
+    def create_packed_network(self) -> None:
+        """Creates the packed network, one file node whose components are connected to the roughness and metalness.
+
+        The roughness and metalness file nodes are the packed one, their own textures are not used.
+        """
+        nodes = None
+
+        for channel, component in self.get_packed_channels().items():
+            nodes = self.create_standard_network(
+                material_input_name=getattr(self, f'{channel.upper()}_MATERIAL_INPUT_NAME'),
+                suffix=self.packed_suffix,
+                component=component,
+                nodes=nodes,
+                channel=maurice_utils.PACKED)
+
+            setattr(self, f'{channel}_file_node', nodes[0])
+            setattr(self, f'{channel}_triplanar_node', nodes[1])
+
+        self.packed_file_node, self.packed_triplanar_node = nodes
+
+        self.set_data_texture_file_node_settings(
+            file_node=self.packed_file_node,
+            file_texture_name=self.packed_file_paths[0],
+            use_multi_tiled=self.use_multi_tiled)
+
     def create_roughness_network(self) -> None:
-        """Creates the roughness network."""
+        """Creates the roughness network, or sets the roughness of the material if its texture is constant."""
+        if maurice_utils.ROUGHNESS in self.constant_textures:
+            self.set_constant_texture_input(
+                material_input_name=self.ROUGHNESS_MATERIAL_INPUT_NAME,
+                channel=maurice_utils.ROUGHNESS)
+            return
+
         self.roughness_file_node, self.roughness_triplanar_node = self.create_standard_network(
             material_input_name=self.ROUGHNESS_MATERIAL_INPUT_NAME,
             out_alpha=True,
-            suffix=self.roughness_suffix)
+            suffix=self.roughness_suffix,
+            channel=maurice_utils.ROUGHNESS)
 
         if self.roughness_file_paths:
             self.set_data_texture_file_node_settings(
@@ -411,99 +636,233 @@ class CreateMaterialNetwork(object):
                 file_texture_name=self.roughness_file_paths[0],
                 use_multi_tiled=self.use_multi_tiled)
 
-    def create_triplanar_node_network(self, name: str) -> any:
+    def create_triplanar_node_network(self, name: str) -> PlanNode:
         """Creates the triplanar node network."""
-        if not cmds.objExists(self.float_constant_node):
+        if not self.float_constant_node:
             self.create_float_constant_node()
 
-    @staticmethod
-    def extract_pattern_match(file_stem: str, pattern_suffix: str) -> list:
-        """Extracts the patter match."""
-        pattern = re.compile(f'_{pattern_suffix}(_|$)', re.IGNORECASE)
-        pattern_split = pattern.split(file_stem, 1)
-
-        return pattern_split
-
     def get_material(self):
         """Gets the material."""
         return self.material
 
+    def get_channels_suffixes(self) -> tuple:
+        """Gets the (channel, suffix) pairs used to match the textures."""
+        channels_suffixes = (
+            (maurice_utils.BASE_COLOR, self.base_color_suffix),
+            (maurice_utils.ROUGHNESS, self.roughness_suffix),
+            (maurice_utils.METALNESS, self.metalness_suffix),
+            (maurice_utils.NORMAL, self.normal_suffix),
+            (maurice_utils.HEIGHT, self.height_suffix),
+            (maurice_utils.EMISSIVE, self.emissive_suffix),
+            (maurice_utils.OPACITY, self.opacity_suffix),
+            (maurice_utils.PACKED, self.packed_suffix)
+        )
+
+        return channels_suffixes
+
+    def get_constant_textures(self, texture_set: dict) -> dict:
+        """Gets the {channel: (r, g, b)} of the constant textures of the texture set, if they are used.
+
+        The textures are analyzed once and cached by maurice_utils.analyze_constant_textures, 'create_batch' analyzes
+        all the textures of the batch at once in a process pool.
+        """
+        if not self.use_constant_textures or self.use_multi_tiled:
+            return {}
+
+        paths = self.get_constant_textures_paths(texture_set)
+        values = maurice_utils.analyze_constant_textures(list(paths.values()), max_workers=1)
+
+        return {channel: values[path] for channel, path in paths.items() if values.get(path)}
+
+    def get_constant_textures_paths(self, texture_set: dict) -> dict:
+        """Gets the {channel: path} of the textures of the texture set which can be replaced by a constant value.
+
+        Only the enabled channels of CONSTANT_TEXTURES_CHANNELS with a single image, which is not a UDIM or sequence,
+        can be.
+        """
+        if texture_set.get(TextureSetIndex.UDIM_TILES):
+            return {}
+
+        paths = {}
+
+        for channel in self.CONSTANT_TEXTURES_CHANNELS:
+            file_paths = texture_set.get(channel, [])
+
+            if (getattr(self, f'is_{channel}_enabled') and len(file_paths) == 1
+                    and not maurice_utils.is_sequence_pattern(os.path.basename(file_paths[0]))):
+                paths[channel] = file_paths[0]
+
+        return paths
+
     def get_texture_base_name(self, file_path: str) -> str:
         """Gets the texture base name."""
         self.get_multi_tiled_mode(file_path)
 
-        suffixes = (
-            self.base_color_suffix,
-            self.roughness_suffix,
-            self.metalness_suffix,
-            self.normal_suffix,
-            self.height_suffix,
-            self.emissive_suffix,
-            self.opacity_suffix
+        channel, base_name = maurice_utils.match_texture_channel(
+            file_stem=self.file_stem,
+            channels_suffixes=self.get_channels_suffixes(),
+            case_sensitive=self.case_sensitive)
+
+        return base_name
+
+    def get_existing_file_nodes(self) -> dict:
+        """Gets the {channel: file node} of the file nodes of the scene that can be reused for the current textures.
+
+        A file node is reused if it loads the same texture with the color space, UV tiling mode, alpha is luminance and
+        UV placement a new one would have. The file rules are ignored by the new file nodes, so a color texture keeps
+        the color space of the default rule.
+        """
+        if not self.use_existing_file_nodes:
+            return {}
+
+        color_space = cmds.colorManagementFileRules('Default', colorSpace=True, query=True)
+        uv_tiling_mode = 3 if self.use_multi_tiled else 0
+        existing_file_nodes = {}
+
+        for channel in maurice_utils.CHANNELS:
+            file_paths = getattr(self, f'{channel}_file_paths')
+
+            if not getattr(self, f'is_{channel}_enabled') or not file_paths:
+                continue
+
+            is_color = channel in self.COLOR_CHANNELS
+            file_node = self.file_node_index.get_file_node(
+                file_texture_name=file_paths[0],
+                color_space=color_space if is_color else self.DATA_COLOR_SPACE,
+                uv_tiling_mode=uv_tiling_mode,
+                alpha_is_luminance=not is_color)
+
+            if file_node:
+                existing_file_nodes[channel] = file_node
+
+        return existing_file_nodes
+
+    def get_folder_texture_sets(self, folder_path: str, recursive: bool, folders_paths: list = None) -> list:
+        """Gets the (base name, texture set) pairs of the folder that have at least one enabled channel."""
+        channels_enabled = (
+            (maurice_utils.BASE_COLOR, self.is_base_color_enabled),
+            (maurice_utils.ROUGHNESS, self.is_roughness_enabled),
+            (maurice_utils.METALNESS, self.is_metalness_enabled),
+            (maurice_utils.NORMAL, self.is_normal_enabled),
+            (maurice_utils.HEIGHT, self.is_height_enabled),
+            (maurice_utils.EMISSIVE, self.is_emissive_enabled),
+            (maurice_utils.OPACITY, self.is_opacity_enabled),
+            (maurice_utils.PACKED, self.is_packed_enabled)
         )
 
-        for suffix in suffixes:
-            pattern_split = self.extract_pattern_match(self.file_stem, suffix)
+        if folders_paths is None:
+            folders_paths = self.get_folders_paths(folder_path=folder_path, recursive=recursive)
 
-            if len(pattern_split) > 1:
-                base_name = pattern_split[0]
+        channels_suffixes = self.get_channels_suffixes()
+        texture_sets = []
 
-                return base_name
+        for path in folders_paths:
+            texture_set_index = TextureSetIndex.get_index(path)
+            folder_texture_sets = texture_set_index.get_texture_sets(
+                channels_suffixes=channels_suffixes,
+                case_sensitive=self.case_sensitive)
 
-        return ''
+            for base_name in sorted(folder_texture_sets):
+                texture_set = folder_texture_sets[base_name]
 
-    def get_textures_paths(self, texture_path: str) -> None:
-        """Gets the textures paths."""
-        self.base_color_file_paths.clear()
-        self.roughness_file_paths.clear()
-        self.metalness_file_paths.clear()
-        self.normal_file_paths.clear()
-        self.height_file_paths.clear()
-        self.emissive_file_paths.clear()
-        self.opacity_file_paths.clear()
+                if any(enabled and texture_set.get(channel) for channel, enabled in channels_enabled):
+                    texture_sets.append((base_name, texture_set))
 
-        texture_folder = os.path.dirname(texture_path)
-        texture_base_name = self.get_texture_base_name(texture_path)
-        files_in_folder = maurice_utils.get_files_in_folder(texture_folder)
+        return texture_sets
+
+    @staticmethod
+    def get_folders_paths(folder_path: str, recursive: bool) -> list:
+        """Gets the folder and, if recursive, its subfolders, the thumbnails folders are ignored."""
+        folders_ignored = ['.mayaSwatches', '.vrayThumbs']
+
+        if not recursive:
+            return [folder_path]
+
+        folders_paths = []
+
+        for dir_path, dir_names, file_names in os.walk(folder_path):
+            dir_names[:] = sorted(dir_name for dir_name in dir_names if dir_name not in folders_ignored)
+            folders_paths.append(dir_path)
+
+        return folders_paths
+
+    def get_material_network_plan(self) -> NetworkPlan:
+        """Gets the plan of the material network of the current textures, without touching the scene.
+
+        Plans are cached by everything that changes them, so the same texture set is only planned once. The nodes
+        attributes are set to the nodes of the plan.
+        """
+        plan_key = self.get_material_network_plan_key()
+        plan, nodes = CreateMaterialNetwork.plans.get(plan_key, (None, None))
+
+        if plan is None:
+            self.plan = NetworkPlan()
+            self.clear_nodes()
+            self.create_material_network_nodes()
+
+            plan = self.plan
+            nodes = {nodes_attribute: getattr(self, nodes_attribute) for nodes_attribute in self.NODES_ATTRIBUTES}
 
-        for file in files_in_folder.items():
-            file_short_name, file_path = file
+            if len(CreateMaterialNetwork.plans) >= CreateMaterialNetwork.PLANS_CACHE_SIZE:
+                CreateMaterialNetwork.plans.pop(next(iter(CreateMaterialNetwork.plans)))
 
-            if maurice_utils.is_image(file_path):
-                file_stem = Path(file_short_name).stem
+            CreateMaterialNetwork.plans[plan_key] = (plan, nodes)
 
-                if self.use_multi_tiled:
-                    file_stem = file_stem.removesuffix(f'.{self.file_digits_suffix}')
+        for nodes_attribute, node in nodes.items():
+            setattr(self, nodes_attribute, node)
 
-                if file_stem.startswith(texture_base_name):
-                    base_color_pattern_split = self.extract_pattern_match(file_stem, self.base_color_suffix)
-                    roughness_pattern_split = self.extract_pattern_match(file_stem, self.roughness_suffix)
-                    metalness_pattern_split = self.extract_pattern_match(file_stem, self.metalness_suffix)
-                    normal_pattern_split = self.extract_pattern_match(file_stem, self.normal_suffix)
-                    height_pattern_split = self.extract_pattern_match(file_stem, self.height_suffix)
-                    emissive_pattern_split = self.extract_pattern_match(file_stem, self.emissive_suffix)
-                    opacity_pattern_split = self.extract_pattern_match(file_stem, self.opacity_suffix)
+        return plan
 
-                    if len(base_color_pattern_split) > 1:
-                        self.base_color_file_paths.append(file_path)
+    def get_material_network_plan_key(self) -> tuple:
+        """Gets the key of the material network plan, made of everything the plan depends on."""
+        channels = (
+            (self.is_base_color_enabled, self.base_color_suffix, tuple(self.base_color_file_paths)),
+            (self.is_roughness_enabled, self.roughness_suffix, tuple(self.roughness_file_paths)),
+            (self.is_metalness_enabled, self.metalness_suffix, tuple(self.metalness_file_paths)),
+            (self.is_normal_enabled, self.normal_suffix, tuple(self.normal_file_paths)),
+            (self.is_height_enabled, self.height_suffix, tuple(self.height_file_paths)),
+            (self.is_emissive_enabled, self.emissive_suffix, tuple(self.emissive_file_paths)),
+            (self.is_opacity_enabled, self.opacity_suffix, tuple(self.opacity_file_paths)),
+            (self.is_packed_enabled, self.packed_suffix, tuple(self.packed_file_paths))
+        )
+        constant_textures = tuple(sorted(self.constant_textures.items()))
+        existing_file_nodes = tuple(sorted(self.existing_file_nodes.items()))
+
+        return (type(self), self.name, self.use_triplanar, self.use_multi_tiled, channels, constant_textures,
+                existing_file_nodes)
 
-                    if len(roughness_pattern_split) > 1:
-                        self.roughness_file_paths.append(file_path)
+    def get_nodes_names(self, nodes_names: list, offset: int = 0) -> None:
+        """Replaces the nodes of the plan by the names of the nodes created by the backend.
 
-                    if len(metalness_pattern_split) > 1:
-                        self.metalness_file_paths.append(file_path)
+        'offset' is the one of the plan nodes in the executed plan, when it was merged with others.
+        """
+        for nodes_attribute in self.NODES_ATTRIBUTES:
+            node = getattr(self, nodes_attribute)
 
-                    if len(normal_pattern_split) > 1:
-                        self.normal_file_paths.append(file_path)
+            if node:
+                setattr(self, nodes_attribute, nodes_names[node.index + offset])
 
-                    if len(height_pattern_split) > 1:
-                        self.height_file_paths.append(file_path)
+    def get_packed_channels(self) -> dict:
+        """Gets the {channel: component} of the enabled channels connected to the packed texture, if there is one."""
+        if not self.is_packed_enabled or not self.packed_file_paths:
+            return {}
 
-                    if len(emissive_pattern_split) > 1:
-                        self.emissive_file_paths.append(file_path)
+        packed_channels = maurice_utils.get_packed_channels(self.packed_suffix)
 
-                    if len(opacity_pattern_split) > 1:
-                        self.opacity_file_paths.append(file_path)
+        return {channel: component for channel, component in packed_channels.items()
+                if getattr(self, f'is_{channel}_enabled')}
+
+    def get_textures_paths(self, texture_path: str) -> None:
+        """Gets the textures paths."""
+        texture_folder = os.path.dirname(texture_path)
+        texture_base_name = self.get_texture_base_name(texture_path)
+        texture_set_index = TextureSetIndex.get_index(texture_folder)
+        texture_set = texture_set_index.get_texture_set(
+            base_name=texture_base_name,
+            channels_suffixes=self.get_channels_suffixes(),
+            case_sensitive=self.case_sensitive)
+
+        self.set_textures_paths(texture_set, use_multi_tiled=self.use_multi_tiled)
 
     def get_multi_tiled_mode(self, file_path: str) -> None:
         """Gets if the texture is multi tiled."""
@@ -515,6 +874,10 @@ class CreateMaterialNetwork(object):
             self.file_stem = self.file_stem.removesuffix(f'.{self.file_digits_suffix}')
             self.use_multi_tiled = True
 
+    def set_backend(self, backend: NetworkBackend) -> None:
+        """Sets the backend used to create the material networks."""
+        self.backend = backend
+
     def set_base_color_settings(self, enabled: bool, suffix: str) -> None:
         """Sets base color settings."""
         if not suffix:
@@ -523,7 +886,11 @@ class CreateMaterialNetwork(object):
         self.base_color_suffix = suffix
         self.is_base_color_enabled = enabled
 
-    def set_color_texture_file_node_settings(self, file_node: str, file_texture_name: str,
+    def set_case_sensitivity(self, case_sensitive: bool) -> None:
+        """Sets if the suffixes are matched case sensitive."""
+        self.case_sensitive = case_sensitive
+
+    def set_color_texture_file_node_settings(self, file_node: PlanNode, file_texture_name: str,
                                              use_multi_tiled: bool) -> None:
         """Sets the color texture file node settings."""
         self.set_texture_file_node_settings(
@@ -531,16 +898,31 @@ class CreateMaterialNetwork(object):
             file_texture_name=file_texture_name,
             use_multi_tiled=use_multi_tiled)
 
-    def set_data_texture_file_node_settings(self, file_node: str, file_texture_name: str,
+    def set_constant_texture_input(self, material_input_name: str, channel: str, is_color: bool = False) -> None:
+        """Sets the material input to the value of the constant texture of the channel, instead of connecting it.
+
+        The value of a float input is the luminance of the texture, as the file nodes output it.
+        """
+        value = self.constant_textures[channel]
+
+        if is_color:
+            self.plan.set_attr(self.material, material_input_name, value, attr_type='double3')
+        else:
+            self.plan.set_attr(self.material, material_input_name, maurice_utils.get_luminance(value))
+
+    def set_data_texture_file_node_settings(self, file_node: PlanNode, file_texture_name: str,
                                             use_multi_tiled: bool) -> None:
         """Sets the data texture file node settings."""
+        if file_node.kind == NetworkBackend.EXISTING:
+            return
+
         self.set_texture_file_node_settings(
             file_node=file_node,
             file_texture_name=file_texture_name,
             use_multi_tiled=use_multi_tiled)
 
-        cmds.setAttr(f'{file_node}.alphaIsLuminance', True)
-        cmds.setAttr(f'{file_node}.colorSpace', 'Raw', type='string')
+        self.plan.set_attr(file_node, 'alphaIsLuminance', True)
+        self.plan.set_attr(file_node, 'colorSpace', self.DATA_COLOR_SPACE, attr_type='string')
 
     def set_emissive_settings(self, enabled: bool, suffix: str) -> None:
         """Sets emissive settings."""
@@ -550,6 +932,10 @@ class CreateMaterialNetwork(object):
         self.emissive_suffix = suffix
         self.is_emissive_enabled = enabled
 
+    def set_file_node_index(self, file_node_index: FileNodeIndex) -> None:
+        """Sets the index of the file nodes of the scene, kept up to date by its call-backs."""
+        self.file_node_index = file_node_index
+
     def set_height_settings(self, enabled: bool, suffix: str) -> None:
         """Sets height settings."""
         if not suffix:
@@ -582,6 +968,14 @@ class CreateMaterialNetwork(object):
         self.opacity_suffix = suffix
         self.is_opacity_enabled = enabled
 
+    def set_packed_settings(self, enabled: bool, suffix: str) -> None:
+        """Sets packed settings."""
+        if not suffix:
+            MGlobal.displayWarning(f'[{maurice.TEXTURE_CONNECTOR}] There is no suffix for packed.')
+
+        self.packed_suffix = suffix
+        self.is_packed_enabled = enabled
+
     def set_roughness_settings(self, enabled: bool, suffix: str) -> None:
         """Sets roughness settings."""
         if not suffix:
@@ -590,11 +984,54 @@ class CreateMaterialNetwork(object):
         self.roughness_suffix = suffix
         self.is_roughness_enabled = enabled
 
-    @staticmethod
-    def set_texture_file_node_settings(file_node: str, file_texture_name: str, use_multi_tiled: bool) -> None:
-        """Sets the texture file node settings."""
-        cmds.setAttr(f'{file_node}.ignoreColorSpaceFileRules', True)
-        cmds.setAttr(f'{file_node}.fileTextureName', file_texture_name, type='string')
+    def set_textures_paths(self, texture_set: dict, use_multi_tiled: bool = None) -> None:
+        """Sets the textures paths from a texture set of the texture set index.
+
+        If 'use_multi_tiled' is None, it is taken from the UDIM tiles of the texture set.
+        """
+        textures_paths = {
+            maurice_utils.BASE_COLOR: self.base_color_file_paths,
+            maurice_utils.ROUGHNESS: self.roughness_file_paths,
+            maurice_utils.METALNESS: self.metalness_file_paths,
+            maurice_utils.NORMAL: self.normal_file_paths,
+            maurice_utils.HEIGHT: self.height_file_paths,
+            maurice_utils.EMISSIVE: self.emissive_file_paths,
+            maurice_utils.OPACITY: self.opacity_file_paths,
+            maurice_utils.PACKED: self.packed_file_paths
+        }
+
+        for channel, file_paths in textures_paths.items():
+            file_paths.clear()
+            file_paths.extend(texture_set.get(channel, []))
+
+        if use_multi_tiled is None:
+            use_multi_tiled = bool(texture_set.get(TextureSetIndex.UDIM_TILES))
+
+        self.use_multi_tiled = use_multi_tiled
+        self.constant_textures = self.get_constant_textures(texture_set)
+        self.existing_file_nodes = self.get_existing_file_nodes()
+
+    def set_texture_file_node_settings(self, file_node: PlanNode, file_texture_name: str,
+                                       use_multi_tiled: bool) -> None:
+        """Sets the texture file node settings, an existing file node is left as it is."""
+        if file_node.kind == NetworkBackend.EXISTING:
+            return
+
+        self.plan.set_attr(file_node, 'ignoreColorSpaceFileRules', True)
+        self.plan.set_attr(file_node, 'fileTextureName', file_texture_name, attr_type='string')
 
         if use_multi_tiled:
-            cmds.setAttr(f'{file_node}.uvTilingMode', 3)
+            self.plan.set_attr(file_node, 'uvTilingMode', 3)
+
+    def set_use_constant_textures(self, use_constant_textures: bool) -> None:
+        """Sets if the constant roughness, metalness and opacity textures are replaced by the values of the material."""
+        self.use_constant_textures = use_constant_textures
+
+    def set_use_existing_file_nodes(self, use_existing_file_nodes: bool) -> None:
+        """Sets if the file nodes of the scene loading the same textures with the same settings are reused."""
+        self.use_existing_file_nodes = use_existing_file_nodes
+
+    def update_file_node_index(self) -> None:
+        """Clears the file node index if it has no call-backs keeping it up to date, so it is built again."""
+        if self.use_existing_file_nodes and not self.file_node_index.has_call_backs:
+            self.file_node_index.clear()
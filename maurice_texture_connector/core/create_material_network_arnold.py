@@ -7,9 +7,9 @@ Updated Date: 11-11-2024
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
-import maya.cmds as cmds
-
 from maurice_texture_connector.core.create_material_network import CreateMaterialNetwork
+from maurice_texture_connector.core.network_backend import NetworkBackend
+from maurice_texture_connector.core.network_plan import PlanNode
 
 
 class CreateMaterialNetworkArnold(CreateMaterialNetwork):
@@ -34,17 +34,20 @@ class CreateMaterialNetworkArnold(CreateMaterialNetwork):
         """Create the emissive network."""
         super(CreateMaterialNetworkArnold, self).create_emissive_network()
 
-        cmds.setAttr(f'{self.material}.emission', 1)
+        self.plan.set_attr(self.material, 'emission', 1)
 
-    def create_triplanar_node_network(self, name: str) -> str:
+    def create_triplanar_node_network(self, name: str) -> PlanNode:
         """Creates the triplanar node network."""
         super(CreateMaterialNetworkArnold, self).create_triplanar_node_network(name)
 
-        triplanar_node = cmds.shadingNode('aiTriplanar', asTexture=True, name=f'{name}_aiTriplanar')
+        triplanar_node = self.plan.create_node(
+            'aiTriplanar',
+            name=f'{name}_aiTriplanar',
+            kind=NetworkBackend.TEXTURE)
 
-        cmds.setAttr(f'{triplanar_node}.coordSpace', 0)
+        self.plan.set_attr(triplanar_node, 'coordSpace', 0)
 
         for axis in ['X', 'Y', 'Z']:
-            cmds.connectAttr(f'{self.float_constant_node}.outFloat', f'{triplanar_node}.scale{axis}', force=True)
+            self.plan.connect_attr(self.float_constant_node, 'outFloat', triplanar_node, f'scale{axis}')
 
         return triplanar_node
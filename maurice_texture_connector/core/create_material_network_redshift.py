@@ -7,9 +7,9 @@ Updated Date: 11-11-2024
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
-import maya.cmds as cmds
-
 from maurice_texture_connector.core.create_material_network import CreateMaterialNetwork
+from maurice_texture_connector.core.network_backend import NetworkBackend
+from maurice_texture_connector.core.network_plan import PlanNode
 
 
 class CreateMaterialNetworkRedshift(CreateMaterialNetwork):
@@ -34,17 +34,20 @@ class CreateMaterialNetworkRedshift(CreateMaterialNetwork):
         """Create the emissive network."""
         super(CreateMaterialNetworkRedshift, self).create_emissive_network()
 
-        cmds.setAttr(f'{self.material}.emission_weight', 1)
+        self.plan.set_attr(self.material, 'emission_weight', 1)
 
-    def create_triplanar_node_network(self, name: str) -> str:
+    def create_triplanar_node_network(self, name: str) -> PlanNode:
         """Creates the triplanar node network."""
         super(CreateMaterialNetworkRedshift, self).create_triplanar_node_network(name)
 
-        triplanar_node = cmds.shadingNode('RedshiftTriPlanar', asTexture=True, name=f'{name}_RedshiftTriPlanar')
+        triplanar_node = self.plan.create_node(
+            'RedshiftTriPlanar',
+            name=f'{name}_RedshiftTriPlanar',
+            kind=NetworkBackend.TEXTURE)
 
-        cmds.setAttr(f'{triplanar_node}.projSpaceType', 0)
+        self.plan.set_attr(triplanar_node, 'projSpaceType', 0)
 
         for i in range(3):
-            cmds.connectAttr(f'{self.float_constant_node}.outFloat', f'{triplanar_node}.scale.scale{i}', force=True)
+            self.plan.connect_attr(self.float_constant_node, 'outFloat', triplanar_node, f'scale.scale{i}')
 
         return triplanar_node
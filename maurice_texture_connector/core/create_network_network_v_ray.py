@@ -2,13 +2,14 @@
 ========================================================================================================================
 Name: create_network_network_v_ray.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 11-11-2024
+Updated Date: 11-12-2024
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
-import maya.cmds as cmds
-
+from maurice_texture_connector.core.network_backend import NetworkBackend
+from maurice_texture_connector.core.network_plan import PlanNode
+import maurice_texture_connector.utils as maurice_utils
 # from maurice_texture_connector.core.create_material_network import CreateMaterialNetwork
 import maurice_texture_connector.core.create_material_network as ff
 import importlib
@@ -40,23 +41,34 @@ class CreateMaterialNetworkVRay(ff.CreateMaterialNetwork):
         """Creates the normal network."""
         super(CreateMaterialNetworkVRay, self).create_normal_network()
 
-        cmds.setAttr(f'{self.material}.bumpMapType', 1)
+        self.plan.set_attr(self.material, 'bumpMapType', 1)
+
+    def create_packed_network(self) -> None:
+        """Creates the packed network."""
+        super(CreateMaterialNetworkVRay, self).create_packed_network()
+
+        if maurice_utils.ROUGHNESS in self.get_packed_channels():
+            self.plan.set_attr(self.material, 'reflectionColor', (1, 1, 1), attr_type='double3')
+            self.plan.set_attr(self.material, 'useRoughness', 1)
 
     def create_roughness_network(self) -> None:
         """Creates the roughness network."""
         super(CreateMaterialNetworkVRay, self).create_roughness_network()
 
-        cmds.setAttr(f'{self.material}.reflectionColor', 1, 1, 1, type='double3')
-        cmds.setAttr(f'{self.material}.useRoughness', 1)
+        self.plan.set_attr(self.material, 'reflectionColor', (1, 1, 1), attr_type='double3')
+        self.plan.set_attr(self.material, 'useRoughness', 1)
 
-    def create_triplanar_node_network(self, name: str) -> str:
+    def create_triplanar_node_network(self, name: str) -> PlanNode:
         """Creates the triplanar node network."""
         super(CreateMaterialNetworkVRay, self).create_triplanar_node_network(name)
 
-        triplanar_node = cmds.shadingNode('VRayTriplanar', asTexture=True, name=f'{name}_VRayTriplanar')
+        triplanar_node = self.plan.create_node(
+            'VRayTriplanar',
+            name=f'{name}_VRayTriplanar',
+            kind=NetworkBackend.TEXTURE)
 
-        cmds.setAttr(f'{triplanar_node}.refSpace', 1)
+        self.plan.set_attr(triplanar_node, 'refSpace', 1)
 
-        cmds.connectAttr(f'{self.float_constant_node}.outFloat', f'{triplanar_node}.size', force=True)
+        self.plan.connect_attr(self.float_constant_node, 'outFloat', triplanar_node, 'size')
 
         return triplanar_node
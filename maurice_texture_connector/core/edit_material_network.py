@@ -8,8 +8,10 @@ Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
 from maya.api.OpenMaya import MGlobal
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
+import maurice_texture_connector.utils as maurice_utils
 import maurice_texture_connector as maurice
 
 
@@ -24,8 +26,15 @@ class EditMaterialNetwork(object):
     OPACITY_MATERIAL_INPUT_NAME = None
     ROUGHNESS_MATERIAL_INPUT_NAME = None
 
-    def __init__(self, material: str) -> None:
-        """Initializes class attributes."""
+    # Maximum number of nodes between a material input and its file node.
+    MAX_UPSTREAM_DEPTH = 32
+
+    def __init__(self, material: str, file_nodes: dict = None) -> None:
+        """Initializes class attributes.
+
+        'file_nodes' are the {channel: file node} already known, from the material network index, if not given they
+        are searched in the material network.
+        """
         self.material = material
 
         self.base_color_file_node = ''
@@ -36,7 +45,12 @@ class EditMaterialNetwork(object):
         self.height_file_node = ''
         self.opacity_file_node = ''
 
-        self.get_material_file_nodes()
+        self.upstream_nodes = set()
+
+        if file_nodes is None:
+            self.get_material_file_nodes()
+        else:
+            self.set_file_nodes(file_nodes)
 
     def edit_base_color_file_texture_node(self, texture_path: str) -> None:
         """Edits the base color file texture node."""
@@ -88,13 +102,8 @@ class EditMaterialNetwork(object):
         return self.get_file_texture_name(file_node=self.emissive_file_node)
 
     @staticmethod
-    def get_file_node(channel_name: str, top_node: str) -> str:
-        """Gets a file node."""
-        if cmds.objectType(top_node, isType='file'):
-            return top_node
-
-        file_nodes = [node for node in cmds.listHistory(top_node) if cmds.objectType(node, isType='file')]
-
+    def get_file_node(channel_name: str, file_nodes: tuple) -> str:
+        """Gets the file node of a channel from the file nodes found upstream of it."""
         if len(file_nodes) == 1:
             return file_nodes[0]
         else:
@@ -104,6 +113,20 @@ class EditMaterialNetwork(object):
 
         return ''
 
+    def get_file_nodes(self) -> dict:
+        """Gets the {channel: file node} of the material."""
+        file_nodes = {
+            maurice_utils.BASE_COLOR: self.base_color_file_node,
+            maurice_utils.ROUGHNESS: self.roughness_file_node,
+            maurice_utils.METALNESS: self.metalness_file_node,
+            maurice_utils.NORMAL: self.normal_file_node,
+            maurice_utils.HEIGHT: self.height_file_node,
+            maurice_utils.EMISSIVE: self.emissive_file_node,
+            maurice_utils.OPACITY: self.opacity_file_node
+        }
+
+        return file_nodes
+
     @staticmethod
     def get_file_texture_name(file_node: str) -> str:
         """Gets a file texture name."""
@@ -121,67 +144,52 @@ class EditMaterialNetwork(object):
         return self.get_file_texture_name(file_node=self.height_file_node)
 
     def get_material_file_nodes(self) -> None:
-        """Gets the material file nodes."""
-        material_connections = cmds.listHistory(self.material, levels=1)
-
-        for material_connection in material_connections:
-            if not material_connection == self.material:
-                material_plug_nodes = cmds.listConnections(
-                    material_connection,
-                    source=False,
-                    plugs=True,
-                    type=self.MATERIAL_NODE)
-
-                # Base color.
-                if f'{self.material}.{self.BASE_COLOR_MATERIAL_INPUT_NAME}' in material_plug_nodes:
-                    self.base_color_file_node = self.get_file_node(
-                        channel_name='Base Color',
-                        top_node=material_connection)
-
-                # Roughness.
-                if f'{self.material}.{self.ROUGHNESS_MATERIAL_INPUT_NAME}' in material_plug_nodes:
-                    self.roughness_file_node = self.get_file_node(
-                        channel_name='Roughness',
-                        top_node=material_connection)
-
-                # Metalness.
-                if f'{self.material}.{self.METALNESS_MATERIAL_INPUT_NAME}' in material_plug_nodes:
-                    self.metalness_file_node = self.get_file_node(
-                        channel_name='Metalness',
-                        top_node=material_connection)
-
-                # Normal.
-                if f'{self.material}.{self.NORMAL_MATERIAL_INPUT_NAME}' in material_plug_nodes:
-                    self.normal_file_node = self.get_file_node(
-                        channel_name='Normal',
-                        top_node=material_connection)
-
-                # Emissive.
-                if f'{self.material}.{self.EMISSIVE_MATERIAL_INPUT_NAME}' in material_plug_nodes:
-                    self.emissive_file_node = self.get_file_node(
-                        channel_name='Emissive',
-                        top_node=material_connection)
-
-                # Opacity.
-                if f'{self.material}.{self.OPACITY_MATERIAL_INPUT_NAME}' in material_plug_nodes:
-                    self.opacity_file_node = self.get_file_node(
-                        channel_name='Opacity',
-                        top_node=material_connection)
+        """Gets the material file nodes.
+
+        Walks the network upstream of the material once, resolving every channel in the same pass: the file nodes
+        found upstream of each node are memoized when its walk is complete, so the nodes shared by several channels are
+        only visited once.
+        """
+        channels = (
+            ('Base Color', 'base_color_file_node', self.BASE_COLOR_MATERIAL_INPUT_NAME),
+            ('Roughness', 'roughness_file_node', self.ROUGHNESS_MATERIAL_INPUT_NAME),
+            ('Metalness', 'metalness_file_node', self.METALNESS_MATERIAL_INPUT_NAME),
+            ('Normal', 'normal_file_node', self.NORMAL_MATERIAL_INPUT_NAME),
+            ('Emissive', 'emissive_file_node', self.EMISSIVE_MATERIAL_INPUT_NAME),
+            ('Opacity', 'opacity_file_node', self.OPACITY_MATERIAL_INPUT_NAME)
+        )
+
+        self.upstream_nodes = {self.material}
+
+        selection_list = om.MSelectionList()
+        selection_list.add(self.material)
+        material_node = selection_list.getDependNode(0)
+        material_fn = om.MFnDependencyNode(material_node)
+
+        # Networks looping back to the material are not walked through it.
+        memo = {self.get_node_key(material_node): ()}
+
+        for channel_name, file_node_attribute, material_input_name in channels:
+            file_nodes = self.get_plug_file_nodes(material_fn.findPlug(material_input_name, False), memo=memo)
+
+            setattr(self, file_node_attribute, self.get_file_node(channel_name=channel_name, file_nodes=file_nodes))
 
         # Height.
-        shading_engine = cmds.listConnections(self.material, source=False, type='shadingEngine')
+        for plug in material_fn.getConnections():
+            for destination_plug in plug.destinations():
+                shading_engine_fn = om.MFnDependencyNode(destination_plug.node())
+
+                if shading_engine_fn.typeName != 'shadingEngine':
+                    continue
+
+                self.upstream_nodes.add(shading_engine_fn.name())
 
-        if shading_engine:
-            shading_engine_connections = cmds.listConnections(
-                f'{shading_engine[0]}.displacementShader',
-                connections=True)
+                displacement_shader_plug = shading_engine_fn.findPlug('displacementShader', False)
+                file_nodes = self.get_plug_file_nodes(displacement_shader_plug, memo=memo)
 
-            if shading_engine_connections:
-                for shading_engine_connection in shading_engine_connections:
-                    if not cmds.nodeType(shading_engine_connection) == 'shadingEngine':
-                        self.height_file_node = self.get_file_node(
-                            channel_name='Height',
-                            top_node=shading_engine_connection)
+                self.height_file_node = self.get_file_node(channel_name='Height', file_nodes=file_nodes)
+
+                return
 
     def get_metalness_color_space(self) -> str:
         """Gets the metalness color space."""
@@ -191,6 +199,17 @@ class EditMaterialNetwork(object):
         """Gets the metalness file texture name."""
         return self.get_file_texture_name(file_node=self.metalness_file_node)
 
+    @staticmethod
+    def get_node_key(node: om.MObject) -> str:
+        """Gets the key of a node in the memo of the upstream walk, its unique name: the full path of a DAG node.
+
+        The hash code of an MObjectHandle is not unique.
+        """
+        if node.hasFn(om.MFn.kDagNode):
+            return om.MFnDagNode(node).fullPathName()
+
+        return om.MFnDependencyNode(node).name()
+
     def get_normal_color_space(self) -> str:
         """Gets the normal color space."""
         return self.get_color_space(file_node=self.normal_file_node)
@@ -207,6 +226,98 @@ class EditMaterialNetwork(object):
         """Gets the opacity file texture name."""
         return self.get_file_texture_name(file_node=self.opacity_file_node)
 
+    def get_plug_file_nodes(self, plug: om.MPlug, memo: dict) -> tuple:
+        """Gets the file nodes upstream of the plug."""
+        file_nodes = []
+
+        for source_node in self.get_source_nodes(plug):
+            upstream_file_nodes = self.get_upstream_file_nodes(source_node, depth=1, memo=memo, visiting=set())[0]
+
+            for file_node in upstream_file_nodes:
+                if file_node not in file_nodes:
+                    file_nodes.append(file_node)
+
+        return tuple(file_nodes)
+
+    @staticmethod
+    def get_source_nodes(plug: om.MPlug) -> list:
+        """Gets the nodes connected to the plug, or to its children if it is a compound connected by component."""
+        if plug.isDestination:
+            return [plug.source().node()]
+
+        source_nodes = []
+
+        if plug.isCompound:
+            for i in range(plug.numChildren()):
+                child_plug = plug.child(i)
+
+                if child_plug.isDestination:
+                    source_nodes.append(child_plug.source().node())
+
+        return source_nodes
+
+    def get_upstream_file_nodes(self, node: om.MObject, depth: int, memo: dict, visiting: set) -> tuple:
+        """Gets the (file nodes upstream of the node, keys of the nodes the walk was stopped at).
+
+        The walk stops at file nodes, at MAX_UPSTREAM_DEPTH, whose key is None, and at the nodes being walked, in
+        'visiting', to guard against cycles. The memo is shared by the channels, which reach the nodes at other depths
+        and through other paths, so only the results that are complete are memoized: the ones whose walk was stopped
+        by no node, or only by a cycle back to the node itself. The visited nodes are added to 'upstream_nodes'.
+        """
+        node_key = self.get_node_key(node)
+
+        if node_key in memo:
+            return memo[node_key], set()
+        elif node_key in visiting:
+            return (), {node_key}
+
+        node_fn = om.MFnDependencyNode(node)
+        self.upstream_nodes.add(node_fn.name())
+
+        if node_fn.typeName == 'file':
+            memo[node_key] = (node_fn.name(),)
+            return memo[node_key], set()
+        elif depth >= self.MAX_UPSTREAM_DEPTH:
+            return (), {None}
+
+        visiting.add(node_key)
+
+        file_nodes = []
+        stopped_nodes = set()
+
+        for plug in node_fn.getConnections():
+            if not plug.isDestination:
+                continue
+
+            upstream_file_nodes, upstream_stopped_nodes = self.get_upstream_file_nodes(
+                plug.source().node(),
+                depth=depth + 1,
+                memo=memo,
+                visiting=visiting)
+
+            stopped_nodes.update(upstream_stopped_nodes)
+
+            for file_node in upstream_file_nodes:
+                if file_node not in file_nodes:
+                    file_nodes.append(file_node)
+
+        visiting.discard(node_key)
+        stopped_nodes.discard(node_key)
+
+        file_nodes = tuple(file_nodes)
+
+        if not stopped_nodes:
+            memo[node_key] = file_nodes
+
+        return file_nodes, stopped_nodes
+
+    def get_upstream_nodes(self) -> set:
+        """Gets the nodes the file nodes of the material depend on, including the material and its shading engine."""
+        if not self.upstream_nodes:
+            self.get_material_file_nodes()
+
+        return self.upstream_nodes
+
     def get_roughness_color_space(self) -> str:
         """Gets the roughness color space."""
         return self.get_color_space(file_node=self.roughness_file_node)
@@ -215,6 +326,16 @@ class EditMaterialNetwork(object):
         """Gets the roughness file texture name."""
         return self.get_file_texture_name(file_node=self.roughness_file_node)
 
+    def set_file_nodes(self, file_nodes: dict) -> None:
+        """Sets the file nodes from a {channel: file node} dictionary."""
+        self.base_color_file_node = file_nodes.get(maurice_utils.BASE_COLOR, '')
+        self.roughness_file_node = file_nodes.get(maurice_utils.ROUGHNESS, '')
+        self.metalness_file_node = file_nodes.get(maurice_utils.METALNESS, '')
+        self.normal_file_node = file_nodes.get(maurice_utils.NORMAL, '')
+        self.height_file_node = file_nodes.get(maurice_utils.HEIGHT, '')
+        self.emissive_file_node = file_nodes.get(maurice_utils.EMISSIVE, '')
+        self.opacity_file_node = file_nodes.get(maurice_utils.OPACITY, '')
+
     @staticmethod
     def set_file_texture_name(file_node: str, texture_path: str) -> None:
         """Sets a file texture name."""
@@ -21,6 +21,6 @@ class EditMaterialNetworkArnold(EditMaterialNetwork):
     OPACITY_MATERIAL_INPUT_NAME = 'opacity'
     ROUGHNESS_MATERIAL_INPUT_NAME = 'specularRoughness'
 
-    def __init__(self, material: str) -> None:
+    def __init__(self, material: str, file_nodes: dict = None) -> None:
         """Initializes class attributes."""
-        super(EditMaterialNetworkArnold, self).__init__(material)
+        super(EditMaterialNetworkArnold, self).__init__(material, file_nodes=file_nodes)
@@ -21,6 +21,6 @@ class EditMaterialNetworkRedshift(EditMaterialNetwork):
     OPACITY_MATERIAL_INPUT_NAME = 'opacity_color'
     ROUGHNESS_MATERIAL_INPUT_NAME = 'refl_roughness'
 
-    def __init__(self, material: str) -> None:
+    def __init__(self, material: str, file_nodes: dict = None) -> None:
         """Initializes class attributes."""
-        super(EditMaterialNetworkRedshift, self).__init__(material)
+        super(EditMaterialNetworkRedshift, self).__init__(material, file_nodes=file_nodes)
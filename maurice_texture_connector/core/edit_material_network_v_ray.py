@@ -21,6 +21,6 @@ class EditMaterialNetworkVRay(EditMaterialNetwork):
     OPACITY_MATERIAL_INPUT_NAME = 'opacityMap'
     ROUGHNESS_MATERIAL_INPUT_NAME = 'reflectionGlossiness'
 
-    def __init__(self, material: str) -> None:
+    def __init__(self, material: str, file_nodes: dict = None) -> None:
         """Initializes class attributes."""
-        super(EditMaterialNetworkVRay, self).__init__(material)
+        super(EditMaterialNetworkVRay, self).__init__(material, file_nodes=file_nodes)
@@ -0,0 +1,227 @@
+"""
+========================================================================================================================
+Name: file_node_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+import os
+
+
+class FileNodeIndex(object):
+    """File node index.
+
+    Indexes the file nodes of the scene by the texture they load and the settings a material network gives them,
+    {(path, color space, UV tiling mode, alpha is luminance, UV placement): [file nodes]}, so a texture already loaded
+    can be connected again instead of being loaded by a new file node. The index is built in one pass the first time it
+    is used, then the DG callbacks keep it up to date: the file nodes added are indexed at the next lookup, once their
+    attributes are set, the removed and renamed ones are updated. A file node found is checked again before being
+    returned, as its attributes can be edited without any callback.
+
+    The UV placement is read from the file node, so it is the one of its place2dTexture node: a file node is only
+    reused by a material with the same repeat, offset, rotation and wrap of the UVs.
+    """
+    # (attribute, default value) of the UV placement of the file nodes.
+    UV_PLACEMENT_ATTRIBUTES = (
+        ('coverage', (1.0, 1.0)),
+        ('translateFrame', (0.0, 0.0)),
+        ('rotateFrame', 0.0),
+        ('mirrorU', False),
+        ('mirrorV', False),
+        ('stagger', False),
+        ('wrapU', True),
+        ('wrapV', True),
+        ('repeatUV', (1.0, 1.0)),
+        ('offset', (0.0, 0.0)),
+        ('rotateUV', 0.0),
+        ('noiseUV', (0.0, 0.0))
+    )
+
+    # UV placement of a new place2dTexture node.
+    DEFAULT_UV_PLACEMENT = tuple(default_value for attr, default_value in UV_PLACEMENT_ATTRIBUTES)
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        # {key: [file nodes]}
+        self.file_nodes = {}
+
+        # {file node: key}
+        self.nodes_keys = {}
+
+        # File nodes added since the last lookup.
+        self.added_nodes = set()
+
+        self.is_built = False
+        self.has_call_backs = False
+
+    @staticmethod
+    def get_key(file_texture_name: str, color_space: str, uv_tiling_mode: int, alpha_is_luminance: bool,
+                uv_placement: tuple, project_path: str) -> tuple:
+        """Gets the key of a texture, its path being absolute and normalized."""
+        path = os.path.expandvars(file_texture_name)
+
+        if not os.path.isabs(path) and project_path:
+            path = os.path.join(project_path, path)
+
+        path = os.path.normpath(path)
+
+        if os.name == 'nt':
+            path = path.lower()
+
+        return path, color_space, uv_tiling_mode, bool(alpha_is_luminance), uv_placement
+
+    @staticmethod
+    def get_uv_placement(file_node: str) -> tuple:
+        """Gets the values of the UV placement attributes of a file node, compound values as tuples."""
+        uv_placement = []
+
+        for attr, default_value in FileNodeIndex.UV_PLACEMENT_ATTRIBUTES:
+            value = cmds.getAttr(f'{file_node}.{attr}')
+            uv_placement.append(tuple(value[0]) if isinstance(value, list) else value)
+
+        return tuple(uv_placement)
+
+    @staticmethod
+    def is_file_node(node: om.MObject) -> bool:
+        """Checks if the node is a file node."""
+        return om.MFnDependencyNode(node).typeName == 'file'
+
+    def add_file_node(self, file_node: str, project_path: str) -> None:
+        """Indexes a file node, if it has a texture."""
+        key = self.get_file_node_key(file_node, project_path)
+
+        if key:
+            self.file_nodes.setdefault(key, []).append(file_node)
+            self.nodes_keys[file_node] = key
+
+    def build(self) -> None:
+        """Indexes all the file nodes of the scene."""
+        project_path = cmds.workspace(rootDirectory=True, query=True)
+
+        self.file_nodes.clear()
+        self.nodes_keys.clear()
+        self.added_nodes.clear()
+
+        for file_node in cmds.ls(type='file'):
+            self.add_file_node(file_node, project_path)
+
+        self.is_built = True
+
+    def clear(self) -> None:
+        """Clears the index, it is built again at the next lookup."""
+        self.file_nodes.clear()
+        self.nodes_keys.clear()
+        self.added_nodes.clear()
+
+        self.is_built = False
+
+    def create_call_backs(self) -> list:
+        """Creates the DG call-backs keeping the index up to date and returns their ids."""
+        call_backs = [
+            om.MDGMessage.addNodeAddedCallback(self.node_added, 'file'),
+            om.MDGMessage.addNodeRemovedCallback(self.node_removed, 'file'),
+            om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, self.node_name_changed)
+        ]
+
+        self.has_call_backs = True
+
+        return call_backs
+
+    def get_file_node(self, file_texture_name: str, color_space: str, uv_tiling_mode: int, alpha_is_luminance: bool,
+                      uv_placement: tuple = DEFAULT_UV_PLACEMENT) -> str:
+        """Gets a file node of the texture with the same settings, or '' if there is none.
+
+        'uv_placement' are the values of UV_PLACEMENT_ATTRIBUTES, the ones of a new place2dTexture node by default.
+        """
+        project_path = cmds.workspace(rootDirectory=True, query=True)
+
+        if not self.is_built:
+            self.build()
+        elif self.added_nodes:
+            for file_node in self.added_nodes:
+                if cmds.objExists(file_node):
+                    self.add_file_node(file_node, project_path)
+
+            self.added_nodes.clear()
+
+        key = self.get_key(
+            file_texture_name=file_texture_name,
+            color_space=color_space,
+            uv_tiling_mode=uv_tiling_mode,
+            alpha_is_luminance=alpha_is_luminance,
+            uv_placement=tuple(uv_placement),
+            project_path=project_path)
+
+        for file_node in list(self.file_nodes.get(key, ())):
+            if cmds.objExists(file_node) and self.get_file_node_key(file_node, project_path) == key:
+                return file_node
+
+            # The file node was edited, it is indexed again by its current settings.
+            self.remove_file_node(file_node)
+
+            if cmds.objExists(file_node):
+                self.add_file_node(file_node, project_path)
+
+        return ''
+
+    def get_file_node_key(self, file_node: str, project_path: str) -> tuple:
+        """Gets the key of a file node, or None if it has no texture."""
+        file_texture_name = cmds.getAttr(f'{file_node}.fileTextureName')
+
+        if not file_texture_name:
+            return None
+
+        return self.get_key(
+            file_texture_name=file_texture_name,
+            color_space=cmds.getAttr(f'{file_node}.colorSpace'),
+            uv_tiling_mode=cmds.getAttr(f'{file_node}.uvTilingMode'),
+            alpha_is_luminance=cmds.getAttr(f'{file_node}.alphaIsLuminance'),
+            uv_placement=self.get_uv_placement(file_node),
+            project_path=project_path)
+
+    def node_added(self, node: om.MObject, *args) -> None:
+        """Keeps a file node added, to index it at the next lookup."""
+        if self.is_built and self.is_file_node(node):
+            self.added_nodes.add(om.MFnDependencyNode(node).name())
+
+    def node_name_changed(self, node: om.MObject, previous_name: str, *args) -> None:
+        """Renames a file node of the index."""
+        if not self.is_built or not previous_name or not self.is_file_node(node):
+            return
+
+        name = om.MFnDependencyNode(node).name()
+
+        if previous_name in self.added_nodes:
+            self.added_nodes.discard(previous_name)
+            self.added_nodes.add(name)
+
+        key = self.nodes_keys.pop(previous_name, None)
+
+        if key:
+            file_nodes = self.file_nodes[key]
+            file_nodes[file_nodes.index(previous_name)] = name
+            self.nodes_keys[name] = key
+
+    def node_removed(self, node: om.MObject, *args) -> None:
+        """Removes a file node from the index."""
+        if self.is_built and self.is_file_node(node):
+            name = om.MFnDependencyNode(node).name()
+
+            self.added_nodes.discard(name)
+            self.remove_file_node(name)
+
+    def remove_file_node(self, file_node: str) -> None:
+        """Removes a file node from the index."""
+        key = self.nodes_keys.pop(file_node, None)
+
+        if key:
+            file_nodes = self.file_nodes[key]
+            file_nodes.remove(file_node)
+
+            if not file_nodes:
+                del self.file_nodes[key]
@@ -0,0 +1,102 @@
+"""
+========================================================================================================================
+Name: material_network_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import maya.api.OpenMaya as om
+
+
+class MaterialNetworkIndex(object):
+    """Material network index.
+
+    Keeps the {channel: file node} of every material already looked up, so selecting a material again is a dictionary
+    lookup. The materials are resolved lazily by their EditMaterialNetwork class, and a reverse {node: materials} map
+    lets the DG callbacks invalidate only the materials whose network changed when a node is removed or renamed, or a
+    connection is made or broken.
+    """
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        # {material: (EditMaterialNetwork class, {channel: file node}, upstream nodes)}
+        self.materials = {}
+
+        # {node: {materials}}
+        self.nodes_materials = {}
+
+    def clear(self) -> None:
+        """Clears the index."""
+        self.materials.clear()
+        self.nodes_materials.clear()
+
+    def connection_changed(self, source_plug: om.MPlug, destination_plug: om.MPlug, made: bool, *args) -> None:
+        """Invalidates the materials of the nodes of a connection made or broken."""
+        if not self.materials:
+            return
+
+        self.invalidate_node(om.MFnDependencyNode(destination_plug.node()).name())
+        self.invalidate_node(om.MFnDependencyNode(source_plug.node()).name())
+
+    def create_call_backs(self) -> list:
+        """Creates the DG call-backs keeping the index up to date and returns their ids."""
+        call_backs = [
+            om.MDGMessage.addConnectionCallback(self.connection_changed),
+            om.MDGMessage.addNodeRemovedCallback(self.node_removed, 'dependNode'),
+            om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, self.node_name_changed)
+        ]
+
+        return call_backs
+
+    def get_file_nodes(self, material: str, edit_material_network_class: type) -> dict:
+        """Gets the {channel: file node} of the material, resolving its network only if it is not indexed."""
+        material_network = self.materials.get(material)
+
+        if material_network and material_network[0] is edit_material_network_class:
+            return material_network[1]
+
+        self.invalidate_material(material)
+
+        edit_material_network = edit_material_network_class(material)
+        file_nodes = edit_material_network.get_file_nodes()
+        upstream_nodes = edit_material_network.get_upstream_nodes()
+
+        self.materials[material] = (edit_material_network_class, file_nodes, upstream_nodes)
+
+        for node in upstream_nodes:
+            self.nodes_materials.setdefault(node, set()).add(material)
+
+        return file_nodes
+
+    def invalidate_material(self, material: str) -> None:
+        """Removes the material from the index."""
+        material_network = self.materials.pop(material, None)
+
+        if not material_network:
+            return
+
+        for node in material_network[2]:
+            node_materials = self.nodes_materials.get(node)
+
+            if node_materials:
+                node_materials.discard(material)
+
+                if not node_materials:
+                    del self.nodes_materials[node]
+
+    def invalidate_node(self, node: str) -> None:
+        """Removes the materials depending on the node from the index."""
+        for material in list(self.nodes_materials.get(node, ())):
+            self.invalidate_material(material)
+
+    def node_name_changed(self, node: om.MObject, previous_name: str, *args) -> None:
+        """Invalidates the materials of a renamed node."""
+        if self.materials and previous_name:
+            self.invalidate_node(previous_name)
+
+    def node_removed(self, node: om.MObject, *args) -> None:
+        """Invalidates the materials of a removed node."""
+        if self.materials:
+            self.invalidate_node(om.MFnDependencyNode(node).name())
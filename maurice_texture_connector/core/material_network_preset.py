@@ -0,0 +1,119 @@
+"""
+========================================================================================================================
+Name: material_network_preset.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from maya.api.OpenMaya import MGlobal
+
+from urllib.parse import unquote
+import configparser
+import os
+
+import maurice_texture_connector.utils as maurice_utils
+import maurice_texture_connector as maurice
+
+
+class MaterialNetworkPreset(object):
+    """Material network preset.
+
+    Reads the settings and a preset of the Texture Connector '.ini' file without Qt, with the same defaults as the
+    interface, and applies them to a CreateMaterialNetwork.
+    """
+    DEFAULT_PRESET = 'Maurice'
+
+    # (channel, enabled key, suffix key, default suffix)
+    CHANNELS_KEYS = (
+        (maurice_utils.BASE_COLOR, 'baseColor', 'baseColorSuffix', 'BaseColor'),
+        (maurice_utils.ROUGHNESS, 'roughness', 'roughnessSuffix', 'Roughness'),
+        (maurice_utils.METALNESS, 'metalness', 'metalnessSuffix', 'Metallic'),
+        (maurice_utils.NORMAL, 'normal', 'normalSuffix', 'Normal'),
+        (maurice_utils.HEIGHT, 'height', 'heightSuffix', 'Height'),
+        (maurice_utils.EMISSIVE, 'emissive', 'emissiveSuffix', 'Emissive'),
+        (maurice_utils.OPACITY, 'opacity', 'opacitySuffix', 'Opacity'),
+        (maurice_utils.PACKED, 'packed', 'packedSuffix', maurice_utils.PACKED_LAYOUT)
+    )
+
+    @classmethod
+    def load(cls, config_path: str, preset_name: str = '') -> 'MaterialNetworkPreset':
+        """Loads a preset of the '.ini' file, its current preset if no name is given.
+
+        Returns None if the preset does not exist.
+        """
+        config = configparser.ConfigParser(interpolation=None)
+        config.optionxform = str
+
+        if os.path.isfile(config_path):
+            config.read(config_path, encoding='utf-8')
+
+        # QSettings percent-encodes the groups names.
+        sections = {unquote(section): config[section] for section in config.sections()}
+
+        settings = sections.get('settings', {})
+        texture_connector = sections.get('texture_connector', {})
+
+        presets = cls.get_value(texture_connector, 'presets', cls.DEFAULT_PRESET).split(',')
+        preset_name = preset_name or cls.get_value(texture_connector, 'currentPreset', cls.DEFAULT_PRESET)
+
+        if preset_name not in presets and preset_name not in sections:
+            MGlobal.displayError(f'[{maurice.TEXTURE_CONNECTOR}] Preset \'{preset_name}\' not found.')
+            return None
+
+        preset = cls(name=preset_name)
+        preset_suffixes = sections.get(preset_name, {})
+
+        for channel, enabled_key, suffix_key, default_suffix in cls.CHANNELS_KEYS:
+            preset.channels_enabled[channel] = cls.get_bool(settings, enabled_key, True)
+            preset.channels_suffixes[channel] = cls.get_value(preset_suffixes, suffix_key, default_suffix)
+
+        preset.case_sensitive = cls.get_bool(settings, 'caseSensitivity', False)
+        preset.use_constant_textures = cls.get_bool(settings, 'useConstantTextures', False)
+        preset.use_dg_modifier = cls.get_bool(settings, 'useDGModifier', False)
+        preset.use_existing_file_nodes = cls.get_bool(settings, 'reuseFileNodes', False)
+        preset.use_texture_name = cls.get_bool(settings, 'useTextureName', True)
+        preset.use_triplanar = cls.get_bool(settings, 'useTriplanar', False)
+
+        return preset
+
+    @staticmethod
+    def get_bool(section: dict, key: str, default: bool) -> bool:
+        """Gets a boolean written by QSettings."""
+        return MaterialNetworkPreset.get_value(section, key, str(default)).lower() == 'true'
+
+    @staticmethod
+    def get_value(section: dict, key: str, default: str) -> str:
+        """Gets a string written by QSettings, which quotes the strings with commas."""
+        value = section.get(key, default)
+
+        if len(value) > 1 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+
+        return value
+
+    def __init__(self, name: str = DEFAULT_PRESET) -> None:
+        """Initializes class attributes."""
+        self.name = name
+
+        self.channels_enabled = {channel: True for channel, *keys in MaterialNetworkPreset.CHANNELS_KEYS}
+        self.channels_suffixes = {channel: keys[-1] for channel, *keys in MaterialNetworkPreset.CHANNELS_KEYS}
+
+        self.case_sensitive = False
+        self.use_constant_textures = False
+        self.use_dg_modifier = False
+        self.use_existing_file_nodes = False
+        self.use_texture_name = True
+        self.use_triplanar = False
+
+    def set_material_network_settings(self, material_network: any) -> None:
+        """Sets the channels settings, the case sensitivity and the textures settings of the material network."""
+        for channel, *keys in MaterialNetworkPreset.CHANNELS_KEYS:
+            getattr(material_network, f'set_{channel}_settings')(
+                enabled=self.channels_enabled[channel],
+                suffix=self.channels_suffixes[channel])
+
+        material_network.set_case_sensitivity(self.case_sensitive)
+        material_network.set_use_constant_textures(self.use_constant_textures)
+        material_network.set_use_existing_file_nodes(self.use_existing_file_nodes)
@@ -0,0 +1,75 @@
+"""
+========================================================================================================================
+Name: network_backend.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from abc import abstractmethod
+from abc import ABC
+
+
+class NetworkBackend(ABC):
+    """Network backend.
+
+    Executes network plans: creates the nodes, attribute values and connections of the material networks. The nodes
+    are referenced by the handles returned by 'create_node', their final names are only known after 'apply'. The nodes
+    of the EXISTING kind are already in the scene, they are not created and are found by their name.
+
+    A backend missing one of the abstract methods can not be instantiated.
+    """
+    SHADER = 'shader'
+    TEXTURE = 'texture'
+    UTILITY = 'utility'
+    SHADING_ENGINE = 'shadingEngine'
+    EXISTING = 'existing'
+
+    def execute(self, plan: any) -> list:
+        """Executes the network plan.
+
+        Returns the names of the nodes created, indexed like the nodes of the plan.
+        """
+        nodes = [self.get_node_by_name(node.name) if node.kind == NetworkBackend.EXISTING else self.create_node(
+            node.node_type,
+            name=node.name,
+            kind=node.kind,
+            is_color_managed=node.is_color_managed) for node in plan.nodes]
+
+        for (node_index, attr), (value, attr_type) in plan.attributes.items():
+            self.set_attr(nodes[node_index], attr, value, attr_type=attr_type)
+
+        for (destination_index, destination_attr), (source_index, source_attr) in plan.edges.items():
+            self.connect_attr(nodes[source_index], source_attr, nodes[destination_index], destination_attr)
+
+        self.apply()
+
+        return [self.get_node_name(node) for node in nodes]
+
+    def apply(self) -> None:
+        """Applies the pending changes."""
+        pass
+
+    @abstractmethod
+    def connect_attr(self, source_node: any, source_attr: str, destination_node: any, destination_attr: str) -> None:
+        """Connects the source attribute to the destination attribute."""
+
+    @abstractmethod
+    def create_node(self, node_type: str, name: str, kind: str, is_color_managed: bool = False) -> any:
+        """Creates a node and returns its handle."""
+
+    @abstractmethod
+    def get_node_by_name(self, name: str) -> any:
+        """Gets the handle of a node of the scene by its name."""
+
+    @abstractmethod
+    def get_node_name(self, node: any) -> str:
+        """Gets the name of the node."""
+
+    @abstractmethod
+    def set_attr(self, node: any, attr: str, value: any, attr_type: str = None) -> None:
+        """Sets the value of the attribute.
+
+        Compound values such as 'double3' are given as a tuple.
+        """
@@ -0,0 +1,55 @@
+"""
+========================================================================================================================
+Name: network_backend_cmds.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import maya.cmds as cmds
+
+from maurice_texture_connector.core.network_backend import NetworkBackend
+
+
+class NetworkBackendCmds(NetworkBackend):
+    """Network backend cmds.
+
+    Runs every change immediately with maya.cmds, the handles are the node names.
+    """
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        super(NetworkBackendCmds, self).__init__()
+
+    def connect_attr(self, source_node: str, source_attr: str, destination_node: str, destination_attr: str) -> None:
+        """Connects the source attribute to the destination attribute."""
+        cmds.connectAttr(f'{source_node}.{source_attr}', f'{destination_node}.{destination_attr}', force=True)
+
+    def create_node(self, node_type: str, name: str, kind: str, is_color_managed: bool = False) -> str:
+        """Creates a node and returns its name."""
+        if kind == NetworkBackend.SHADING_ENGINE:
+            return cmds.sets(renderable=True, noSurfaceShader=True, empty=True, name=name)
+        elif kind == NetworkBackend.SHADER:
+            return cmds.shadingNode(node_type, asShader=True, name=name)
+        elif kind == NetworkBackend.TEXTURE:
+            return cmds.shadingNode(node_type, asTexture=True, isColorManaged=is_color_managed, name=name)
+        else:
+            return cmds.shadingNode(node_type, asUtility=True, name=name)
+
+    def get_node_by_name(self, name: str) -> str:
+        """Gets the node by its name, its handle."""
+        return name
+
+    def get_node_name(self, node: str) -> str:
+        """Gets the name of the node."""
+        return node
+
+    def set_attr(self, node: str, attr: str, value: any, attr_type: str = None) -> None:
+        """Sets the value of the attribute."""
+        values = value if isinstance(value, (list, tuple)) else (value,)
+
+        if attr_type:
+            cmds.setAttr(f'{node}.{attr}', *values, type=attr_type)
+        else:
+            cmds.setAttr(f'{node}.{attr}', *values)
@@ -0,0 +1,154 @@
+"""
+========================================================================================================================
+Name: network_backend_open_maya.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from maya.api.OpenMaya import MGlobal
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+import os
+
+from maurice_texture_connector.core.network_backend import NetworkBackend
+import maurice_texture_connector.utils as maurice_utils
+import maurice_texture_connector as maurice
+
+
+class NetworkBackendOpenMaya(NetworkBackend):
+    """Network backend OpenMaya.
+
+    Queues every node, attribute value and connection in a single MDGModifier and applies it with one doIt() through
+    the 'mgApplyDGModifier' command, so the whole network is a single undoable step. The handles are MObjects.
+    """
+    COMMAND_NAME = 'mgApplyDGModifier'
+    PLUGIN_NAME = 'mg_apply_dg_modifier.py'
+
+    # Connections made by 'shadingNode -isColorManaged': (defaultColorMgtGlobals attribute, file node attribute).
+    COLOR_MANAGEMENT_CONNECTIONS = (('cme', 'cme'), ('cfe', 'cmcf'), ('cfp', 'cmcp'), ('wsn', 'ws'))
+    COLOR_MANAGEMENT_NODE = 'defaultColorMgtGlobals'
+
+    # Lists the nodes are added to, as 'shadingNode' and 'sets -renderable' do.
+    DEFAULT_LISTS = {
+        NetworkBackend.SHADER: ('defaultShaderList1', 'shaders'),
+        NetworkBackend.TEXTURE: ('defaultTextureList1', 'textures'),
+        NetworkBackend.UTILITY: ('defaultRenderUtilityList1', 'utilities'),
+        NetworkBackend.SHADING_ENGINE: ('renderPartition', 'sets')
+    }
+
+    # Modifier waiting for the 'mgApplyDGModifier' command.
+    pending_modifier = None
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        super(NetworkBackendOpenMaya, self).__init__()
+
+        self.modifier = om.MDGModifier()
+        self.next_indices = {}
+
+    @staticmethod
+    def find_plug(node: om.MObject, attr: str) -> om.MPlug:
+        """Finds the plug of the attribute, 'attr' can be a compound path such as 'scale.scale0'."""
+        return om.MFnDependencyNode(node).findPlug(attr.split('.')[-1], False)
+
+    @staticmethod
+    def get_node_by_name(name: str) -> om.MObject:
+        """Gets the node by its name."""
+        selection_list = om.MSelectionList()
+        selection_list.add(name)
+
+        return selection_list.getDependNode(0)
+
+    @classmethod
+    def is_command_available(cls) -> bool:
+        """Checks if the 'mgApplyDGModifier' command is available, loading its plugin if needed."""
+        if not cmds.pluginInfo(cls.PLUGIN_NAME, query=True, loaded=True):
+            try:
+                cmds.loadPlugin(os.path.join(maurice_utils.get_plugins_folder_path(), cls.PLUGIN_NAME), quiet=True)
+            except RuntimeError:
+                return False
+
+        return hasattr(cmds, cls.COMMAND_NAME)
+
+    def add_to_default_list(self, node: om.MObject, kind: str) -> None:
+        """Connects the node to the default list of its kind."""
+        list_node_name, list_attr = NetworkBackendOpenMaya.DEFAULT_LISTS[kind]
+        list_plug = self.find_plug(self.get_node_by_name(list_node_name), list_attr)
+
+        if list_node_name not in self.next_indices:
+            indices = list_plug.getExistingArrayAttributeIndices()
+            self.next_indices[list_node_name] = max(indices) + 1 if indices else 0
+
+        index = self.next_indices[list_node_name]
+        self.next_indices[list_node_name] += 1
+
+        self.modifier.connect(self.find_plug(node, 'message'), list_plug.elementByLogicalIndex(index))
+
+    def apply(self) -> None:
+        """Applies the pending changes.
+
+        Falls back to a direct doIt(), which is not undoable, if the command plugin can not be loaded.
+        """
+        modifier = self.modifier
+
+        self.modifier = om.MDGModifier()
+        self.next_indices.clear()
+
+        if self.is_command_available():
+            NetworkBackendOpenMaya.pending_modifier = modifier
+            getattr(cmds, NetworkBackendOpenMaya.COMMAND_NAME)()
+        else:
+            MGlobal.displayWarning(
+                f'[{maurice.TEXTURE_CONNECTOR}] \'{NetworkBackendOpenMaya.PLUGIN_NAME}\' plugin could not be loaded, '
+                f'the material network is not undoable.')
+            modifier.doIt()
+
+    def connect_attr(self, source_node: om.MObject, source_attr: str, destination_node: om.MObject,
+                     destination_attr: str) -> None:
+        """Connects the source attribute to the destination attribute."""
+        destination_plug = self.find_plug(destination_node, destination_attr)
+
+        if destination_plug.isDestination:
+            self.modifier.disconnect(destination_plug.source(), destination_plug)
+
+        self.modifier.connect(self.find_plug(source_node, source_attr), destination_plug)
+
+    def create_node(self, node_type: str, name: str, kind: str, is_color_managed: bool = False) -> om.MObject:
+        """Creates a node and returns its MObject."""
+        node = self.modifier.createNode(node_type)
+        self.modifier.renameNode(node, name)
+
+        self.add_to_default_list(node, kind)
+
+        if is_color_managed:
+            color_management_node = self.get_node_by_name(NetworkBackendOpenMaya.COLOR_MANAGEMENT_NODE)
+
+            for source_attr, destination_attr in NetworkBackendOpenMaya.COLOR_MANAGEMENT_CONNECTIONS:
+                self.modifier.connect(
+                    self.find_plug(color_management_node, source_attr),
+                    self.find_plug(node, destination_attr))
+
+        return node
+
+    def get_node_name(self, node: om.MObject) -> str:
+        """Gets the name of the node."""
+        return om.MFnDependencyNode(node).name()
+
+    def set_attr(self, node: om.MObject, attr: str, value: any, attr_type: str = None) -> None:
+        """Sets the value of the attribute."""
+        plug = self.find_plug(node, attr)
+
+        if isinstance(value, (list, tuple)):
+            for i, child_value in enumerate(value):
+                self.modifier.newPlugValueDouble(plug.child(i), child_value)
+        elif attr_type == 'string' or isinstance(value, str):
+            self.modifier.newPlugValueString(plug, value)
+        elif isinstance(value, bool):
+            self.modifier.newPlugValueBool(plug, value)
+        elif isinstance(value, int):
+            self.modifier.newPlugValueInt(plug, value)
+        else:
+            self.modifier.newPlugValueDouble(plug, value)
@@ -0,0 +1,110 @@
+"""
+========================================================================================================================
+Name: network_plan.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from collections import namedtuple
+import difflib
+
+from maurice_texture_connector.core.network_backend import NetworkBackend
+
+
+PlanNode = namedtuple('PlanNode', ('index', 'node_type', 'name', 'kind', 'is_color_managed'))
+
+
+class NetworkPlan(object):
+    """Network plan.
+
+    Pure data description of material networks: the nodes to create, the attribute values to set and the connections
+    to make. It does not touch Maya, a NetworkBackend executes it. The nodes are referenced by the PlanNode returned by
+    'create_node', those of the NetworkBackend.EXISTING kind are nodes already in the scene. Setting an attribute or
+    connecting a destination twice keeps only the last value or source, as 'setAttr' and 'connectAttr -force' would.
+    """
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        self.nodes = []
+
+        # {(node index, attr): (value, attr type)}
+        self.attributes = {}
+
+        # {(destination node index, destination attr): (source node index, source attr)}
+        self.edges = {}
+
+    def __eq__(self, other: any) -> bool:
+        """Checks if both plans describe the same networks."""
+        if not isinstance(other, NetworkPlan):
+            return NotImplemented
+
+        return self.nodes == other.nodes and self.attributes == other.attributes and self.edges == other.edges
+
+    def __len__(self) -> int:
+        """Gets the number of nodes of the plan."""
+        return len(self.nodes)
+
+    def connect_attr(self, source_node: PlanNode, source_attr: str, destination_node: PlanNode,
+                     destination_attr: str) -> None:
+        """Plans the connection of the source attribute to the destination attribute."""
+        self.edges[(destination_node.index, destination_attr)] = (source_node.index, source_attr)
+
+    def create_node(self, node_type: str, name: str, kind: str, is_color_managed: bool = False) -> PlanNode:
+        """Plans a node and returns it."""
+        node = PlanNode(len(self.nodes), node_type, name, kind, is_color_managed)
+        self.nodes.append(node)
+
+        return node
+
+    def diff(self, other: 'NetworkPlan') -> list:
+        """Gets the unified diff between the lines of both plans."""
+        return list(difflib.unified_diff(self.get_lines(), other.get_lines(), lineterm=''))
+
+    def extend(self, other: 'NetworkPlan') -> int:
+        """Appends the nodes, attributes and connections of the other plan.
+
+        Returns the offset added to the indices of the other plan nodes.
+        """
+        offset = len(self.nodes)
+
+        for node in other.nodes:
+            self.nodes.append(node._replace(index=node.index + offset))
+
+        for (node_index, attr), value in other.attributes.items():
+            self.attributes[(node_index + offset, attr)] = value
+
+        for (destination_index, destination_attr), (source_index, source_attr) in other.edges.items():
+            self.edges[(destination_index + offset, destination_attr)] = (source_index + offset, source_attr)
+
+        return offset
+
+    def get_lines(self) -> list:
+        """Gets a readable line for every node, attribute and connection of the plan, used by dry runs and diffs."""
+        lines = []
+
+        for node in self.nodes:
+            if node.kind == NetworkBackend.EXISTING:
+                lines.append(f'reuse {node.node_type} {node.name}')
+                continue
+
+            color_managed = ' (color managed)' if node.is_color_managed else ''
+            lines.append(f'create {node.kind} {node.node_type} {node.name}{color_managed}')
+
+        for (node_index, attr), (value, attr_type) in self.attributes.items():
+            lines.append(f'set {self.nodes[node_index].name}.{attr} = {value!r}')
+
+        for (destination_index, destination_attr), (source_index, source_attr) in self.edges.items():
+            lines.append(
+                f'connect {self.nodes[source_index].name}.{source_attr} -> '
+                f'{self.nodes[destination_index].name}.{destination_attr}')
+
+        return lines
+
+    def set_attr(self, node: PlanNode, attr: str, value: any, attr_type: str = None) -> None:
+        """Plans the value of the attribute.
+
+        Compound values such as 'double3' are given as a tuple.
+        """
+        self.attributes[(node.index, attr)] = (value, attr_type)
@@ -0,0 +1,55 @@
+"""
+========================================================================================================================
+Name: text_filter_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+
+
+class TextFilterIndex(object):
+    """Text filter index.
+
+    Case-insensitive substring filter over a list of texts, returning the ids (positions) of the texts containing the
+    query. The texts are lowercased once, and a query extending the previous one, as when typing, only tests the
+    previous matches instead of every text.
+    """
+
+    def __init__(self, texts: list = ()) -> None:
+        """Initializes class attributes."""
+        self.texts = []
+
+        self.last_query = ''
+        self.last_ids = set()
+
+        self.set_texts(texts)
+
+    def __len__(self) -> int:
+        """Gets the number of texts."""
+        return len(self.texts)
+
+    def filter(self, query: str) -> set:
+        """Gets the ids of the texts containing the query."""
+        query = query.lower()
+
+        if not query:
+            ids = set(range(len(self.texts)))
+        elif self.last_query and self.last_query in query:
+            texts = self.texts
+            ids = {text_id for text_id in self.last_ids if query in texts[text_id]}
+        else:
+            ids = {text_id for text_id, text in enumerate(self.texts) if query in text}
+
+        self.last_query = query
+        self.last_ids = ids
+
+        return ids
+
+    def set_texts(self, texts: list) -> None:
+        """Sets the texts, replacing the previous ones."""
+        self.texts = [text.lower() for text in texts]
+
+        self.last_query = ''
+        self.last_ids = set()
@@ -0,0 +1,181 @@
+"""
+========================================================================================================================
+Name: texture_memory_report.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import maya.cmds as cmds
+
+from collections import namedtuple
+import os
+
+from maurice_texture_connector.core.texture_set_index import TextureSetIndex
+import maurice_texture_connector.utils as maurice_utils
+
+
+# 'paths' are the images loaded for the file node, the tiles of a UDIM texture, and 'memory' their total in bytes.
+TextureMemory = namedtuple(
+    'TextureMemory',
+    ('file_node', 'file_texture_name', 'paths', 'missing_tiles', 'image_header', 'memory', 'mipmapped_memory'))
+
+
+class TextureMemoryReport(object):
+    """Texture memory report.
+
+    Estimates the memory the textures of the file nodes of the scene take once loaded uncompressed, with and without
+    their mip levels, from the headers of their images. Every tile of a UDIM texture is counted, and an image used by
+    several file nodes is counted once in the totals. The headers are read in a thread pool and cached by
+    maurice_utils.get_image_header.
+    """
+    LARGEST_TEXTURES = 10
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        # [TextureMemory]
+        self.textures = []
+
+        # {material: [file nodes]}
+        self.materials = {}
+
+        # {path: (memory, mipmapped memory)}
+        self.images_memory = {}
+
+    def build(self) -> None:
+        """Builds the report of the file nodes of the scene."""
+        with maurice_utils.TimingSpan('texture_memory_report'):
+            project_path = cmds.workspace(rootDirectory=True, query=True)
+            file_nodes_paths = []
+
+            for file_node in cmds.ls(type='file'):
+                file_texture_name = cmds.getAttr(f'{file_node}.fileTextureName')
+
+                if file_texture_name:
+                    paths, missing_tiles = self.get_file_node_paths(
+                        file_texture_name=file_texture_name,
+                        uv_tiling_mode=cmds.getAttr(f'{file_node}.uvTilingMode'),
+                        project_path=project_path)
+
+                    file_nodes_paths.append((file_node, file_texture_name, paths, missing_tiles))
+
+            images_headers = maurice_utils.get_images_headers(
+                [path for _, _, paths, _ in file_nodes_paths for path in paths])
+
+            self.images_memory = {path: maurice_utils.get_image_memory(image_header)
+                                  for path, image_header in images_headers.items() if image_header}
+            self.textures = []
+
+            for file_node, file_texture_name, paths, missing_tiles in file_nodes_paths:
+                images_memory = [self.images_memory.get(path, (0, 0)) for path in paths]
+
+                self.textures.append(TextureMemory(
+                    file_node=file_node,
+                    file_texture_name=file_texture_name,
+                    paths=paths,
+                    missing_tiles=missing_tiles,
+                    image_header=next((images_headers[path] for path in paths if images_headers.get(path)), None),
+                    memory=sum(memory for memory, _ in images_memory),
+                    mipmapped_memory=sum(mipmapped_memory for _, mipmapped_memory in images_memory)))
+
+            self.materials = {}
+
+            file_nodes = {texture.file_node for texture in self.textures}
+
+            for material in cmds.ls(materials=True):
+                material_file_nodes = [node for node in cmds.listHistory(material) or [] if node in file_nodes]
+
+                if material_file_nodes:
+                    self.materials[material] = material_file_nodes
+
+    def format(self, count: int = LARGEST_TEXTURES) -> str:
+        """Formats the totals and the 'count' largest textures, materials and directories."""
+        memory, mipmapped_memory = self.get_total_memory()
+        lines = [f'Textures: {len(self.textures)}, images: {len(self.images_memory)}, '
+                 f'memory: {maurice_utils.format_memory_size(memory)}, '
+                 f'mipmapped: {maurice_utils.format_memory_size(mipmapped_memory)}']
+
+        for title, rows in (
+                ('Largest textures', [(texture.file_node, texture.memory, texture.mipmapped_memory)
+                                      for texture in self.get_largest_textures(count)]),
+                ('Largest materials', self.get_materials_memory()[:count]),
+                ('Largest directories', self.get_directories_memory()[:count])):
+            lines.append(f'{title}:')
+            lines.extend(f'    {name}: {maurice_utils.format_memory_size(memory)} '
+                         f'({maurice_utils.format_memory_size(mipmapped_memory)} mipmapped)'
+                         for name, memory, mipmapped_memory in rows)
+
+        unread_textures = [texture.file_node for texture in self.textures if not texture.image_header]
+
+        if unread_textures:
+            lines.append(f'Not read: {", ".join(unread_textures)}')
+
+        return '\n'.join(lines)
+
+    def get_directories_memory(self) -> list:
+        """Gets the (directory, memory, mipmapped memory) of the directories of the images, the largest first."""
+        directories_memory = {}
+
+        for path, (memory, mipmapped_memory) in self.images_memory.items():
+            directory_memory = directories_memory.setdefault(os.path.dirname(path), [0, 0])
+            directory_memory[0] += memory
+            directory_memory[1] += mipmapped_memory
+
+        return sorted(((directory, memory, mipmapped_memory)
+                       for directory, (memory, mipmapped_memory) in directories_memory.items()),
+                      key=lambda directory_memory: -directory_memory[2])
+
+    @staticmethod
+    def get_file_node_paths(file_texture_name: str, uv_tiling_mode: int, project_path: str) -> tuple:
+        """Gets the (images paths, missing tiles) of a file node.
+
+        The tiles of a sequence are all loaded for a UDIM file node, a frame sequence only loads one frame at a time.
+        """
+        path = os.path.expandvars(file_texture_name)
+
+        if not os.path.isabs(path) and project_path:
+            path = os.path.join(project_path, path)
+
+        path = path.replace('\\', '/')
+        is_sequence_pattern = maurice_utils.is_sequence_pattern(os.path.basename(path))
+
+        if not uv_tiling_mode and not is_sequence_pattern:
+            return [path], []
+
+        sequence = TextureSetIndex.get_index(os.path.dirname(path)).get_sequence(path)
+
+        if not sequence:
+            return ([] if is_sequence_pattern else [path]), []
+        elif not uv_tiling_mode and not sequence.is_udim:
+            return [sequence.path], []
+
+        return maurice_utils.get_sequence_paths(sequence), maurice_utils.get_missing_tiles(sequence)
+
+    def get_largest_textures(self, count: int = LARGEST_TEXTURES) -> list:
+        """Gets the 'count' textures taking the most memory."""
+        return sorted(self.textures, key=lambda texture: -texture.mipmapped_memory)[:count]
+
+    def get_materials_memory(self) -> list:
+        """Gets the (material, memory, mipmapped memory) of the materials, the largest first.
+
+        An image used by several file nodes of a material is counted once.
+        """
+        textures_paths = {texture.file_node: texture.paths for texture in self.textures}
+        materials_memory = []
+
+        for material, file_nodes in self.materials.items():
+            paths = {path for file_node in file_nodes for path in textures_paths[file_node]}
+            images_memory = [self.images_memory.get(path, (0, 0)) for path in paths]
+
+            materials_memory.append((
+                material,
+                sum(memory for memory, _ in images_memory),
+                sum(mipmapped_memory for _, mipmapped_memory in images_memory)))
+
+        return sorted(materials_memory, key=lambda material_memory: -material_memory[2])
+
+    def get_total_memory(self) -> tuple:
+        """Gets the (memory, mipmapped memory) of all the images, each counted once."""
+        return (sum(memory for memory, _ in self.images_memory.values()),
+                sum(mipmapped_memory for _, mipmapped_memory in self.images_memory.values()))
@@ -0,0 +1,244 @@
+"""
+========================================================================================================================
+Name: texture_set_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from pathlib import Path
+import os
+
+import maurice_texture_connector.utils as maurice_utils
+
+
+class TextureSetIndex(object):
+    """Texture set index.
+
+    Scans a directory once and groups its images by texture set:
+    {base_name: {channel: [paths], 'udim_tiles': [tiles]}}. The index stays valid until the directory's mtime changes.
+
+    The tiles and frames of a sequence are collapsed into a single image when the directory is scanned, named with
+    '<UDIM>' or '#' in place of the number, so the channels are matched once per sequence and a texture set only has
+    the path of the first tile of each of them.
+    """
+    UDIM_TILES = 'udim_tiles'
+
+    indexes = {}
+
+    @classmethod
+    def get_index(cls, directory: str) -> 'TextureSetIndex':
+        """Gets the index of the directory, scanning it again only if it changed."""
+        directory = os.path.normpath(directory)
+        texture_set_index = cls.indexes.get(directory)
+
+        if not texture_set_index or not texture_set_index.is_valid():
+            texture_set_index = cls(directory)
+            texture_set_index.scan()
+
+            cls.indexes[directory] = texture_set_index
+
+        return texture_set_index
+
+    @classmethod
+    def clear_indexes(cls) -> None:
+        """Clears all the indexes."""
+        cls.indexes.clear()
+
+    def __init__(self, directory: str) -> None:
+        """Initializes class attributes."""
+        self.directory = directory
+        self.mtime = None
+
+        self.file_names = set()
+        self.folders = []
+        self.images = []
+
+        # {sequence key: TextureSequence}
+        self.sequences = {}
+
+        # Texture sets by (channels suffixes, case sensitive).
+        self.texture_sets = {}
+        self.files_channels = {}
+
+    @staticmethod
+    def get_directory_mtime(directory: str) -> any:
+        """Gets the directory mtime, or None if it does not exist.
+
+        The stat is cached for a few seconds, see maurice_utils.get_cached_stat.
+        """
+        stat = maurice_utils.get_cached_stat(directory)
+
+        return stat.st_mtime_ns if stat else None
+
+    @staticmethod
+    def get_file_name_key(file_name: str) -> str:
+        """Gets the key used to look up a file name."""
+        return file_name.lower() if os.name == 'nt' else file_name
+
+    def classify(self, channels_suffixes: tuple, case_sensitive: bool) -> None:
+        """Classifies the images of the directory into texture sets."""
+        texture_sets = {}
+        files_channels = {}
+        base_names = {}
+
+        for file_entry in self.images:
+            file_stem = Path(file_entry.path).stem
+            file_stem, *digits_suffix = file_stem.rsplit('.', 1)
+
+            if digits_suffix and not digits_suffix[0].isdigit():
+                file_stem = f'{file_stem}.{digits_suffix[0]}'
+                digits_suffix = []
+
+            channel, base_name = maurice_utils.match_texture_channel(
+                file_stem=file_stem,
+                channels_suffixes=channels_suffixes,
+                case_sensitive=case_sensitive)
+
+            if not channel:
+                continue
+
+            base_name_key = base_name if case_sensitive else base_name.lower()
+            base_name = base_names.setdefault(base_name_key, base_name)
+
+            texture_set = texture_sets.setdefault(base_name, {TextureSetIndex.UDIM_TILES: []})
+            texture_set.setdefault(channel, []).append(file_entry.path)
+
+            if digits_suffix:
+                sequence = self.get_sequence(file_entry.path)
+                udim_tiles = maurice_utils.get_sequence_tiles(sequence) if sequence else [int(digits_suffix[0])]
+                texture_set_udim_tiles = texture_set[TextureSetIndex.UDIM_TILES]
+
+                texture_set_udim_tiles.extend(set(udim_tiles).difference(texture_set_udim_tiles))
+
+            files_channels[self.get_sequence_key(file_entry.name)] = channel
+
+        for texture_set in texture_sets.values():
+            for value in texture_set.values():
+                value.sort()
+
+        self.texture_sets[(channels_suffixes, case_sensitive)] = (texture_sets, base_names)
+        self.files_channels[(channels_suffixes, case_sensitive)] = files_channels
+
+    def collapse_sequences(self, images: list) -> list:
+        """Collapses the numbered images of each sequence into one image, keeping the sequences found.
+
+        The image of a sequence of several files is named like the sequence pattern, its path is the one of the first
+        file, its size the total one and its mtime the latest one. The files of a numbering too sparse to be a sequence
+        are kept as they are.
+        """
+        files_numbers = {}
+        sequences_images = {}
+        collapsed_images = []
+
+        for file_entry in images:
+            number = Path(file_entry.name).stem.rpartition('.')[2]
+
+            if not number.isdigit():
+                collapsed_images.append(file_entry)
+                continue
+
+            sequence_key = self.get_sequence_key(file_entry.name)
+            files_numbers.setdefault(sequence_key, []).append((int(number), file_entry.name, file_entry.path))
+            sequences_images.setdefault(sequence_key, []).append(file_entry)
+
+        self.sequences = maurice_utils.get_texture_sequences(files_numbers)
+
+        for sequence_key, file_entries in sequences_images.items():
+            if len(file_entries) == 1 or sequence_key not in self.sequences:
+                collapsed_images.extend(file_entries)
+                continue
+
+            sequence = self.sequences[sequence_key]
+            collapsed_images.append(maurice_utils.FileEntry(
+                sequence.pattern,
+                sequence.path,
+                sum(file_entry.size for file_entry in file_entries),
+                max(file_entry.mtime for file_entry in file_entries)))
+
+        return collapsed_images
+
+    def exists(self) -> bool:
+        """Checks if the directory existed when it was scanned."""
+        return self.mtime is not None
+
+    def get_file_channel(self, file_path: str, channels_suffixes: tuple, case_sensitive: bool) -> str:
+        """Gets the channel of an image of the directory, or '' if it does not match any suffix."""
+        if (channels_suffixes, case_sensitive) not in self.files_channels:
+            self.classify(channels_suffixes, case_sensitive)
+
+        files_channels = self.files_channels[(channels_suffixes, case_sensitive)]
+
+        return files_channels.get(self.get_sequence_key(os.path.basename(file_path)), '')
+
+    def get_sequence(self, file_path: str) -> any:
+        """Gets the TextureSequence of a file of the directory, or of a sequence pattern, None if it has none."""
+        return self.sequences.get(self.get_sequence_key(os.path.basename(file_path)))
+
+    def get_sequence_key(self, file_name: str) -> str:
+        """Gets the key used to look up the sequence of a file name, the file name key if it has no number."""
+        return self.get_file_name_key(maurice_utils.get_sequence_key(file_name))
+
+    def get_texture_set(self, base_name: str, channels_suffixes: tuple, case_sensitive: bool) -> dict:
+        """Gets the texture set of a base name."""
+        texture_sets, base_names = self.get_texture_sets_and_base_names(channels_suffixes, case_sensitive)
+        base_name = base_names.get(base_name if case_sensitive else base_name.lower(), base_name)
+
+        return texture_sets.get(base_name, {})
+
+    def get_texture_sets(self, channels_suffixes: tuple, case_sensitive: bool) -> dict:
+        """Gets the texture sets of the directory."""
+        texture_sets, base_names = self.get_texture_sets_and_base_names(channels_suffixes, case_sensitive)
+
+        return texture_sets
+
+    def get_texture_sets_and_base_names(self, channels_suffixes: tuple, case_sensitive: bool) -> tuple:
+        """Gets the texture sets and the base names lookup of the directory."""
+        if (channels_suffixes, case_sensitive) not in self.texture_sets:
+            self.classify(channels_suffixes, case_sensitive)
+
+        return self.texture_sets[(channels_suffixes, case_sensitive)]
+
+    def has_file(self, file_path: str) -> bool:
+        """Checks if the file is in the directory, or if at least one file of a sequence pattern is."""
+        file_name = os.path.basename(file_path)
+
+        if maurice_utils.is_sequence_pattern(file_name):
+            return self.get_sequence(file_path) is not None
+
+        return self.get_file_name_key(file_name) in self.file_names
+
+    def is_valid(self) -> bool:
+        """Checks if the directory has not changed since it was scanned."""
+        return self.mtime is not None and self.mtime == self.get_directory_mtime(self.directory)
+
+    def scan(self) -> None:
+        """Scans the directory."""
+        self.mtime = self.get_directory_mtime(self.directory)
+
+        self.file_names.clear()
+        self.folders.clear()
+        self.images.clear()
+        self.sequences.clear()
+        self.texture_sets.clear()
+        self.files_channels.clear()
+
+        if self.mtime is None:
+            return
+
+        for file_entry in maurice_utils.scan_folder(
+                path=self.directory,
+                extensions=maurice_utils.IMAGE_EXTENSIONS,
+                include_unmatched=True,
+                include_folders=True):
+            if file_entry.is_folder:
+                self.folders.append(file_entry)
+                continue
+
+            self.file_names.add(self.get_file_name_key(file_entry.name))
+
+            if file_entry.mtime is not None:
+                self.images.append(file_entry)
+
+        self.images = self.collapse_sequences(self.images)
@@ -0,0 +1,69 @@
+"""
+========================================================================================================================
+Name: mg_apply_dg_modifier.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import maya.api.OpenMaya as om
+
+from maurice_texture_connector.core.network_backend_open_maya import NetworkBackendOpenMaya
+import maurice_texture_connector as maurice
+
+
+def maya_useNewAPI() -> None:
+    """Tells Maya the plugin uses the Python API 2.0."""
+    pass
+
+
+class ApplyDGModifierCommand(om.MPxCommand):
+    """Apply DG modifier command.
+
+    Applies the modifier queued by NetworkBackendOpenMaya and keeps it to undo and redo it.
+    """
+    COMMAND_NAME = NetworkBackendOpenMaya.COMMAND_NAME
+
+    def __init__(self) -> None:
+        """Initializes class attributes."""
+        super(ApplyDGModifierCommand, self).__init__()
+
+        self.modifier = None
+
+    @staticmethod
+    def creator() -> 'ApplyDGModifierCommand':
+        """Creates the command."""
+        return ApplyDGModifierCommand()
+
+    def doIt(self, args: om.MArgList) -> None:
+        """Takes the pending modifier and applies it."""
+        self.modifier = NetworkBackendOpenMaya.pending_modifier
+        NetworkBackendOpenMaya.pending_modifier = None
+
+        if self.modifier:
+            self.redoIt()
+
+    def isUndoable(self) -> bool:
+        """Checks if the command is undoable."""
+        return self.modifier is not None
+
+    def redoIt(self) -> None:
+        """Applies the modifier."""
+        self.modifier.doIt()
+
+    def undoIt(self) -> None:
+        """Undoes the modifier."""
+        self.modifier.undoIt()
+
+
+def initializePlugin(plugin: om.MObject) -> None:
+    """Initializes the plugin."""
+    plugin_fn = om.MFnPlugin(plugin, maurice.AUTHOR, maurice.VERSION)
+    plugin_fn.registerCommand(ApplyDGModifierCommand.COMMAND_NAME, ApplyDGModifierCommand.creator)
+
+
+def uninitializePlugin(plugin: om.MObject) -> None:
+    """Uninitializes the plugin."""
+    plugin_fn = om.MFnPlugin(plugin)
+    plugin_fn.deregisterCommand(ApplyDGModifierCommand.COMMAND_NAME)
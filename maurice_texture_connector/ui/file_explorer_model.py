@@ -0,0 +1,310 @@
+"""
+========================================================================================================================
+Name: file_explorer_model.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+try:
+    from PySide6 import QtCore
+    from PySide6 import QtGui
+except ImportError:
+    from PySide2 import QtCore
+    from PySide2 import QtGui
+
+import os
+
+from maurice_texture_connector.core.texture_set_index import TextureSetIndex
+import maurice_texture_connector.utils as maurice_utils
+
+
+class FileExplorerItem(object):
+    """File explorer item."""
+
+    def __init__(self, name: str, path: str, is_folder: bool, parent: 'FileExplorerItem' = None, row: int = 0) -> None:
+        """Initializes class attributes."""
+        self.name = name
+        self.path = path
+        self.is_folder = is_folder
+        self.parent = parent
+        self.row = row
+
+        self.children = []
+        self.is_expanded = False
+        self.is_fetched = not is_folder
+        self.is_fetching = False
+
+
+class DirectoryListingWorkerSignals(QtCore.QObject):
+    """Directory listing worker signals."""
+    # Generation, directory, [FileEntry].
+    directory_listed = QtCore.Signal(int, str, list)
+
+
+class DirectoryListingWorker(QtCore.QRunnable):
+    """Directory listing worker.
+
+    Lists the folders and images of a directory off the main thread, through the texture set index, so the channel
+    filters find the directory already indexed.
+    """
+    FOLDERS_IGNORED = ('.mayaSwatches', '.vrayThumbs')
+
+    def __init__(self, generation: int, directory: str) -> None:
+        """Initializes class attributes."""
+        super(DirectoryListingWorker, self).__init__()
+
+        self.setAutoDelete(False)
+
+        self.generation = generation
+        self.directory = directory
+
+        self.signals = DirectoryListingWorkerSignals()
+
+    def run(self) -> None:
+        """Lists the directory."""
+        texture_set_index = TextureSetIndex.get_index(self.directory)
+
+        entries = [folder for folder in texture_set_index.folders
+                   if folder.name not in DirectoryListingWorker.FOLDERS_IGNORED]
+        entries.extend(texture_set_index.images)
+        entries.sort(key=lambda entry: entry.name.lower())
+
+        self.signals.directory_listed.emit(self.generation, self.directory, entries)
+
+
+class FileExplorerModel(QtCore.QAbstractItemModel):
+    """File explorer model.
+
+    Tree of the folders and images under a root path. A folder is only listed when the view asks for its children,
+    on fetchMore, and the listing runs in a DirectoryListingWorker.
+    """
+
+    def __init__(self, icons: dict, parent: QtCore.QObject = None) -> None:
+        """Initializes class attributes."""
+        super(FileExplorerModel, self).__init__(parent)
+
+        self.folder_icon = QtGui.QIcon(icons['folder.png'])
+        self.folder_open_icon = QtGui.QIcon(icons['folder-open.png'])
+        self.picture_icon = QtGui.QIcon(icons['picture.png'])
+
+        self.root_item = FileExplorerItem(name='', path='', is_folder=True)
+        self.root_item.is_fetched = True
+
+        # Drops the listings of a previous root path.
+        self.generation = 0
+
+        # {directory: (item, worker)}
+        self.fetching_items = {}
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        """Checks if the folder was not listed yet."""
+        item = self.get_item(parent)
+
+        return item.is_folder and not item.is_fetched and not item.is_fetching
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """Gets the number of columns."""
+        return 1
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> any:
+        """Gets the data of the index."""
+        if not index.isValid():
+            return None
+
+        item = index.internalPointer()
+
+        if role == QtCore.Qt.DisplayRole:
+            return item.name
+        elif role == QtCore.Qt.DecorationRole:
+            if item.is_folder:
+                return self.folder_open_icon if item.is_expanded else self.folder_icon
+
+            return self.picture_icon
+        elif role == QtCore.Qt.ToolTipRole:
+            if item.is_folder:
+                return None
+
+            sequence = TextureSetIndex.get_index(os.path.dirname(item.path)).get_sequence(item.path)
+            image_header = maurice_utils.get_image_header(item.path)
+            tool_tip = []
+
+            if image_header:
+                tool_tip.append(maurice_utils.format_image_header(image_header))
+
+                if maurice_utils.is_large_image(image_header):
+                    tool_tip.append(f'Larger than {maurice_utils.LARGE_IMAGE_SIZE} pixels.')
+
+            if sequence:
+                tool_tip.append(maurice_utils.format_sequence(sequence))
+
+            return '\n'.join(tool_tip) or None
+        elif role == QtCore.Qt.UserRole:
+            return item.path
+
+        return None
+
+    def directory_listed(self, generation: int, directory: str, entries: list) -> None:
+        """Inserts the entries listed by a worker under their folder item."""
+        if generation != self.generation or directory not in self.fetching_items:
+            return
+
+        item, worker = self.fetching_items.pop(directory)
+        item.is_fetching = False
+        item.is_fetched = True
+
+        if not entries:
+            # Removes the expand arrow of empty folders.
+            self.dataChanged.emit(self.get_index(item), self.get_index(item))
+            return
+
+        self.beginInsertRows(self.get_index(item), 0, len(entries) - 1)
+
+        for row, entry in enumerate(entries):
+            item.children.append(FileExplorerItem(
+                name=entry.name,
+                path=entry.path,
+                is_folder=entry.is_folder,
+                parent=item,
+                row=row))
+
+        self.endInsertRows()
+
+    def fetch_item(self, item: FileExplorerItem) -> None:
+        """Lists the folder of the item in a worker."""
+        item.is_fetching = True
+
+        worker = DirectoryListingWorker(generation=self.generation, directory=item.path)
+        worker.signals.directory_listed.connect(self.directory_listed)
+
+        self.fetching_items[item.path] = (item, worker)
+
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def fetchMore(self, parent: QtCore.QModelIndex) -> None:
+        """Lists the folder of the index."""
+        item = self.get_item(parent)
+
+        if item.is_folder and not item.is_fetched and not item.is_fetching:
+            self.fetch_item(item)
+
+    def get_index(self, item: FileExplorerItem) -> QtCore.QModelIndex:
+        """Gets the index of the item."""
+        if item is self.root_item:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(item.row, 0, item)
+
+    def get_item(self, index: QtCore.QModelIndex) -> FileExplorerItem:
+        """Gets the item of the index, the root item for an invalid index."""
+        return index.internalPointer() if index.isValid() else self.root_item
+
+    def get_root_path(self) -> str:
+        """Gets the root path."""
+        return self.root_item.path
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        """Checks if the index has children, folders not listed yet are assumed to have them."""
+        item = self.get_item(parent)
+
+        if not item.is_folder:
+            return False
+
+        return not item.is_fetched or bool(item.children)
+
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        """Gets the index of the row."""
+        item = self.get_item(parent)
+
+        if column != 0 or row < 0 or row >= len(item.children):
+            return QtCore.QModelIndex()
+
+        return self.createIndex(row, column, item.children[row])
+
+    def parent(self, index: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        """Gets the parent of the index."""
+        if not index.isValid():
+            return QtCore.QModelIndex()
+
+        return self.get_index(index.internalPointer().parent)
+
+    def refresh(self) -> None:
+        """Lists the root path again, collapsing the tree."""
+        self.set_root_path(self.root_item.path)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """Gets the number of rows listed under the index."""
+        if parent.column() > 0:
+            return 0
+
+        return len(self.get_item(parent).children)
+
+    def set_expanded(self, index: QtCore.QModelIndex, expanded: bool) -> None:
+        """Sets if the folder of the index is expanded, to update its icon."""
+        if index.isValid():
+            index.internalPointer().is_expanded = expanded
+            self.dataChanged.emit(index, index, [QtCore.Qt.DecorationRole])
+
+    def set_root_path(self, path: str) -> None:
+        """Sets the root path, listing it if it exists."""
+        self.beginResetModel()
+
+        self.generation += 1
+        self.fetching_items.clear()
+
+        self.root_item = FileExplorerItem(name=os.path.basename(path), path=path, is_folder=True)
+        self.root_item.is_fetched = not (path and os.path.isdir(path))
+
+        self.endResetModel()
+
+        if not self.root_item.is_fetched:
+            self.fetch_item(self.root_item)
+
+
+class FileExplorerFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """File explorer filter proxy model.
+
+    Filters the file explorer by name and by channel without listing the folders again.
+    """
+
+    def __init__(self, parent: QtCore.QObject = None) -> None:
+        """Initializes class attributes."""
+        super(FileExplorerFilterProxyModel, self).__init__(parent)
+
+        self.case_sensitive = False
+        self.channel_filter = ''
+        self.channels_suffixes = ()
+        self.text_filter = ''
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
+        """Checks if the row passes the name and channel filters."""
+        item = self.sourceModel().index(source_row, 0, source_parent).internalPointer()
+
+        if self.text_filter and self.text_filter not in item.name.lower():
+            return False
+
+        if self.channel_filter and not item.is_folder:
+            texture_set_index = TextureSetIndex.get_index(os.path.dirname(item.path))
+            file_channel = texture_set_index.get_file_channel(
+                file_path=item.path,
+                channels_suffixes=self.channels_suffixes,
+                case_sensitive=self.case_sensitive)
+
+            return file_channel == self.channel_filter
+
+        return True
+
+    def set_channel_filter(self, channel: str, channels_suffixes: tuple, case_sensitive: bool) -> None:
+        """Sets the channel the images are filtered by, '' to show all of them."""
+        self.case_sensitive = case_sensitive
+        self.channel_filter = channel
+        self.channels_suffixes = channels_suffixes
+
+        self.invalidateFilter()
+
+    def set_text_filter(self, text: str) -> None:
+        """Sets the text the names are filtered by."""
+        self.text_filter = text.lower()
+
+        self.invalidateFilter()
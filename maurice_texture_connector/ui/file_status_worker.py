@@ -0,0 +1,75 @@
+"""
+========================================================================================================================
+Name: file_status_worker.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+try:
+    from PySide6 import QtCore
+except ImportError:
+    from PySide2 import QtCore
+
+from maurice_texture_connector.core.texture_set_index import TextureSetIndex
+
+
+class FileStatusWorkerSignals(QtCore.QObject):
+    """File status worker signals.
+
+    Created in the main thread, so the results are delivered to the main thread.
+    """
+    # Generation, [(file path, exists, TextureSequence or None)].
+    files_resolved = QtCore.Signal(int, list)
+
+
+class FileStatusWorker(QtCore.QRunnable):
+    """File status worker.
+
+    Resolves the existence of the files of every directory off the main thread, through the texture set index, and
+    sends the results back in batches. The files named with a tile or frame token exist if one of their files does.
+    """
+    BATCH_SIZE = 64
+
+    def __init__(self, generation: int, directories_files: dict) -> None:
+        """Initializes class attributes.
+
+        'directories_files' is {directory: [file paths]}, 'generation' identifies the files tree the results belong to.
+        """
+        super(FileStatusWorker, self).__init__()
+
+        self.setAutoDelete(False)
+
+        self.generation = generation
+        self.directories_files = directories_files
+        self.is_cancelled = False
+
+        self.signals = FileStatusWorkerSignals()
+
+    def cancel(self) -> None:
+        """Cancels the worker, the results not sent yet are dropped."""
+        self.is_cancelled = True
+
+    def run(self) -> None:
+        """Resolves the files existence."""
+        files_status = []
+
+        for directory, file_paths in self.directories_files.items():
+            if self.is_cancelled:
+                return
+
+            texture_set_index = TextureSetIndex.get_index(directory)
+
+            for file_path in file_paths:
+                files_status.append((
+                    file_path,
+                    texture_set_index.has_file(file_path),
+                    texture_set_index.get_sequence(file_path)))
+
+            if len(files_status) >= FileStatusWorker.BATCH_SIZE:
+                self.signals.files_resolved.emit(self.generation, files_status)
+                files_status = []
+
+        if files_status and not self.is_cancelled:
+            self.signals.files_resolved.emit(self.generation, files_status)
@@ -76,6 +76,9 @@ from maurice_texture_connector.ui.maurice_qt.spin_box import QSpinBox
 # splitter.py
 from maurice_texture_connector.ui.maurice_qt.splitter import QSplitter
 
+# tree_view.py
+from maurice_texture_connector.ui.maurice_qt.tree_view import QTreeView
+
 # tree_widget.py
 from maurice_texture_connector.ui.maurice_qt.tree_widget import QTreeWidget
 
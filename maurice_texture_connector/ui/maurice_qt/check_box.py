@@ -22,7 +22,7 @@ class QCheckBox(QtWidgets.QCheckBox):
         """Initializes class attributes."""
         super(QCheckBox, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QCheckBox settings.
         self.setStyleSheet(maurice_widgets_style.check_box())
@@ -35,7 +35,7 @@ class Header(QtWidgets.QWidget):
         """Initializes class attributes."""
         super(Header, self).__init__()
 
-        self.maurice_widgets_style = MauriceWidgetsStyle()
+        self.maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # Files path class variables.
         self.icons = maurice_utils.get_icons()
@@ -163,7 +163,7 @@ class QCollapsableWidget(QtWidgets.QWidget):
         """Initializes class attributes."""
         super(QCollapsableWidget, self).__init__()
 
-        self.maurice_widgets_style = MauriceWidgetsStyle()
+        self.maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QCollapsableWidget class variables.
         self.header = None
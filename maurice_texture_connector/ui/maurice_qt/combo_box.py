@@ -26,7 +26,7 @@ class QComboBox(QtWidgets.QComboBox):
         """Initializes class attributes."""
         super(QComboBox, self).__init__()
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QComboBox class variables.
         self.last_text = ''
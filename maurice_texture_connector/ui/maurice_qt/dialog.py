@@ -66,7 +66,7 @@ class QDialog(QtWidgets.QDialog):
         """Initializes class attributes"""
         super(QDialog, self).__init__(parent)
 
-        self.maurice_widgets_style = MauriceWidgetsStyle()
+        self.maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # Files path class variables.
         self.icons = maurice_utils.get_icons()
@@ -159,6 +159,8 @@ class QDialog(QtWidgets.QDialog):
         about_action = help_menu.addAction('About', self.show_about)
         about_action.setIcon(QtGui.QIcon(self.icons['info.png']))
 
+        self.create_help_menu(help_menu)
+
         # Right QMenuBar.
         right_menu_bar = QtWidgets.QMenuBar(main_menu_bar)
         right_menu_bar.setStyleSheet(f'QMenuBar {{padding: 0px 0px 0px {maurice_utils.get_value_by_ppi(3, 5)}px;}}')
@@ -172,6 +174,10 @@ class QDialog(QtWidgets.QDialog):
             expand_action = right_menu_bar.addAction('Expand', self.expand_collapsable_widgets)
             expand_action.setIcon(QtGui.QIcon(self.icons['angle-down.png']))
 
+    def create_help_menu(self, help_menu: QtWidgets.QMenu) -> None:
+        """Adds the actions of the tool to the help menu."""
+        pass
+
     def create_shortcuts(self) -> None:
         """Creates the shortcuts."""
         pass
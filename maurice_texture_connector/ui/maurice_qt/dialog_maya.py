@@ -51,7 +51,7 @@ class QDialogMaya(QDialog):
     def delete_call_backs(self) -> None:
         """Deletes the call-backs."""
         for call_back in self.call_backs:
-            om.MSceneMessage.removeCallback(call_back)
+            om.MMessage.removeCallback(call_back)
 
         self.call_backs.clear()
 
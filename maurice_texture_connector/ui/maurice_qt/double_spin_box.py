@@ -24,7 +24,7 @@ class QDoubleSpinBox(QtWidgets.QDoubleSpinBox):
         """Initializes class attributes."""
         super(QDoubleSpinBox, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QDoubleSpinBox settings.
         self.setButtonSymbols(QtWidgets.QAbstractSpinBox.NoButtons)
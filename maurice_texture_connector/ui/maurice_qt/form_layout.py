@@ -23,7 +23,7 @@ class QFormLayout(QtWidgets.QFormLayout):
         """Initializes class attributes."""
         super(QFormLayout, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QFormLayout settings.
         self.setContentsMargins(0, 0, 0, 0)
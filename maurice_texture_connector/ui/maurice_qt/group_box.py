@@ -22,7 +22,7 @@ class QGroupBox(QtWidgets.QGroupBox):
         """Initializes class attributes."""
         super(QGroupBox, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QGroupBox settings.
         self.setStyleSheet(maurice_widgets_style.group_box())
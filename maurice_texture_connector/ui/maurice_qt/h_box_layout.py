@@ -22,7 +22,7 @@ class QHBoxLayout(QtWidgets.QHBoxLayout):
         """Initializes class attributes."""
         super(QHBoxLayout, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QHBoxLayout settings.
         self.setContentsMargins(0, 0, 0, 0)
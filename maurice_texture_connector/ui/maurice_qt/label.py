@@ -24,7 +24,7 @@ class QLabel(QtWidgets.QLabel):
         """Initializes class attributes."""
         super(QLabel, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QLabel settings.
         self.setAlignment(QtCore.Qt.AlignVCenter)
@@ -24,7 +24,7 @@ class QLineEdit(QtWidgets.QLineEdit):
         """Initializes class attributes."""
         super(QLineEdit, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QLineEdit settings.
         self.setFixedHeight(maurice_widgets_style.HEIGHT)
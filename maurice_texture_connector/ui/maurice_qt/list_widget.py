@@ -24,7 +24,7 @@ class QListWidget(QtWidgets.QListWidget):
         """Initializes class attributes."""
         super(QListWidget, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QListWidget settings.
         self.setStyleSheet(maurice_widgets_style.list_widget())
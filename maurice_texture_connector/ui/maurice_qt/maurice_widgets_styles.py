@@ -7,11 +7,33 @@ Updated Date: 11-11-2024
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
+from functools import wraps
+
 import maurice_texture_connector.utils as maurice_utils
+import maurice_texture_connector as maurice
+
+
+def memoize_style(function: callable) -> callable:
+    """Memoizes the style sheet returned by a MauriceWidgetsStyle method, by PPI."""
+    styles = {}
+
+    @wraps(function)
+    def wrapper(*args) -> str:
+        style = styles.get(maurice.PPI)
+
+        if style is None:
+            style = styles[maurice.PPI] = function(*args)
+
+        return style
+
+    return wrapper
 
 
 class MauriceWidgetsStyle(object):
-    """Maurice widgets style."""
+    """Maurice widgets style.
+
+    Shared by every widget through get_instance, the icons are listed once and every style sheet is built once.
+    """
     SCALING_FACTOR = maurice_utils.get_value_by_ppi(2, 3)
 
     SOFTWARE_COLOR = '#5285A6'
@@ -25,10 +47,21 @@ class MauriceWidgetsStyle(object):
     HEIGHT = SCALING_FACTOR * 10
     WIDTH = maurice_utils.get_value_by_ppi(100, 126)
 
+    instance = None
+
+    @classmethod
+    def get_instance(cls) -> 'MauriceWidgetsStyle':
+        """Gets the shared style."""
+        if not cls.instance:
+            cls.instance = cls()
+
+        return cls.instance
+
     def __init__(self) -> None:
         """Initializes class attributes."""
         self.icons = maurice_utils.get_icons()
 
+    @memoize_style
     def check_box(self) -> str:
         """QCheckBox."""
         style = f'''
@@ -69,6 +102,7 @@ class MauriceWidgetsStyle(object):
 
         return style
 
+    @memoize_style
     def combo_box(self) -> str:
         """QComboBox."""
         style = f'''
@@ -122,6 +156,7 @@ class MauriceWidgetsStyle(object):
         return style
 
     @staticmethod
+    @memoize_style
     def double_spin_box() -> str:
         """QDoubleSpinBox."""
         style = f'''
@@ -141,6 +176,7 @@ class MauriceWidgetsStyle(object):
         return style
 
     @staticmethod
+    @memoize_style
     def group_box() -> str:
         """QGroupBox."""
         style = f'''
@@ -154,6 +190,7 @@ class MauriceWidgetsStyle(object):
         return style
 
     @staticmethod
+    @memoize_style
     def label() -> str:
         """QLabel."""
         style = f'''
@@ -170,6 +207,7 @@ class MauriceWidgetsStyle(object):
         return style
 
     @staticmethod
+    @memoize_style
     def line_edit() -> str:
         """QLineEdit."""
         style = f'''
@@ -189,6 +227,7 @@ class MauriceWidgetsStyle(object):
 
         return style
 
+    @memoize_style
     def list_widget(self) -> str:
         """QListWidget."""
         style = f'''
@@ -216,6 +255,7 @@ class MauriceWidgetsStyle(object):
 
         return style
 
+    @memoize_style
     def menu_bar(self) -> str:
         """QMenuBar."""
         style = f'''
@@ -285,6 +325,7 @@ class MauriceWidgetsStyle(object):
         return style
 
     @staticmethod
+    @memoize_style
     def push_button() -> str:
         """QPushButton."""
         style = f'''
@@ -317,6 +358,7 @@ class MauriceWidgetsStyle(object):
 
         return style
 
+    @memoize_style
     def radio_button(self) -> str:
         """QRadioButton."""
         style = f'''
@@ -362,6 +404,7 @@ class MauriceWidgetsStyle(object):
         return style
 
     @staticmethod
+    @memoize_style
     def scroll_area() -> str:
         """QScrollArea."""
         scroll_area = f'''        
@@ -401,6 +444,7 @@ class MauriceWidgetsStyle(object):
         return scroll_area
 
     @staticmethod
+    @memoize_style
     def spin_box() -> str:
         """QSpinBox."""
         style = f'''
@@ -420,6 +464,7 @@ class MauriceWidgetsStyle(object):
         return style
 
     @staticmethod
+    @memoize_style
     def splitter() -> str:
         """QSplitter."""
         style = f'''
@@ -432,6 +477,7 @@ class MauriceWidgetsStyle(object):
         return style
 
     @staticmethod
+    @memoize_style
     def tab_widget() -> str:
         """QTabWidget."""
         style = f'''
@@ -475,6 +521,12 @@ class MauriceWidgetsStyle(object):
 
         return style
 
+    @memoize_style
+    def tree_view(self) -> str:
+        """QTreeView."""
+        return self.tree_widget().replace('QTreeWidget', 'QTreeView')
+
+    @memoize_style
     def tree_widget(self) -> str:
         """QTreeWidget."""
         style = f'''
@@ -516,6 +568,7 @@ class MauriceWidgetsStyle(object):
         return style
 
     @staticmethod
+    @memoize_style
     def widget() -> str:
         """QWidget."""
         style = '''
@@ -30,7 +30,7 @@ class QPushButton(QtWidgets.QPushButton):
         """Initializes class attributes."""
         super(QPushButton, self).__init__(*args)
 
-        self.maurice_widgets_style = MauriceWidgetsStyle()
+        self.maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QPushButton settings.
         self.setFixedHeight(maurice_utils.get_value_by_ppi(26, 40))
@@ -22,7 +22,7 @@ class QRadioButton(QtWidgets.QRadioButton):
         """Initializes class attributes."""
         super(QRadioButton, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QRadioButton settings.
         self.setStyleSheet(maurice_widgets_style.radio_button())
@@ -24,7 +24,7 @@ class QScrollArea(QtWidgets.QScrollArea):
         """Initializes class attributes."""
         super(QScrollArea, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QScrollBar settings.
         self.setFrameShape(QtWidgets.QFrame.NoFrame)
@@ -24,7 +24,7 @@ class QSpinBox(QtWidgets.QSpinBox):
         """Initializes class attributes."""
         super(QSpinBox, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QSpinBox settings.
         self.setButtonSymbols(QtWidgets.QAbstractSpinBox.NoButtons)
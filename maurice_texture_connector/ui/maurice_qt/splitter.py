@@ -22,7 +22,7 @@ class QSplitter(QtWidgets.QSplitter):
         """Initializes class attributes."""
         super(QSplitter, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QSplitter settings.
         self.setStyleSheet(maurice_widgets_style.splitter())
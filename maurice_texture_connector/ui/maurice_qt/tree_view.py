@@ -0,0 +1,33 @@
+"""
+========================================================================================================================
+Name: tree_view.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+try:
+    from PySide6 import QtWidgets
+    from PySide6 import QtCore
+except ImportError:
+    from PySide2 import QtWidgets
+    from PySide2 import QtCore
+
+from maurice_texture_connector.ui.maurice_qt.maurice_widgets_styles import MauriceWidgetsStyle
+
+
+class QTreeView(QtWidgets.QTreeView):
+    """QTreeView."""
+
+    def __init__(self, *args) -> None:
+        """Initializes class attributes."""
+        super(QTreeView, self).__init__(*args)
+
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
+
+        # QTreeView settings.
+        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.setHeaderHidden(True)
+        self.setStyleSheet(maurice_widgets_style.tree_view())
@@ -24,7 +24,7 @@ class QTreeWidget(QtWidgets.QTreeWidget):
         """Initializes class attributes."""
         super(QTreeWidget, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QTreeWidget settings.
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
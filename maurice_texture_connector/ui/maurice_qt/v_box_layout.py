@@ -22,7 +22,7 @@ class QVBoxLayout(QtWidgets.QVBoxLayout):
         """Initializes class attributes."""
         super(QVBoxLayout, self).__init__(*args)
 
-        maurice_widgets_style = MauriceWidgetsStyle()
+        maurice_widgets_style = MauriceWidgetsStyle.get_instance()
 
         # QVBoxLayout settings.
         self.setContentsMargins(0, 0, 0, 0)
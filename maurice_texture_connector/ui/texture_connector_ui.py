@@ -29,7 +29,17 @@ from maurice_texture_connector.core.create_material_network_arnold import Create
 from maurice_texture_connector.core.edit_material_network_arnold import EditMaterialNetworkArnold
 from maurice_texture_connector.core.create_network_network_v_ray import CreateMaterialNetworkVRay
 from maurice_texture_connector.core.edit_material_network_v_ray import EditMaterialNetworkVRay
+from maurice_texture_connector.core.network_backend_open_maya import NetworkBackendOpenMaya
+from maurice_texture_connector.core.material_network_index import MaterialNetworkIndex
+from maurice_texture_connector.core.texture_memory_report import TextureMemoryReport
+from maurice_texture_connector.core.network_backend_cmds import NetworkBackendCmds
+from maurice_texture_connector.core.text_filter_index import TextFilterIndex
+from maurice_texture_connector.core.texture_set_index import TextureSetIndex
+from maurice_texture_connector.core.file_node_index import FileNodeIndex
+from maurice_texture_connector.ui.file_explorer_model import FileExplorerFilterProxyModel
 from maurice_texture_connector.ui.texture_settings_widget import TextureSettingsWidget
+from maurice_texture_connector.ui.file_explorer_model import FileExplorerModel
+from maurice_texture_connector.ui.file_status_worker import FileStatusWorker
 import maurice_texture_connector.ui.maurice_qt as maurice_qt
 import maurice_texture_connector.utils as maurice_utils
 import maurice_texture_connector as maurice
@@ -55,6 +65,11 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
     PUSH_BUTTON_SCALING_FACTOR = 1.5
 
+    FILE_STATUS_ROLE = QtCore.Qt.UserRole + 1
+
+    # Milliseconds the filters wait for the typing to pause.
+    FILTER_DELAY = 150
+
     @classmethod
     def show_window(cls) -> None:
         """Shows the window."""
@@ -65,7 +80,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
     def __init__(self) -> None:
         """Initializes class attributes."""
-        self.maurice_widgets_style = maurice_qt.MauriceWidgetsStyle()
+        self.maurice_widgets_style = maurice_qt.MauriceWidgetsStyle.get_instance()
 
         self.main_widget = None
 
@@ -79,7 +94,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.show_emissive_images_action = None
         self.show_opacity_images_action = None
         self.create_material_network_action = None
+        self.create_material_networks_action = None
         self.repath_files_action = None
+        self.texture_memory_report_action = None
         self.reveal_in_explorer = None
 
         # Activity class variables.
@@ -92,6 +109,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.settings_main_widget = None
         self.render_engine_combo_box = None
         self.create_material_network_push_button = None
+        self.create_material_networks_push_button = None
         self.texture_connector_scroll_area = None
         self.settings_widget = None
         self.material_collapsable_widget = None
@@ -102,18 +120,26 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.height_check_box = None
         self.emissive_check_box = None
         self.opacity_check_box = None
+        self.packed_check_box = None
         self.triplanar_collapsable_widget = None
         self.use_triplanar_check_box = None
         self.settings_collapsable_widget = None
         self.use_texture_name_check_box = None
         self.case_sensitivity_check_box = None
+        self.use_dg_modifier_check_box = None
+        self.use_constant_textures_check_box = None
+        self.reuse_file_nodes_check_box = None
         
         # Explorer class variables.
         self.explorer_widget = None
         self.materials_filter_line_edit = None
+        self.materials_filter_timer = None
         self.materials_list_widget = None
         self.file_explorer_filter_line_edit = None
-        self.file_explorer_tree_widget = None
+        self.file_explorer_filter_timer = None
+        self.file_explorer_model = None
+        self.file_explorer_proxy_model = None
+        self.file_explorer_tree_view = None
         self.show_base_color_items = False
         self.show_roughness_items = False
         self.show_metalness_items = False
@@ -121,17 +147,11 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.show_height_items = False
         self.show_emissive_items = False
         self.show_opacity_items = False
-        self.base_color_suffix = None
-        self.roughness_suffix = None
-        self.metalness_suffix = None
-        self.normal_suffix = None
-        self.height_suffix = None
-        self.emissive_suffix = None
-        self.opacity_suffix = None
 
         # Files class variables.
         self.files_widget = None
         self.files_filter_line_edit = None
+        self.files_filter_timer = None
         self.files_tree_widget = None
 
         # Texture connector class variables.
@@ -144,6 +164,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.height_widget = None
         self.emissive_widget = None
         self.opacity_widget = None
+        self.packed_widget = None
         self.base_color_file_texture_name = ''
         self.base_color_color_space = ''
         self.roughness_file_texture_name = ''
@@ -164,13 +185,33 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.maya_project_warning_status_pixmap = None
         self.maya_project_status_label = None
         self.maya_project_path_label = None
+        self.timings_label = None
         self.update_ui_push_button = None
 
+        # Profiling class variables.
+        self.profile_action = None
+
         # Texture connector.
         self.edit_material_network_arnold = None
         self.edit_material_network_redshift = None
         self.edit_material_network_v_ray = None
 
+        self.material_network_index = MaterialNetworkIndex()
+        self.file_node_index = FileNodeIndex()
+
+        # Files status class variables.
+        self.file_status_generation = 0
+        self.file_status_worker = None
+        self.files_items = {}
+
+        # Filters class variables.
+        self.materials_filter_index = TextFilterIndex()
+        self.materials_filter_items = []
+        self.materials_visible_ids = set()
+        self.files_filter_index = TextFilterIndex()
+        self.files_filter_items = []
+        self.files_visible_ids = set()
+
         self.file_system_watcher = QtCore.QFileSystemWatcher()
 
         super(TextureConnectorUI, self).__init__()
@@ -184,6 +225,16 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.main_layout.setAlignment(QtCore.Qt.AlignBottom)
         self.main_layout.setSpacing(0)
 
+    def create_help_menu(self, help_menu: QtWidgets.QMenu) -> None:
+        """Adds the profiling actions to the help menu."""
+        help_menu.addSeparator()
+
+        self.profile_action = help_menu.addAction('Profile', self.profile_triggered_action)
+        self.profile_action.setCheckable(True)
+        self.profile_action.setChecked(maurice_utils.is_profiler_running())
+
+        help_menu.addAction('Dump Timings', self.dump_timings_triggered_action)
+
     def create_actions(self) -> None:
         """Creates the actions."""
         # ==============================================================================================================
@@ -225,6 +276,10 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.create_material_network_action = maurice_qt.QAction('Create Material Network')
         self.create_material_network_action.setIcon(QtGui.QIcon(self.icons['chart-tree.png']))
 
+        # Create material networks QAction.
+        self.create_material_networks_action = maurice_qt.QAction('Create Material Networks')
+        self.create_material_networks_action.setIcon(QtGui.QIcon(self.icons['folder-tree.png']))
+
         # ==============================================================================================================
         # Files.
         # ==============================================================================================================
@@ -232,6 +287,10 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.repath_files_action = maurice_qt.QAction('Repath Files')
         self.repath_files_action.setIcon(QtGui.QIcon(self.icons['code-compare.png']))
 
+        # Texture memory report QAction.
+        self.texture_memory_report_action = maurice_qt.QAction('Texture Memory Report')
+        self.texture_memory_report_action.setIcon(QtGui.QIcon(self.icons['chart-tree.png']))
+
         # Reveal in explorer QAction.
         self.reveal_in_explorer = maurice_qt.QAction('Reveal in Explorer')
         self.reveal_in_explorer.setIcon(QtGui.QIcon(self.icons['overview.png']))
@@ -316,6 +375,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         # Opacity QCheckBox.
         self.opacity_check_box = maurice_qt.QCheckBox('Opacity')
 
+        # Packed QCheckBox.
+        self.packed_check_box = maurice_qt.QCheckBox('Packed')
+
         # Use triplanar QCheckBox.
         self.use_triplanar_check_box = maurice_qt.QCheckBox('Use Triplanar')
 
@@ -325,12 +387,27 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         # Case sensitivity QCheckBox.
         self.case_sensitivity_check_box = maurice_qt.QCheckBox('Case Sensitivity')
 
+        # Use DG modifier QCheckBox.
+        self.use_dg_modifier_check_box = maurice_qt.QCheckBox('Use DG Modifier')
+
+        # Use constant textures QCheckBox.
+        self.use_constant_textures_check_box = maurice_qt.QCheckBox('Use Constant Textures')
+
+        # Reuse file nodes QCheckBox.
+        self.reuse_file_nodes_check_box = maurice_qt.QCheckBox('Reuse File Nodes')
+
         # Create material network QPushButton.
         self.create_material_network_push_button = maurice_qt.QPushButton('Create Material Network')
         self.create_material_network_push_button.setIcon(QtGui.QIcon(self.icons['chart-tree.png']))
         self.create_material_network_push_button.setToolTip(lmb='Create Material Network')
         self.create_material_network_push_button.set_color_background()
 
+        # Create material networks QPushButton.
+        self.create_material_networks_push_button = maurice_qt.QPushButton('Create Material Networks')
+        self.create_material_networks_push_button.setIcon(QtGui.QIcon(self.icons['folder-tree.png']))
+        self.create_material_networks_push_button.setToolTip(
+            lmb='Create a material network for every texture set in a folder and its subfolders')
+
         # ==============================================================================================================
         # Texture connector.
         # ==============================================================================================================
@@ -375,6 +452,11 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.opacity_widget.set_title('Opacity')
         self.opacity_widget.setVisible(False)
 
+        # Packed widget.
+        self.packed_widget = TextureSettingsWidget()
+        self.packed_widget.set_title('Packed')
+        self.packed_widget.setVisible(False)
+
         # ==============================================================================================================
         # Explorer.
         # ==============================================================================================================
@@ -382,6 +464,10 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.materials_filter_line_edit = maurice_qt.QLineEdit()
         self.materials_filter_line_edit.setPlaceholderText('Search...')
 
+        self.materials_filter_timer = QtCore.QTimer(self)
+        self.materials_filter_timer.setInterval(TextureConnectorUI.FILTER_DELAY)
+        self.materials_filter_timer.setSingleShot(True)
+
         # Materials QListWidget.
         self.materials_list_widget = maurice_qt.QListWidget()
         self.materials_list_widget.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
@@ -392,9 +478,19 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.file_explorer_filter_line_edit = maurice_qt.QLineEdit()
         self.file_explorer_filter_line_edit.setPlaceholderText('Search...')
 
-        # File explorer QTreeWidget.
-        self.file_explorer_tree_widget = maurice_qt.QTreeWidget()
-        self.file_explorer_tree_widget.setMinimumHeight(maurice_utils.get_value_by_ppi(100, 150))
+        self.file_explorer_filter_timer = QtCore.QTimer(self)
+        self.file_explorer_filter_timer.setInterval(TextureConnectorUI.FILTER_DELAY)
+        self.file_explorer_filter_timer.setSingleShot(True)
+
+        # File explorer QTreeView.
+        self.file_explorer_model = FileExplorerModel(icons=self.icons, parent=self)
+
+        self.file_explorer_proxy_model = FileExplorerFilterProxyModel(parent=self)
+        self.file_explorer_proxy_model.setSourceModel(self.file_explorer_model)
+
+        self.file_explorer_tree_view = maurice_qt.QTreeView()
+        self.file_explorer_tree_view.setMinimumHeight(maurice_utils.get_value_by_ppi(100, 150))
+        self.file_explorer_tree_view.setModel(self.file_explorer_proxy_model)
 
         # ==============================================================================================================
         # Files.
@@ -402,6 +498,10 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.files_filter_line_edit = maurice_qt.QLineEdit()
         self.files_filter_line_edit.setPlaceholderText('Search...')
 
+        self.files_filter_timer = QtCore.QTimer(self)
+        self.files_filter_timer.setInterval(TextureConnectorUI.FILTER_DELAY)
+        self.files_filter_timer.setSingleShot(True)
+
         # Files QTreeWidget.
         self.files_tree_widget = maurice_qt.QTreeWidget()
         self.files_tree_widget.setMinimumHeight(maurice_utils.get_value_by_ppi(100, 150))
@@ -442,6 +542,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         # Maya project path QLabel.
         self.maya_project_path_label = maurice_qt.QLabel()
 
+        # Timings QLabel.
+        self.timings_label = maurice_qt.QLabel()
+
         # Update UI QPushButton.
         self.update_ui_push_button = maurice_qt.QPushButton()
         self.update_ui_push_button.setIcon(QtGui.QIcon(self.icons['refresh.png']))
@@ -530,6 +633,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         material_form_layout.addWidget(self.height_check_box)
         material_form_layout.addWidget(self.emissive_check_box)
         material_form_layout.addWidget(self.opacity_check_box)
+        material_form_layout.addWidget(self.packed_check_box)
         material_form_layout.setContentsMargins(maurice_utils.get_value_by_ppi(88, 112), 0, 0, 0)
         material_group_box.setLayout(material_form_layout)
 
@@ -553,7 +657,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
         # Settings QCollapsableWidget.
         self.settings_collapsable_widget = maurice_qt.QCollapsableWidget(title='Settings', parent=self.settings_widget)
-        self.settings_collapsable_widget.set_height(maurice_utils.get_value_by_ppi(19, 30))
+        self.settings_collapsable_widget.set_height(maurice_utils.get_value_by_ppi(49, 76))
         settings_v_box_layout.addWidget(self.settings_collapsable_widget)
 
         # Settings QGroupBox.
@@ -564,10 +668,15 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         # Settings QFormLayout.
         settings_form_layout = maurice_qt.QFormLayout()
         settings_form_layout.addWidget(self.use_texture_name_check_box)
+        settings_form_layout.addWidget(self.case_sensitivity_check_box)
+        settings_form_layout.addWidget(self.use_dg_modifier_check_box)
+        settings_form_layout.addWidget(self.use_constant_textures_check_box)
+        settings_form_layout.addWidget(self.reuse_file_nodes_check_box)
         settings_form_layout.setContentsMargins(maurice_utils.get_value_by_ppi(88, 112), 0, 0, 0)
         settings_group_box.setLayout(settings_form_layout)
 
         settings_main_v_box_layout.addStretch()
+        settings_main_v_box_layout.addWidget(self.create_material_networks_push_button)
         settings_main_v_box_layout.addWidget(self.create_material_network_push_button)
 
         # ==============================================================================================================
@@ -603,7 +712,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         # File explorer QVBoxLayout.
         file_explorer_v_box_layout = maurice_qt.QVBoxLayout()
         file_explorer_v_box_layout.addWidget(self.file_explorer_filter_line_edit)
-        file_explorer_v_box_layout.addWidget(self.file_explorer_tree_widget)
+        file_explorer_v_box_layout.addWidget(self.file_explorer_tree_view)
         file_explorer_widget.setLayout(file_explorer_v_box_layout)
 
         # ==============================================================================================================
@@ -667,6 +776,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         texture_connector_items_v_box_layout.addWidget(self.height_widget)
         texture_connector_items_v_box_layout.addWidget(self.emissive_widget)
         texture_connector_items_v_box_layout.addWidget(self.opacity_widget)
+        texture_connector_items_v_box_layout.addWidget(self.packed_widget)
         texture_connector_items_v_box_layout.setAlignment(QtCore.Qt.AlignTop)
         self.texture_connector_widget.setLayout(texture_connector_items_v_box_layout)
 
@@ -687,6 +797,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         status_bar_h_box_layout.addWidget(self.maya_project_status_label)
         status_bar_h_box_layout.addWidget(self.maya_project_path_label)
         status_bar_h_box_layout.addStretch()
+        status_bar_h_box_layout.addWidget(self.timings_label)
         status_bar_h_box_layout.addWidget(self.update_ui_push_button)
         status_bar_h_box_layout.setContentsMargins(maurice_utils.get_value_by_ppi(4, 6), 0, 0, 0)
         status_bar_widget.setLayout(status_bar_h_box_layout)
@@ -707,7 +818,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.show_emissive_images_action.triggered.connect(self.show_emissive_images_triggered_action)
         self.show_opacity_images_action.triggered.connect(self.show_opacity_images_triggered_action)
         self.create_material_network_action.triggered.connect(self.create_material_network_triggered_action)
+        self.create_material_networks_action.triggered.connect(self.create_material_networks_triggered_action)
         self.repath_files_action.triggered.connect(self.repath_files_clicked_push_button)
+        self.texture_memory_report_action.triggered.connect(self.texture_memory_report_triggered_action)
         self.reveal_in_explorer.triggered.connect(self.reveal_in_explorer_triggered_action)
 
         # ==============================================================================================================
@@ -729,23 +842,28 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.height_check_box.toggled.connect(self.height_toggled_check_box)
         self.emissive_check_box.toggled.connect(self.emissive_toggled_check_box)
         self.opacity_check_box.toggled.connect(self.opacity_toggled_check_box)
+        self.packed_check_box.toggled.connect(self.packed_toggled_check_box)
         self.create_material_network_push_button.clicked.connect(self.create_material_network_clicked_push_button)
+        self.create_material_networks_push_button.clicked.connect(self.create_material_networks_clicked_push_button)
 
         # ==============================================================================================================
         # Explorer.
         # ==============================================================================================================
         self.materials_filter_line_edit.textChanged.connect(self.materials_filter_text_changed_line_edit)
+        self.materials_filter_timer.timeout.connect(self.apply_materials_filter)
         self.materials_list_widget.itemClicked.connect(self.materials_item_clicked_list_widget)
         self.file_explorer_filter_line_edit.textChanged.connect(self.file_explorer_filter_text_changed_line_edit)
-        self.file_explorer_tree_widget.customContextMenuRequested.connect(
-            self.file_explore_custom_context_menu_requested_tree_widget)
-        self.file_explorer_tree_widget.itemCollapsed.connect(self.file_explorer_item_collapsed_tree_widget)
-        self.file_explorer_tree_widget.itemExpanded.connect(self.file_explorer_item_expanded_tree_widget)
+        self.file_explorer_filter_timer.timeout.connect(self.apply_file_explorer_filter)
+        self.file_explorer_tree_view.customContextMenuRequested.connect(
+            self.file_explore_custom_context_menu_requested_tree_view)
+        self.file_explorer_tree_view.collapsed.connect(self.file_explorer_collapsed_tree_view)
+        self.file_explorer_tree_view.expanded.connect(self.file_explorer_expanded_tree_view)
 
         # ==============================================================================================================
         # Files.
         # ==============================================================================================================
         self.files_filter_line_edit.textChanged.connect(self.files_filter_text_changed_line_edit)
+        self.files_filter_timer.timeout.connect(self.apply_files_filter)
         self.files_tree_widget.customContextMenuRequested.connect(self.files_custom_context_menu_request_tree_widget)
         self.files_tree_widget.itemClicked.connect(self.files_item_clicked_tree_widget)
 
@@ -782,8 +900,13 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         s.setValue('height', self.height_check_box.isChecked())
         s.setValue('emissive', self.emissive_check_box.isChecked())
         s.setValue('opacity', self.opacity_check_box.isChecked())
+        s.setValue('packed', self.packed_check_box.isChecked())
         s.setValue('useTriplanar', self.use_triplanar_check_box.isChecked())
         s.setValue('useTextureName', self.use_texture_name_check_box.isChecked())
+        s.setValue('caseSensitivity', self.case_sensitivity_check_box.isChecked())
+        s.setValue('useDGModifier', self.use_dg_modifier_check_box.isChecked())
+        s.setValue('useConstantTextures', self.use_constant_textures_check_box.isChecked())
+        s.setValue('reuseFileNodes', self.reuse_file_nodes_check_box.isChecked())
         s.endGroup()
 
         # ==============================================================================================================
@@ -802,6 +925,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         s.setValue('heightSuffix', self.height_widget.get_texture_suffix())
         s.setValue('emissiveSuffix', self.emissive_widget.get_texture_suffix())
         s.setValue('opacitySuffix', self.opacity_widget.get_texture_suffix())
+        s.setValue('packedSuffix', self.packed_widget.get_texture_suffix())
         s.endGroup()
 
     def reset_settings(self) -> None:
@@ -816,8 +940,13 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.height_check_box.setChecked(True)
         self.emissive_check_box.setChecked(True)
         self.opacity_check_box.setChecked(True)
+        self.packed_check_box.setChecked(True)
         self.use_triplanar_check_box.setChecked(False)
         self.use_texture_name_check_box.setChecked(True)
+        self.case_sensitivity_check_box.setChecked(False)
+        self.use_dg_modifier_check_box.setChecked(False)
+        self.use_constant_textures_check_box.setChecked(False)
+        self.reuse_file_nodes_check_box.setChecked(False)
 
         # ==============================================================================================================
         # Texture connector.
@@ -829,6 +958,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.height_widget.set_texture_suffix('Height')
         self.emissive_widget.set_texture_suffix('Emissive')
         self.opacity_widget.set_texture_suffix('Opacity')
+        self.packed_widget.set_texture_suffix(maurice_utils.PACKED_LAYOUT)
 
     def show_about(self) -> None:
         """Shows the QAbout."""
@@ -852,6 +982,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.height_widget.collapse()
         self.emissive_widget.collapse()
         self.opacity_widget.collapse()
+        self.packed_widget.collapse()
 
     def expand_collapsable_widgets(self) -> None:
         """Expands collapsable widgets."""
@@ -866,6 +997,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.height_widget.expand()
         self.emissive_widget.expand()
         self.opacity_widget.expand()
+        self.packed_widget.expand()
 
     def load_settings(self) -> None:
         """Loads the settings."""
@@ -882,8 +1014,14 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.height_check_box.setChecked(str(s.value('height', 'True', str)).lower() == 'true')
         self.emissive_check_box.setChecked(str(s.value('emissive', 'True', str)).lower() == 'true')
         self.opacity_check_box.setChecked(str(s.value('opacity', 'True', str)).lower() == 'true')
+        self.packed_check_box.setChecked(str(s.value('packed', 'True', str)).lower() == 'true')
         self.use_triplanar_check_box.setChecked(str(s.value('useTriplanar', 'False', str)).lower() == 'true')
         self.use_texture_name_check_box.setChecked(str(s.value('useTextureName', 'True', str)).lower() == 'true')
+        self.case_sensitivity_check_box.setChecked(str(s.value('caseSensitivity', 'False', str)).lower() == 'true')
+        self.use_dg_modifier_check_box.setChecked(str(s.value('useDGModifier', 'False', str)).lower() == 'true')
+        self.use_constant_textures_check_box.setChecked(
+            str(s.value('useConstantTextures', 'False', str)).lower() == 'true')
+        self.reuse_file_nodes_check_box.setChecked(str(s.value('reuseFileNodes', 'False', str)).lower() == 'true')
         s.endGroup()
 
         # ==============================================================================================================
@@ -906,17 +1044,37 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.height_widget.set_texture_suffix(s.value('heightSuffix', 'Height', str))
         self.emissive_widget.set_texture_suffix(s.value('emissiveSuffix', 'Emissive', str))
         self.opacity_widget.set_texture_suffix(s.value('opacitySuffix', 'Opacity', str))
+        self.packed_widget.set_texture_suffix(s.value('packedSuffix', maurice_utils.PACKED_LAYOUT, str))
         s.endGroup()
 
     def create_call_backs(self) -> None:
         """Creates the call-backs."""
-        om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, self.new_scene)
-        om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, self.new_scene)
+        self.call_backs.append(om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, self.new_scene))
+        self.call_backs.append(om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, self.new_scene))
+
+        self.call_backs.append(om.MSceneMessage.addCallback(om.MSceneMessage.kAfterSave, self.after_save_scene))
+
+        self.call_backs.append(om.MSceneMessage.addStringArrayCallback(
+            om.MSceneMessage.kAfterPluginLoad,
+            self.set_render_engines))
+        self.call_backs.append(om.MSceneMessage.addStringArrayCallback(
+            om.MSceneMessage.kAfterPluginUnload,
+            self.set_render_engines))
+
+        # The indexes are not kept up to date while the window is closed.
+        self.material_network_index.clear()
+        self.call_backs.extend(self.material_network_index.create_call_backs())
+
+        self.file_node_index.clear()
+        self.call_backs.extend(self.file_node_index.create_call_backs())
 
-        om.MSceneMessage.addCallback(om.MSceneMessage.kAfterSave, self.after_save_scene)
+        maurice_utils.add_operation_listener(self.operation_timed)
 
-        om.MSceneMessage.addStringArrayCallback(om.MSceneMessage.kAfterPluginLoad, self.set_render_engines)
-        om.MSceneMessage.addStringArrayCallback(om.MSceneMessage.kAfterPluginUnload, self.set_render_engines)
+    def delete_call_backs(self) -> None:
+        """Deletes the call-backs."""
+        super().delete_call_backs()
+
+        maurice_utils.remove_operation_listener(self.operation_timed)
 
     def create_script_jobs(self) -> None:
         """Creates the script jobs."""
@@ -925,6 +1083,8 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
     def new_scene(self, *args) -> None:
         """New scene."""
+        self.material_network_index.clear()
+        self.file_node_index.clear()
         self.clear_textures_info()
         self.set_maya_project_status_image()
         self.update_materials_items()
@@ -953,21 +1113,76 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
     def workspace_changed(self) -> None:
         """Workspace changed."""
+        # The relative paths of the file nodes are resolved from the project.
+        self.file_node_index.clear()
         self.set_maya_project_status_image()
         self.set_current_maya_project_path_label()
         self.update_images_items()
         self.update_watched_paths()
         self.update_files_items()
 
-    def file_system_watcher_directory_changed(self) -> None:
+    def file_system_watcher_directory_changed(self, path: str = '') -> None:
         """Executes the signal 'directory changed' of the file system watcher."""
+        maurice_utils.clear_stat_cache(path)
         self.update_images_items()
 
+    def files_status_resolved(self, generation: int, files_status: list) -> None:
+        """Updates the icons of the files items resolved by the file status worker, and the ones of their folders."""
+        if generation != self.file_status_generation:
+            return
+
+        current_maya_project = cmds.workspace(rootDirectory=True, query=True)
+        top_level_items = []
+
+        for file_texture_name, exists, sequence in files_status:
+            status = maurice_utils.get_texture_status(
+                file_path=file_texture_name,
+                exists=exists,
+                project_path=current_maya_project)
+
+            for item in self.files_items.get(file_texture_name, []):
+                item.setData(0, TextureConnectorUI.FILE_STATUS_ROLE, status)
+                item.setIcon(0, QtGui.QIcon(self.icons[f'{status}.png']))
+
+                if sequence:
+                    item.setToolTip(0, maurice_utils.format_sequence(sequence))
+
+                top_level_item = item.parent()
+
+                if top_level_item not in top_level_items:
+                    top_level_items.append(top_level_item)
+
+        for top_level_item in top_level_items:
+            key = top_level_item.data(0, QtCore.Qt.UserRole)
+            file_status = [top_level_item.child(i).data(0, TextureConnectorUI.FILE_STATUS_ROLE)
+                           for i in range(top_level_item.childCount())]
+
+            if None in file_status:
+                continue
+
+            if TextureSetIndex.get_index(key).exists() and key.startswith(current_maya_project):
+                top_level_item.setText(0, f'../{os.path.basename(os.path.split(os.path.normpath(key))[-1])}')
+
+            if file_status.count('cross'):
+                icon = QtGui.QIcon(self.icons['cross.png'])
+            elif file_status.count('warning'):
+                icon = QtGui.QIcon(self.icons['warning.png'])
+            else:
+                icon = QtGui.QIcon(self.icons['check.png'])
+
+            top_level_item.setIcon(0, icon)
+
+    def operation_timed(self, operation: tuple) -> None:
+        """Shows the breakdown of the last operation timed in the status bar."""
+        self.timings_label.setText(maurice_utils.format_operation(operation, max_spans=3))
+        self.timings_label.setToolTip('\n'.join(
+            f'{"    " * (depth + 1)}{name} {duration * 1e3:.1f} ms' for name, depth, duration in operation[2]))
+
     def show_all_images_triggered_action(self) -> None:
         """Executes the signal 'triggered' of the 'show all images' action."""
         self.disable_filter_explorer_filters()
         self.reset_file_explorer_actions_icons()
-        self.update_images_items()
+        self.update_file_explorer_filter()
 
         self.show_all_images_action.setIcon(QtGui.QIcon(self.icons['square-a-color.png']))
 
@@ -977,10 +1192,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.reset_file_explorer_actions_icons()
 
         self.show_base_color_images_action.setIcon(QtGui.QIcon(self.icons['square-d-color.png']))
-        self.base_color_suffix = self.base_color_widget.get_texture_suffix()
         self.show_base_color_items = True
 
-        self.update_images_items()
+        self.update_file_explorer_filter()
 
     def show_roughness_images_triggered_action(self) -> None:
         """Executes the signal 'triggered' of the 'show roughness images' action."""
@@ -989,9 +1203,8 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
         self.show_roughness_images_action.setIcon(QtGui.QIcon(self.icons['square-r-color.png']))
         self.show_roughness_items = True
-        self.roughness_suffix = self.roughness_widget.get_texture_suffix()
 
-        self.update_images_items()
+        self.update_file_explorer_filter()
 
     def show_metalness_images_triggered_action(self) -> None:
         """Executes the signal 'triggered' of the 'show metalness images' action."""
@@ -999,10 +1212,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.reset_file_explorer_actions_icons()
 
         self.show_metalness_images_action.setIcon(QtGui.QIcon(self.icons['square-m-color.png']))
-        self.metalness_suffix = self.metalness_widget.get_texture_suffix()
         self.show_metalness_items = True
 
-        self.update_images_items()
+        self.update_file_explorer_filter()
 
     def show_normal_images_triggered_action(self) -> None:
         """Executes the signal 'triggered' of the 'show normal images' action."""
@@ -1010,10 +1222,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.reset_file_explorer_actions_icons()
 
         self.show_normal_images_action.setIcon(QtGui.QIcon(self.icons['square-n-color.png']))
-        self.normal_suffix = self.normal_widget.get_texture_suffix()
         self.show_normal_items = True
 
-        self.update_images_items()
+        self.update_file_explorer_filter()
 
     def show_height_images_triggered_action(self) -> None:
         """Executes the signal 'triggered' of the 'show height images' action."""
@@ -1021,10 +1232,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.reset_file_explorer_actions_icons()
 
         self.show_height_images_action.setIcon(QtGui.QIcon(self.icons['square-h-color.png']))
-        self.height_suffix = self.height_widget.get_texture_suffix()
         self.show_height_items = True
 
-        self.update_images_items()
+        self.update_file_explorer_filter()
 
     def show_emissive_images_triggered_action(self) -> None:
         """Executes the signal 'triggered' of the 'show emissive images' action."""
@@ -1032,10 +1242,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.reset_file_explorer_actions_icons()
 
         self.show_emissive_images_action.setIcon(QtGui.QIcon(self.icons['square-e-color.png']))
-        self.emissive_suffix = self.emissive_widget.get_texture_suffix()
         self.show_emissive_items = True
 
-        self.update_images_items()
+        self.update_file_explorer_filter()
 
     def show_opacity_images_triggered_action(self) -> None:
         """Executes the signal 'triggered' of the 'show opacity images' action."""
@@ -1043,15 +1252,13 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.reset_file_explorer_actions_icons()
         
         self.show_opacity_images_action.setIcon(QtGui.QIcon(self.icons['square-o-color.png']))
-        self.opacity_suffix = self.opacity_widget.get_texture_suffix()
         self.show_opacity_items = True
 
-        self.update_images_items()
+        self.update_file_explorer_filter()
 
     def create_material_network_triggered_action(self) -> None:
         """Executes the signal 'triggered' of the 'create material network' action."""
-        item = self.file_explorer_tree_widget.currentItem()
-        item_data = item.data(0, QtCore.Qt.UserRole)
+        item_data = self.file_explorer_tree_view.currentIndex().data(QtCore.Qt.UserRole)
         render_engine = self.render_engine_combo_box.currentText()
 
         if render_engine == TextureConnectorUI.ARNOLD:
@@ -1061,6 +1268,12 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         elif render_engine == TextureConnectorUI.V_RAY:
             self.create_material_network_v_ray(image_path=item_data)
 
+    def create_material_networks_triggered_action(self) -> None:
+        """Executes the signal 'triggered' of the 'create material networks' action."""
+        item_data = self.file_explorer_tree_view.currentIndex().data(QtCore.Qt.UserRole)
+
+        self.create_material_networks(folder_path=item_data)
+
     def reveal_in_explorer_triggered_action(self) -> None:
         """Executes the signal 'triggered' of the 'reveal in explorer' action."""
         file_path = self.files_tree_widget.currentItem().data(0, QtCore.Qt.UserRole)
@@ -1080,6 +1293,64 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
                 if self.open_in_finder(file_path):
                     return
 
+    def texture_memory_report_triggered_action(self) -> None:
+        """Executes the signal 'triggered' of the 'texture memory report' action.
+
+        Prints the report in the Script Editor, shows the memory of every texture in its tooltip and the largest ones
+        in bold.
+        """
+        texture_memory_report = TextureMemoryReport()
+        texture_memory_report.build()
+
+        largest_file_nodes = {texture.file_node for texture in texture_memory_report.get_largest_textures()}
+
+        for texture in texture_memory_report.textures:
+            tool_tip = [f'{maurice_utils.format_memory_size(texture.memory)} '
+                        f'({maurice_utils.format_memory_size(texture.mipmapped_memory)} mipmapped)']
+
+            if texture.image_header:
+                tool_tip.append(maurice_utils.format_image_header(texture.image_header))
+
+            if len(texture.paths) > 1:
+                tool_tip.append(f'{len(texture.paths)} tiles')
+
+            if texture.missing_tiles:
+                tool_tip.append(f'Missing tiles: {maurice_utils.format_tiles(texture.missing_tiles)}')
+
+            for item in self.files_items.get(texture.file_texture_name, []):
+                if item.data(0, QtCore.Qt.UserRole)[0] != texture.file_node:
+                    continue
+
+                font = item.font(0)
+                font.setBold(texture.file_node in largest_file_nodes)
+
+                item.setFont(0, font)
+                item.setToolTip(0, '\n'.join(tool_tip))
+
+        for line in texture_memory_report.format().splitlines():
+            om.MGlobal.displayInfo(f'[{maurice.TEXTURE_CONNECTOR}] {line}')
+
+        om.MGlobal.displayInfo(f'[{maurice.TEXTURE_CONNECTOR}] Texture memory report printed in the Script Editor.')
+
+    def profile_triggered_action(self) -> None:
+        """Executes the signal 'triggered' of the 'profile' action, starting or stopping the cProfile capture."""
+        if self.profile_action.isChecked():
+            maurice_utils.start_profiler()
+
+            om.MGlobal.displayInfo(f'[{maurice.TEXTURE_CONNECTOR}] Profiling started.')
+            return
+
+        path = maurice_utils.stop_profiler(os.path.join(maurice_utils.get_data_folder_path(), 'profiling'))
+
+        if path:
+            om.MGlobal.displayInfo(f'[{maurice.TEXTURE_CONNECTOR}] Profile saved to \'{path}\'.')
+
+    def dump_timings_triggered_action(self) -> None:
+        """Executes the signal 'triggered' of the 'dump timings' action."""
+        path = maurice_utils.dump_histograms(os.path.join(maurice_utils.get_data_folder_path(), 'profiling'))
+
+        om.MGlobal.displayInfo(f'[{maurice.TEXTURE_CONNECTOR}] Timings saved to \'{path}\'.')
+
     def show_settings_clicked_push_button(self) -> None:
         """Executes the signal 'clicked' of the 'show settings' push button."""
         self.hide_activity_widgets()
@@ -1150,6 +1421,10 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         """Executes the signal 'toggled' of the 'opacity' check box."""
         self.opacity_widget.setVisible(checked)
 
+    def packed_toggled_check_box(self, checked: bool) -> None:
+        """Executes the signal 'toggled' of the 'packed' check box."""
+        self.packed_widget.setVisible(checked)
+
     def create_material_network_clicked_push_button(self) -> None:
         """Executes the signal 'clicked' of the 'create material network' push button."""
         render_engine = self.render_engine_combo_box.currentText()
@@ -1161,9 +1436,13 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         elif render_engine == TextureConnectorUI.V_RAY:
             self.create_material_network_v_ray()
 
+    def create_material_networks_clicked_push_button(self) -> None:
+        """Executes the signal 'clicked' of the 'create material networks' push button."""
+        self.create_material_networks()
+
     def materials_filter_text_changed_line_edit(self) -> None:
         """Executes the signal 'text changed' of the 'materials filter' line edit."""
-        self.update_materials_items()
+        self.materials_filter_timer.start()
 
     def materials_item_clicked_list_widget(self, item: any) -> None:
         """Executes the signal 'item clicked' of the 'materials' list widget."""
@@ -1178,20 +1457,20 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
             
     def file_explorer_filter_text_changed_line_edit(self) -> None:
         """Executes the signal 'text changed' of the 'file explorer filter' line edit."""
-        self.update_images_items()
+        self.file_explorer_filter_timer.start()
 
-    def file_explore_custom_context_menu_requested_tree_widget(self, pos: any) -> None:
-        """Executes the signal 'custom context menu requested' of the 'file explorer' tree widget."""
-        item = self.file_explorer_tree_widget.currentItem()
+    def file_explore_custom_context_menu_requested_tree_view(self, pos: any) -> None:
+        """Executes the signal 'custom context menu requested' of the 'file explorer' tree view."""
+        index = self.file_explorer_tree_view.currentIndex()
 
-        if item:
-            item_data = item.data(0, QtCore.Qt.UserRole)
+        if index.isValid():
+            item_data = index.data(QtCore.Qt.UserRole)
             file_info = QtCore.QFileInfo(item_data)
 
             context_menu = QtWidgets.QMenu()
             context_menu.setStyleSheet(self.maurice_widgets_style.menu_bar())
 
-            if self.file_explorer_tree_widget.itemAt(pos):
+            if self.file_explorer_tree_view.indexAt(pos).isValid():
                 context_menu.addAction(self.show_all_images_action)
                 context_menu.addAction(self.show_base_color_images_action)
                 context_menu.addAction(self.show_roughness_images_action)
@@ -1201,23 +1480,26 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
                 context_menu.addAction(self.show_emissive_images_action)
                 context_menu.addAction(self.show_opacity_images_action)
 
+                context_menu.addSeparator()
+
                 if file_info.isFile():
-                    context_menu.addSeparator()
                     context_menu.addAction(self.create_material_network_action)
+                else:
+                    context_menu.addAction(self.create_material_networks_action)
 
-            context_menu.exec_(self.file_explorer_tree_widget.mapToGlobal(pos))
+            context_menu.exec_(self.file_explorer_tree_view.viewport().mapToGlobal(pos))
 
-    def file_explorer_item_collapsed_tree_widget(self, item: any) -> None:
-        """Executes the signal 'item collapsed' of the 'file explorer' tree widget."""
-        item.setIcon(0, QtGui.QIcon(self.icons['folder.png']))
+    def file_explorer_collapsed_tree_view(self, index: QtCore.QModelIndex) -> None:
+        """Executes the signal 'collapsed' of the 'file explorer' tree view."""
+        self.file_explorer_model.set_expanded(index=self.file_explorer_proxy_model.mapToSource(index), expanded=False)
 
-    def file_explorer_item_expanded_tree_widget(self, item: any) -> None:
-        """Executes the signal 'item expanded' of the 'file explorer' tree widget."""
-        item.setIcon(0, QtGui.QIcon(self.icons['folder-open.png']))
+    def file_explorer_expanded_tree_view(self, index: QtCore.QModelIndex) -> None:
+        """Executes the signal 'expanded' of the 'file explorer' tree view."""
+        self.file_explorer_model.set_expanded(index=self.file_explorer_proxy_model.mapToSource(index), expanded=True)
 
     def files_filter_text_changed_line_edit(self) -> None:
         """Executes the signal 'text changed' of the 'files filter' line edit."""
-        self.update_files_items()
+        self.files_filter_timer.start()
 
     def files_custom_context_menu_request_tree_widget(self, pos: any) -> None:
         """Executes the signal 'custom context menu requested' of the 'files' tree widget."""
@@ -1228,6 +1510,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
             context_menu.setStyleSheet(self.maurice_widgets_style.menu_bar())
 
             context_menu.addAction(self.repath_files_action)
+            context_menu.addAction(self.texture_memory_report_action)
             context_menu.addSeparator()
             context_menu.addAction(self.reveal_in_explorer)
 
@@ -1414,66 +1697,6 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
         om.MGlobal.displayInfo(f'[{maurice.TEXTURE_CONNECTOR}] Interface updated.')
 
-    def add_image_file_child_item(self, dir_path: str, file_name: str, parent_item: any) -> None:
-        """Adds image file children item."""
-        file_explorer_filter = self.file_explorer_filter_line_edit.text()
-
-        file_path = os.path.join(dir_path, file_name)
-        file_info = QtCore.QFileInfo(file_path)
-
-        file_info_suffix = file_info.suffix().lower()
-        file_info_name = file_info.fileName()
-
-        if file_info_suffix in TextureConnectorUI.IMAGE_EXTENSIONS_SUPPORTED or file_info.isDir():
-            if file_explorer_filter.lower() not in file_info_name.lower():
-                return
-
-            if file_info.isFile():
-                if self.show_base_color_items:
-                    if not self.base_color_suffix or self.base_color_suffix not in file_info_name:
-                        return
-                elif self.show_roughness_items:
-                    if not self.roughness_suffix or self.roughness_suffix not in file_info_name:
-                        return
-                elif self.show_metalness_items:
-                    if not self.metalness_suffix or self.metalness_suffix not in file_info_name:
-                        return
-                elif self.show_normal_items:
-                    if not self.normal_suffix or self.normal_suffix not in file_info_name:
-                        return
-                elif self.show_height_items:
-                    if not self.height_suffix or self.height_suffix not in file_info_name:
-                        return
-                elif self.show_emissive_items:
-                    if not self.emissive_suffix or self.emissive_suffix not in file_info_name:
-                        return
-                elif self.show_opacity_items:
-                    if not self.opacity_suffix or self.opacity_suffix not in file_info_name:
-                        return
-
-            item = QtWidgets.QTreeWidgetItem(parent_item, [file_name])
-            item.setData(0, QtCore.Qt.UserRole, file_path)
-
-            if file_info.isDir():
-                item.setIcon(0, QtGui.QIcon(self.icons['folder.png']))
-                self.add_image_file_children_item(dir_path=file_info.absoluteFilePath(), parent_item=item)
-            else:
-                item.setIcon(0, QtGui.QIcon(self.icons['picture.png']))
-
-            if not parent_item:
-                self.file_explorer_tree_widget.addTopLevelItem(item)
-
-    def add_image_file_children_item(self, dir_path: str, parent_item: any) -> None:
-        """Adds image file children item."""
-        folders_ignored = ['.mayaSwatches', '.vrayThumbs']
-
-        directory = QtCore.QDir(dir_path)
-        directory.setFilter(QtCore.QDir.Dirs | QtCore.QDir.Files | QtCore.QDir.NoDotAndDotDot)
-
-        for file_name in directory.entryList():
-            if file_name not in folders_ignored:
-                self.add_image_file_child_item(dir_path=dir_path, file_name=file_name, parent_item=parent_item)
-
     def add_new_preset(self) -> None:
         """Add a new preset."""
         protected_names = ['Add New Preset', 'Delete Current Preset']
@@ -1497,6 +1720,35 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         s.setValue('presets', ','.join(self.presets_combo_box.items_text()[:-3]))
         s.endGroup()
 
+    def apply_file_explorer_filter(self) -> None:
+        """Applies the text filter of the file explorer."""
+        self.file_explorer_proxy_model.set_text_filter(self.file_explorer_filter_line_edit.text())
+
+    def apply_files_filter(self) -> None:
+        """Applies the text filter of the files, hiding the folders left without files."""
+        self.files_visible_ids, items_changed = self.filter_items(
+            text_filter_index=self.files_filter_index,
+            items=self.files_filter_items,
+            visible_ids=self.files_visible_ids,
+            text=self.files_filter_line_edit.text())
+
+        top_level_items = {id(item.parent()): item.parent() for item in items_changed}
+
+        for top_level_item in top_level_items.values():
+            top_level_item_count = sum(not top_level_item.child(i).isHidden()
+                                       for i in range(top_level_item.childCount()))
+
+            top_level_item.setHidden(not top_level_item_count)
+            top_level_item.setToolTip(0, f'<b>Files:</b> {top_level_item_count}')
+
+    def apply_materials_filter(self) -> None:
+        """Applies the text filter of the materials."""
+        self.materials_visible_ids, items_changed = self.filter_items(
+            text_filter_index=self.materials_filter_index,
+            items=self.materials_filter_items,
+            visible_ids=self.materials_visible_ids,
+            text=self.materials_filter_line_edit.text())
+
     def delete_current_preset(self) -> None:
         """Deletes the current preset and its preference."""
         current_index = self.presets_combo_box.currentIndex()
@@ -1546,27 +1798,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
             image_path = self.get_open_file_name()
 
         if image_path:
-            material_network.set_base_color_settings(
-                enabled=self.use_texture_name_check_box.isChecked(),
-                suffix=self.base_color_widget.get_texture_suffix())
-            material_network.set_roughness_settings(
-                enabled=self.roughness_check_box.isChecked(),
-                suffix=self.roughness_widget.get_texture_suffix())
-            material_network.set_metalness_settings(
-                enabled=self.metalness_check_box.isChecked(),
-                suffix=self.metalness_widget.get_texture_suffix())
-            material_network.set_normal_settings(
-                enabled=self.normal_check_box.isChecked(),
-                suffix=self.normal_widget.get_texture_suffix())
-            material_network.set_height_settings(
-                enabled=self.height_check_box.isChecked(),
-                suffix=self.height_widget.get_texture_suffix())
-            material_network.set_emissive_settings(
-                enabled=self.emissive_check_box.isChecked(),
-                suffix=self.emissive_widget.get_texture_suffix())
-            material_network.set_opacity_settings(
-                enabled=self.opacity_check_box.isChecked(),
-                suffix=self.opacity_widget.get_texture_suffix())
+            self.set_material_network_settings(material_network)
 
             material_network.create(
                 name=name,
@@ -1578,6 +1810,50 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
             self.update_files_items()
             self.select_material_item(material_network.get_material())
 
+    def create_material_networks(self, folder_path: str = '') -> None:
+        """Creates a material network for every texture set in the folder and its subfolders."""
+        render_engine = self.render_engine_combo_box.currentText()
+
+        if render_engine == TextureConnectorUI.ARNOLD:
+            material_network = CreateMaterialNetworkArnold()
+            render_engine_plugin_name = 'mtoa'
+        elif render_engine == TextureConnectorUI.REDSHIFT:
+            material_network = CreateMaterialNetworkRedshift()
+            render_engine_plugin_name = 'redshift4maya'
+        elif render_engine == TextureConnectorUI.V_RAY:
+            material_network = CreateMaterialNetworkVRay()
+            render_engine_plugin_name = 'vrayformaya'
+        else:
+            return
+
+        self.load_look_dev_kit_plugin()
+        self.clear_textures_info()
+
+        use_triplanar = self.use_triplanar_check_box.isChecked()
+
+        if not material_network.are_plugins_loaded(
+                render_engine_plugin_name=render_engine_plugin_name,
+                use_triplanar=use_triplanar):
+            return
+
+        if not folder_path:
+            current_maya_project = cmds.workspace(rootDirectory=True, query=True)
+            source_images_path = os.path.join(current_maya_project, 'sourceimages')
+            folder_path = QtWidgets.QFileDialog.getExistingDirectory(self, 'Select Folder', source_images_path)
+
+        if folder_path:
+            self.set_material_network_settings(material_network)
+
+            materials = material_network.create_batch(
+                folder_path=folder_path,
+                recursive=True,
+                use_triplanar=use_triplanar)
+
+            if materials:
+                self.update_materials_items()
+                self.update_files_items()
+                self.select_material_item(materials[-1])
+
     def load_look_dev_kit_plugin(self) -> None:
         """Loads the look dev kit plugin."""
         plugins_loaded = cmds.pluginInfo(listPlugins=True, query=True)
@@ -1656,13 +1932,16 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.show_emissive_items = False
         self.show_opacity_items = False
 
+    @maurice_utils.timed()
     def display_material_properties(self, material: str) -> None:
         """Displays the material's properties."""
         render_engine = self.render_engine_combo_box.currentText()
 
         if render_engine == TextureConnectorUI.ARNOLD:
             if cmds.objectType(material, isType='aiStandardSurface'):
-                self.edit_material_network_arnold = EditMaterialNetworkArnold(material)
+                self.edit_material_network_arnold = EditMaterialNetworkArnold(
+                    material,
+                    file_nodes=self.material_network_index.get_file_nodes(material, EditMaterialNetworkArnold))
 
                 self.get_textures_properties(material_network=self.edit_material_network_arnold)
                 self.display_textures_properties()
@@ -1671,7 +1950,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
         elif render_engine == TextureConnectorUI.REDSHIFT:
             if cmds.objectType(material, isType='RedshiftStandardMaterial'):
-                self.edit_material_network_redshift = EditMaterialNetworkRedshift(material)
+                self.edit_material_network_redshift = EditMaterialNetworkRedshift(
+                    material,
+                    file_nodes=self.material_network_index.get_file_nodes(material, EditMaterialNetworkRedshift))
 
                 self.get_textures_properties(material_network=self.edit_material_network_redshift)
                 self.display_textures_properties()
@@ -1680,7 +1961,9 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
         elif render_engine == TextureConnectorUI.V_RAY:
             if cmds.objectType(material, isType='VRayMtl'):
-                self.edit_material_network_v_ray = EditMaterialNetworkVRay(material)
+                self.edit_material_network_v_ray = EditMaterialNetworkVRay(
+                    material,
+                    file_nodes=self.material_network_index.get_file_nodes(material, EditMaterialNetworkVRay))
 
                 self.get_textures_properties(material_network=self.edit_material_network_v_ray)
                 self.display_textures_properties()
@@ -1704,6 +1987,57 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         self.opacity_widget.set_texture_path(self.opacity_file_texture_name)
         self.opacity_widget.set_texture_color_space(self.opacity_color_space)
 
+    @staticmethod
+    def filter_items(text_filter_index: TextFilterIndex, items: list, visible_ids: set, text: str) -> tuple:
+        """Shows the items whose text contains the filter and hides the others.
+
+        Only the items whose visibility changed are touched. Returns the ids of the items shown and the items changed.
+        """
+        ids = text_filter_index.filter(text)
+        items_changed = []
+
+        for item_id in ids.symmetric_difference(visible_ids):
+            item = items[item_id]
+            item.setHidden(item_id not in ids)
+
+            items_changed.append(item)
+
+        return ids, items_changed
+
+    def get_channels_suffixes(self) -> tuple:
+        """Gets the (channel, suffix) pairs of the current preset."""
+        channels_suffixes = (
+            (maurice_utils.BASE_COLOR, self.base_color_widget.get_texture_suffix()),
+            (maurice_utils.ROUGHNESS, self.roughness_widget.get_texture_suffix()),
+            (maurice_utils.METALNESS, self.metalness_widget.get_texture_suffix()),
+            (maurice_utils.NORMAL, self.normal_widget.get_texture_suffix()),
+            (maurice_utils.HEIGHT, self.height_widget.get_texture_suffix()),
+            (maurice_utils.EMISSIVE, self.emissive_widget.get_texture_suffix()),
+            (maurice_utils.OPACITY, self.opacity_widget.get_texture_suffix()),
+            (maurice_utils.PACKED, self.packed_widget.get_texture_suffix())
+        )
+
+        return channels_suffixes
+
+    def get_file_explorer_channel_filter(self) -> str:
+        """Gets the channel the file explorer is filtered by, or '' if all the images are shown."""
+        if self.show_base_color_items:
+            return maurice_utils.BASE_COLOR
+        elif self.show_roughness_items:
+            return maurice_utils.ROUGHNESS
+        elif self.show_metalness_items:
+            return maurice_utils.METALNESS
+        elif self.show_normal_items:
+            return maurice_utils.NORMAL
+        elif self.show_height_items:
+            return maurice_utils.HEIGHT
+        elif self.show_emissive_items:
+            return maurice_utils.EMISSIVE
+        elif self.show_opacity_items:
+            return maurice_utils.OPACITY
+
+        return ''
+
     def get_open_file_name(self) -> str:
         """Gets and opens the file name."""
         current_maya_project = cmds.workspace(rootDirectory=True, query=True)
@@ -1779,7 +2113,7 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         """Selects the material item."""
         items = self.materials_list_widget.findItems(material_name, QtCore.Qt.MatchExactly)
 
-        if items:
+        if items and not items[0].isHidden():
             self.materials_list_widget.setCurrentItem(items[0])
 
     def set_current_maya_project_path_label(self) -> None:
@@ -1802,6 +2136,42 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         else:
             self.maya_project_status_label.setVisible(False)
 
+    def set_material_network_settings(self, material_network: any) -> None:
+        """Sets the material network settings from the interface."""
+        material_network.set_base_color_settings(
+            enabled=self.base_color_check_box.isChecked(),
+            suffix=self.base_color_widget.get_texture_suffix())
+        material_network.set_roughness_settings(
+            enabled=self.roughness_check_box.isChecked(),
+            suffix=self.roughness_widget.get_texture_suffix())
+        material_network.set_metalness_settings(
+            enabled=self.metalness_check_box.isChecked(),
+            suffix=self.metalness_widget.get_texture_suffix())
+        material_network.set_normal_settings(
+            enabled=self.normal_check_box.isChecked(),
+            suffix=self.normal_widget.get_texture_suffix())
+        material_network.set_height_settings(
+            enabled=self.height_check_box.isChecked(),
+            suffix=self.height_widget.get_texture_suffix())
+        material_network.set_emissive_settings(
+            enabled=self.emissive_check_box.isChecked(),
+            suffix=self.emissive_widget.get_texture_suffix())
+        material_network.set_opacity_settings(
+            enabled=self.opacity_check_box.isChecked(),
+            suffix=self.opacity_widget.get_texture_suffix())
+        material_network.set_packed_settings(
+            enabled=self.packed_check_box.isChecked(),
+            suffix=self.packed_widget.get_texture_suffix())
+        material_network.set_case_sensitivity(self.case_sensitivity_check_box.isChecked())
+        material_network.set_use_constant_textures(self.use_constant_textures_check_box.isChecked())
+        material_network.set_use_existing_file_nodes(self.reuse_file_nodes_check_box.isChecked())
+        material_network.set_file_node_index(self.file_node_index)
+
+        if self.use_dg_modifier_check_box.isChecked():
+            material_network.set_backend(NetworkBackendOpenMaya())
+        else:
+            material_network.set_backend(NetworkBackendCmds())
+
     def set_render_engines(self, *args) -> None:
         """Sets render engines."""
         plugins_loaded = cmds.pluginInfo(listPlugins=True, query=True)
@@ -1840,12 +2210,20 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         else:
             self.setWindowTitle(maurice.TEXTURE_CONNECTOR)
 
+    @maurice_utils.timed()
     def update_files_items(self) -> None:
-        """Updated files items."""
+        """Updated files items.
+
+        The items are shown at once with a pending status, a FileStatusWorker resolves the files existence off the main
+        thread and 'files_status_resolved' updates the icons as the results arrive.
+        """
         self.files_tree_widget.clear()
+        self.files_items.clear()
+        self.files_filter_items.clear()
+
+        if self.file_status_worker:
+            self.file_status_worker.cancel()
 
-        current_maya_project = cmds.workspace(rootDirectory=True, query=True)
-        files_filter = self.files_filter_line_edit.text()
         root_paths = {}
 
         for file_node in cmds.ls(type='file'):
@@ -1862,67 +2240,60 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
 
                     root_paths[file_texture_dirname] = files
 
+        pending_icon = QtGui.QIcon(self.icons['refresh.png'])
+        directories_files = {}
+
         for key in root_paths.keys():
             top_level_item = QtWidgets.QTreeWidgetItem()
             top_level_item.setData(0, QtCore.Qt.UserRole, key)
-
-            if os.path.exists(key):
-                if key.startswith(current_maya_project):
-                    top_level_item.setText(0, f'../{os.path.basename(os.path.split(os.path.normpath(key))[-1])}')
-                else:
-                    top_level_item.setText(0, key)
-            else:
-                top_level_item.setText(0, key)
-
-            file_status = []
+            top_level_item.setText(0, key)
 
             for value in root_paths[key]:
                 file_node, file_texture_name = value
 
-                if files_filter.lower() in file_texture_name.lower():
-                    item = QtWidgets.QTreeWidgetItem(top_level_item, [os.path.basename(file_texture_name)])
-                    item.setData(0, QtCore.Qt.UserRole, (file_node, file_texture_name))
+                item = QtWidgets.QTreeWidgetItem(top_level_item, [os.path.basename(file_texture_name)])
+                item.setData(0, QtCore.Qt.UserRole, (file_node, file_texture_name))
+                item.setIcon(0, pending_icon)
 
-                    if os.path.exists(file_texture_name):
-                        if file_texture_name.startswith(current_maya_project):
-                            icon = QtGui.QIcon(self.icons['check.png'])
-                            file_status.append('check')
-                        else:
-                            icon = QtGui.QIcon(self.icons['warning.png'])
-                            file_status.append('warning')
-                    else:
-                        icon = QtGui.QIcon(self.icons['cross.png'])
-                        file_status.append('cross')
+                self.files_items.setdefault(file_texture_name, []).append(item)
+                self.files_filter_items.append(item)
+                directories_files.setdefault(key, []).append(file_texture_name)
 
-                    item.setIcon(0, icon)
+            self.files_tree_widget.addTopLevelItem(top_level_item)
+            top_level_item.setIcon(0, pending_icon)
+            top_level_item.setExpanded(True)
+            top_level_item.setToolTip(0, f'<b>Files:</b> {top_level_item.childCount()}')
 
-            file_status_cross_count = file_status.count('cross')
-            file_status_warning_count = file_status.count('warning')
+        self.files_filter_index.set_texts([item.data(0, QtCore.Qt.UserRole)[1] for item in self.files_filter_items])
+        self.files_visible_ids = set(range(len(self.files_filter_items)))
+        self.apply_files_filter()
 
-            if file_status_cross_count:
-                icon = QtGui.QIcon(self.icons['cross.png'])
-            elif file_status_warning_count:
-                icon = QtGui.QIcon(self.icons['warning.png'])
-            else:
-                icon = QtGui.QIcon(self.icons['check.png'])
+        self.file_status_generation += 1
+        self.file_status_worker = None
 
-            top_level_item_count = top_level_item.childCount()
+        if directories_files:
+            self.file_status_worker = FileStatusWorker(
+                generation=self.file_status_generation,
+                directories_files=directories_files)
+            self.file_status_worker.signals.files_resolved.connect(self.files_status_resolved)
 
-            if top_level_item_count:
-                self.files_tree_widget.addTopLevelItem(top_level_item)
-                top_level_item.setIcon(0, icon)
-                top_level_item.setExpanded(True)
-                top_level_item.setToolTip(0, f'<b>Files:</b> {top_level_item_count}')
+            QtCore.QThreadPool.globalInstance().start(self.file_status_worker)
 
+    @maurice_utils.timed()
     def update_images_items(self) -> None:
         """Updates images items."""
         current_maya_project = cmds.workspace(rootDirectory=True, query=True)
         source_images_project_path = os.path.join(current_maya_project, 'sourceimages')
 
-        self.file_explorer_tree_widget.clear()
+        self.update_file_explorer_filter()
+        self.file_explorer_model.set_root_path(source_images_project_path)
 
-        if os.path.exists(source_images_project_path):
-            self.add_image_file_children_item(dir_path=source_images_project_path, parent_item=None)
+    def update_file_explorer_filter(self) -> None:
+        """Updates the channel filter of the file explorer, the folders are not listed again."""
+        self.file_explorer_proxy_model.set_channel_filter(
+            channel=self.get_file_explorer_channel_filter(),
+            channels_suffixes=self.get_channels_suffixes(),
+            case_sensitive=self.case_sensitivity_check_box.isChecked())
 
     def update_materials_items(self) -> None:
         """Updates the materials items."""
@@ -1937,17 +2308,24 @@ class TextureConnectorUI(maurice_qt.QDialogMaya):
         else:
             material_type = ''
 
-        materials_filter = self.materials_filter_line_edit.text()
         materials = cmds.ls(materials=True)
         materials.sort()
 
         self.materials_list_widget.clear()
+        self.materials_filter_items.clear()
+
+        material_icon = QtGui.QIcon(self.icons['bowling-ball.png'])
 
         for material in materials:
-            if cmds.objectType(material, isType=material_type) and materials_filter.lower() in material.lower():
+            if cmds.objectType(material, isType=material_type):
                 item = QtWidgets.QListWidgetItem(material)
-                item.setIcon(QtGui.QIcon(self.icons['bowling-ball.png']))
+                item.setIcon(material_icon)
                 self.materials_list_widget.addItem(item)
+                self.materials_filter_items.append(item)
+
+        self.materials_filter_index.set_texts([item.text() for item in self.materials_filter_items])
+        self.materials_visible_ids = set(range(len(self.materials_filter_items)))
+        self.apply_materials_filter()
 
     def update_watched_paths(self) -> None:
         """Updates the watched paths."""
@@ -32,7 +32,7 @@ class TextureSettingsWidget(QtWidgets.QWidget):
         """Initializes class attributes."""
         super(TextureSettingsWidget, self).__init__()
 
-        self.maurice_widgets_style = maurice_qt.MauriceWidgetsStyle()
+        self.maurice_widgets_style = maurice_qt.MauriceWidgetsStyle.get_instance()
 
         # Files path class variables.
         self.icons = maurice_utils.get_icons()
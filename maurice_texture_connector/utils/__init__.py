@@ -7,16 +7,98 @@ Updated Date: 11-05-2024
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
+# maurice_constant_textures.py
+from maurice_texture_connector.utils.maurice_constant_textures import CONSTANT_TEXTURES_WORKERS
+from maurice_texture_connector.utils.maurice_constant_textures import CONSTANT_TOLERANCE
+from maurice_texture_connector.utils.maurice_constant_textures import analyze_constant_texture
+from maurice_texture_connector.utils.maurice_constant_textures import analyze_constant_textures
+from maurice_texture_connector.utils.maurice_constant_textures import get_luminance
+
+# maurice_image_headers.py
+from maurice_texture_connector.utils.maurice_image_headers import ImageHeader
+from maurice_texture_connector.utils.maurice_image_headers import LARGE_IMAGE_SIZE
+from maurice_texture_connector.utils.maurice_image_headers import format_image_header
+from maurice_texture_connector.utils.maurice_image_headers import format_memory_size
+from maurice_texture_connector.utils.maurice_image_headers import get_image_memory
+from maurice_texture_connector.utils.maurice_image_headers import get_mip_levels
+from maurice_texture_connector.utils.maurice_image_headers import is_large_image
+from maurice_texture_connector.utils.maurice_image_headers import read_image_header
+
+# maurice_maya_ascii.py
+from maurice_texture_connector.utils.maurice_maya_ascii import find_project_path
+from maurice_texture_connector.utils.maurice_maya_ascii import TextureRepath
+from maurice_texture_connector.utils.maurice_maya_ascii import get_maya_ascii_file_textures
+from maurice_texture_connector.utils.maurice_maya_ascii import repath_maya_ascii_scene
+
 # maurice_paths.py
+from maurice_texture_connector.utils.maurice_paths import FileEntry
+from maurice_texture_connector.utils.maurice_paths import IMAGE_EXTENSIONS
+from maurice_texture_connector.utils.maurice_paths import IMAGE_HEADERS_WORKERS
+from maurice_texture_connector.utils.maurice_paths import STAT_CACHE_TTL
+from maurice_texture_connector.utils.maurice_paths import clear_stat_cache
+from maurice_texture_connector.utils.maurice_paths import get_cached_stat
 from maurice_texture_connector.utils.maurice_paths import get_data_folder_path
 from maurice_texture_connector.utils.maurice_paths import get_files_in_folder
+from maurice_texture_connector.utils.maurice_paths import get_folder_images_headers
 from maurice_texture_connector.utils.maurice_paths import get_icons
 from maurice_texture_connector.utils.maurice_paths import get_icons_folder_path
+from maurice_texture_connector.utils.maurice_paths import get_image_header
 from maurice_texture_connector.utils.maurice_paths import get_images
 from maurice_texture_connector.utils.maurice_paths import get_images_folder_path
+from maurice_texture_connector.utils.maurice_paths import get_images_headers
+from maurice_texture_connector.utils.maurice_paths import get_plugins_folder_path
 from maurice_texture_connector.utils.maurice_paths import get_root_path
+from maurice_texture_connector.utils.maurice_paths import get_texture_status
 from maurice_texture_connector.utils.maurice_paths import is_image
+from maurice_texture_connector.utils.maurice_paths import replace_path_prefix
+from maurice_texture_connector.utils.maurice_paths import scan_folder
+from maurice_texture_connector.utils.maurice_paths import strip_trailing_slash
+
+# maurice_profiling.py
+from maurice_texture_connector.utils.maurice_profiling import TimingSpan
+from maurice_texture_connector.utils.maurice_profiling import add_operation_listener
+from maurice_texture_connector.utils.maurice_profiling import clear_histograms
+from maurice_texture_connector.utils.maurice_profiling import dump_histograms
+from maurice_texture_connector.utils.maurice_profiling import format_operation
+from maurice_texture_connector.utils.maurice_profiling import get_histograms
+from maurice_texture_connector.utils.maurice_profiling import get_last_operation
+from maurice_texture_connector.utils.maurice_profiling import is_profiler_running
+from maurice_texture_connector.utils.maurice_profiling import remove_operation_listener
+from maurice_texture_connector.utils.maurice_profiling import set_profiling_enabled
+from maurice_texture_connector.utils.maurice_profiling import start_profiler
+from maurice_texture_connector.utils.maurice_profiling import stop_profiler
+from maurice_texture_connector.utils.maurice_profiling import timed
 
 # maurice_screen.py
+from maurice_texture_connector.utils.maurice_screen import DEFAULT_PPI
 from maurice_texture_connector.utils.maurice_screen import get_ppi
 from maurice_texture_connector.utils.maurice_screen import get_value_by_ppi
+
+# maurice_textures.py
+from maurice_texture_connector.utils.maurice_textures import BASE_COLOR
+from maurice_texture_connector.utils.maurice_textures import CHANNELS
+from maurice_texture_connector.utils.maurice_textures import EMISSIVE
+from maurice_texture_connector.utils.maurice_textures import FIRST_UDIM_TILE
+from maurice_texture_connector.utils.maurice_textures import HEIGHT
+from maurice_texture_connector.utils.maurice_textures import LAST_UDIM_TILE
+from maurice_texture_connector.utils.maurice_textures import MAX_SEQUENCE_SPAN_RATIO
+from maurice_texture_connector.utils.maurice_textures import METALNESS
+from maurice_texture_connector.utils.maurice_textures import NORMAL
+from maurice_texture_connector.utils.maurice_textures import OPACITY
+from maurice_texture_connector.utils.maurice_textures import PACKED
+from maurice_texture_connector.utils.maurice_textures import PACKED_LAYOUT
+from maurice_texture_connector.utils.maurice_textures import ROUGHNESS
+from maurice_texture_connector.utils.maurice_textures import SEQUENCE_TOKENS
+from maurice_texture_connector.utils.maurice_textures import TextureSequence
+from maurice_texture_connector.utils.maurice_textures import UDIM_TOKEN
+from maurice_texture_connector.utils.maurice_textures import format_sequence
+from maurice_texture_connector.utils.maurice_textures import format_tiles
+from maurice_texture_connector.utils.maurice_textures import get_channels_pattern
+from maurice_texture_connector.utils.maurice_textures import get_missing_tiles
+from maurice_texture_connector.utils.maurice_textures import get_packed_channels
+from maurice_texture_connector.utils.maurice_textures import get_sequence_key
+from maurice_texture_connector.utils.maurice_textures import get_sequence_paths
+from maurice_texture_connector.utils.maurice_textures import get_sequence_tiles
+from maurice_texture_connector.utils.maurice_textures import get_texture_sequences
+from maurice_texture_connector.utils.maurice_textures import is_sequence_pattern
+from maurice_texture_connector.utils.maurice_textures import match_texture_channel
@@ -0,0 +1,338 @@
+"""
+========================================================================================================================
+Name: maurice_constant_textures.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+import threading
+import struct
+import zlib
+import sys
+import os
+
+from maurice_texture_connector.utils.maurice_paths import get_cached_stat
+
+
+# Largest difference between the channels values of a texture considered constant, values being from 0 to 1.
+CONSTANT_TOLERANCE = 1.0 / 255.0
+
+# Width and height of the decimated sample of the pixels read with OpenImageIO.
+SAMPLE_SIZE = 64
+
+# Bytes of PNG image data decompressed at a time.
+PNG_BLOCK_SIZE = 1 << 20
+
+# Processes analyzing the textures.
+CONSTANT_TEXTURES_WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+
+# NumPy and OpenImageIO, imported on first use by import_modules as they are slow to import and optional.
+np = None
+oiio = None
+has_imported_modules = False
+
+# {(path, mtime, size, tolerance): (r, g, b) or None}
+constant_textures_cache = {}
+constant_textures_cache_lock = threading.Lock()
+
+
+def analyze_constant_texture(path: str, tolerance: float = CONSTANT_TOLERANCE) -> tuple:
+    """Gets the (r, g, b) value of a constant texture, from 0 to 1, or None if it is not constant or can not be read.
+
+    With OpenImageIO, a decimated sample of the pixels of any image is read, from its smallest mip level large enough,
+    and the textures whose values vary less than the tolerance are constant. Without it, only the PNG images are read
+    and only the exactly constant ones are found, from the filtered bytes of the image without reconstructing them.
+    The alpha of the textures is ignored.
+    """
+    import_modules()
+
+    if np is None:
+        return None
+
+    try:
+        if oiio is not None:
+            pixels = read_pixels_sample(path)
+
+            return get_constant_value(pixels, tolerance) if pixels is not None else None
+
+        with open(path, 'rb') as f:
+            if f.read(8) == b'\x89PNG\r\n\x1a\n':
+                return get_png_constant_value(f)
+    except (OSError, ValueError, KeyError, struct.error, zlib.error):
+        pass
+
+    return None
+
+
+def analyze_constant_textures(paths: list, tolerance: float = CONSTANT_TOLERANCE,
+                              max_workers: int = CONSTANT_TEXTURES_WORKERS) -> dict:
+    """Gets the value of the constant textures: {path: (r, g, b) or None}.
+
+    The textures are analyzed in a process pool, the results are cached by the path, mtime and size of the files.
+    """
+    results = {}
+    signatures = {}
+
+    for path in dict.fromkeys(paths):
+        stat = get_cached_stat(path)
+
+        if not stat:
+            results[path] = None
+            continue
+
+        signature = (os.path.normpath(path), stat.st_mtime_ns, stat.st_size, tolerance)
+
+        with constant_textures_cache_lock:
+            if signature in constant_textures_cache:
+                results[path] = constant_textures_cache[signature]
+                continue
+
+        signatures[path] = signature
+
+    import_modules()
+
+    if np is None:
+        results.update((path, None) for path in signatures)
+        return results
+
+    if max_workers > 1 and len(signatures) > 1:
+        # Imported here as the process pool is only used when the constant textures are enabled.
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+
+        mp_context = multiprocessing.get_context('spawn')
+        mp_context.set_executable(get_python_executable())
+
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(signatures)), mp_context=mp_context) as executor:
+            values = list(executor.map(analyze_constant_texture, signatures, [tolerance] * len(signatures)))
+    else:
+        values = [analyze_constant_texture(path, tolerance) for path in signatures]
+
+    with constant_textures_cache_lock:
+        for (path, signature), value in zip(signatures.items(), values):
+            constant_textures_cache[signature] = value
+            results[path] = value
+
+    return results
+
+
+def get_constant_value(pixels: any, tolerance: float) -> tuple:
+    """Gets the (r, g, b) mean of pixels of a (height, width, channels) array, None if they vary more than tolerance."""
+    pixels = pixels.reshape(-1, pixels.shape[-1])[:, :3]
+
+    if np.any(pixels.max(axis=0) - pixels.min(axis=0) > tolerance):
+        return None
+
+    value = pixels.mean(axis=0, dtype=np.float64)
+
+    return tuple(float(value[min(i, len(value) - 1)]) for i in range(3))
+
+
+def get_luminance(value: tuple) -> float:
+    """Gets the luminance of a (r, g, b) value, as Maya computes it for the 'alpha is luminance' file nodes."""
+    return 0.3 * value[0] + 0.59 * value[1] + 0.11 * value[2]
+
+
+def get_png_constant_value(f: any) -> tuple:
+    """Gets the (r, g, b) value of an exactly constant PNG image, from its filtered bytes, or None.
+
+    In a constant image, every filter leaves the same bytes on every row but the first: the color for 'None', the color
+    then zeros for 'Sub' and zeros for the others, except the first pixel for 'Average'. So the rows are compared with
+    the expected ones in a few vectorized operations, without reconstructing the pixels. The filters work on each byte
+    with the same byte of the neighbor pixels, so the bytes of the alpha are left out. The image data is decompressed
+    a block of rows at a time, stopping at the first row that differs.
+    """
+    header = None
+    palette = b''
+
+    length, chunk_type = struct.unpack('>I4s', f.read(8))
+
+    while chunk_type != b'IDAT':
+        chunk = f.read(length)
+        f.read(4)
+
+        if chunk_type == b'IHDR':
+            header = struct.unpack('>IIBBBBB', chunk)
+        elif chunk_type == b'PLTE':
+            palette = chunk
+        elif chunk_type == b'IEND' or not chunk_type:
+            return None
+
+        length, chunk_type = struct.unpack('>I4s', f.read(8))
+
+    width, height, bit_depth, color_type, compression, filter_method, interlace = header
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[color_type]
+
+    if interlace or bit_depth < 8:
+        return None
+
+    pixel_size = channels * bit_depth // 8
+    color_size = (channels - 1 if color_type in (4, 6) else channels) * bit_depth // 8
+    color_mask = np.tile(np.arange(pixel_size) < color_size, width) if color_size < pixel_size else None
+    row_size = width * pixel_size + 1
+    block_size = max(1, PNG_BLOCK_SIZE // row_size) * row_size
+
+    decompressor = zlib.decompressobj()
+    color = None
+    expected_rows = {}
+    data = b''
+    row = 0
+
+    while row < height:
+        if chunk_type != b'IDAT':
+            return None
+
+        compressed_data = f.read(length)
+        f.read(4)
+
+        while compressed_data and row < height:
+            data += decompressor.decompress(compressed_data, block_size)
+            compressed_data = decompressor.unconsumed_tail
+            rows_count = min(len(data) // row_size, height - row)
+
+            if not rows_count:
+                continue
+
+            rows = np.frombuffer(data, dtype=np.uint8, count=rows_count * row_size).reshape(rows_count, row_size)
+            data = data[rows_count * row_size:]
+            filters = rows[:, 0]
+            rows = rows[:, 1:]
+
+            if color is None:
+                color = rows[0, :pixel_size].copy()
+                expected_rows = get_png_expected_rows(color, width, pixel_size)
+
+                if color_mask is not None:
+                    expected_rows = {row_filter: (first_row[color_mask], other_rows[color_mask])
+                                     for row_filter, (first_row, other_rows) in expected_rows.items()}
+
+            if color_mask is not None:
+                rows = rows[:, color_mask]
+
+            for row_filter in np.unique(filters):
+                if int(row_filter) not in expected_rows:
+                    return None
+
+                first_row, other_rows = expected_rows[int(row_filter)]
+                filter_rows = np.flatnonzero(filters == row_filter)
+
+                if row == 0 and filter_rows[0] == 0:
+                    if not np.array_equal(rows[0], first_row):
+                        return None
+
+                    filter_rows = filter_rows[1:]
+
+                if filter_rows.size and not np.all(rows[filter_rows] == other_rows):
+                    return None
+
+            row += rows_count
+
+        if row < height:
+            length, chunk_type = struct.unpack('>I4s', f.read(8))
+
+    if bit_depth == 16:
+        value = [(int(color[i]) << 8 | int(color[i + 1])) / 65535.0 for i in range(0, color_size, 2)]
+    elif color_type == 3:
+        value = [palette[int(color[0]) * 3 + i] / 255.0 for i in range(3)]
+    else:
+        value = [int(byte) / 255.0 for byte in color[:color_size]]
+
+    return tuple(value[i] if len(value) > 2 else value[0] for i in range(3))
+
+
+def get_png_expected_rows(color: any, width: int, pixel_size: int) -> dict:
+    """Gets the {filter: (expected first row, expected other rows)} filtered bytes of a PNG image of the color.
+
+    The row before the first one is made of zeros.
+    """
+    half_color = color - color // 2
+    color_row = np.tile(color, width)
+    zeros_row = np.zeros_like(color_row)
+
+    first_pixel_row = zeros_row.copy()
+    first_pixel_row[:pixel_size] = color
+    first_average_row = np.tile(half_color, width)
+    first_average_row[:pixel_size] = color
+    average_row = zeros_row.copy()
+    average_row[:pixel_size] = half_color
+
+    return {
+        0: (color_row, color_row),
+        1: (first_pixel_row, first_pixel_row),
+        2: (color_row, zeros_row),
+        3: (first_average_row, average_row),
+        4: (first_pixel_row, zeros_row)
+    }
+
+
+def get_python_executable() -> str:
+    """Gets the Python executable of the worker processes, mayapy when running in the Maya interface."""
+    executable = sys.executable
+    executable_name = os.path.basename(executable).lower()
+
+    if executable_name.startswith('maya') and not executable_name.startswith('mayapy'):
+        executable = os.path.join(os.path.dirname(executable), f'mayapy{".exe" if os.name == "nt" else ""}')
+
+    return executable
+
+
+def import_modules() -> None:
+    """Imports NumPy and OpenImageIO the first time they are needed, each is None if it is not installed."""
+    global np, oiio, has_imported_modules
+
+    if has_imported_modules:
+        return
+
+    has_imported_modules = True
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    try:
+        import OpenImageIO as oiio
+    except ImportError:
+        oiio = None
+
+
+def read_pixels_sample(path: str) -> any:
+    """Reads a decimated sample of the pixels of the image with OpenImageIO, as a (height, width, channels) array.
+
+    Only the scanlines of the sample are read, from the smallest mip level large enough. The alpha is left out: only
+    the first channel of the images with less than three channels is read, as the luminance and alpha of a grey image.
+    """
+    image_input = oiio.ImageInput.open(path)
+
+    if not image_input:
+        return None
+
+    try:
+        mip_level = 0
+
+        while image_input.seek_subimage(0, mip_level + 1):
+            spec = image_input.spec()
+
+            if min(spec.width, spec.height) < SAMPLE_SIZE:
+                break
+
+            mip_level += 1
+
+        image_input.seek_subimage(0, mip_level)
+        spec = image_input.spec()
+        channels = 3 if spec.nchannels >= 3 else 1
+        rows = []
+
+        for y in range(spec.y, spec.y + spec.height, max(1, spec.height // SAMPLE_SIZE)):
+            pixels = image_input.read_scanlines(0, mip_level, y, y + 1, spec.z, 0, channels, 'float')
+
+            if pixels is None:
+                return None
+
+            rows.append(pixels.reshape(spec.width, channels)[::max(1, spec.width // SAMPLE_SIZE)])
+    finally:
+        image_input.close()
+
+    return np.stack(rows)
@@ -0,0 +1,295 @@
+"""
+========================================================================================================================
+Name: maurice_image_headers.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from collections import namedtuple
+import struct
+import math
+
+
+# 'bit_depth' is the one of the deepest channel, 'mip_levels' is 1 if the image has no mipmaps.
+ImageHeader = namedtuple(
+    'ImageHeader',
+    ('format', 'width', 'height', 'channels', 'bit_depth', 'is_float', 'is_tiled', 'mip_levels'))
+
+# Width or height from which an image is reported as too large.
+LARGE_IMAGE_SIZE = 16384
+
+# Bytes read at once, the headers are in the first ones, except the JPEG frames which can follow a large EXIF.
+HEADER_READ_SIZE = 4096
+
+# Image File Directories followed in a TIFF, one per mip level for .tx files.
+MAX_TIFF_DIRECTORIES = 32
+
+JPEG_FRAME_MARKERS = frozenset((0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF))
+
+# {PNG color type: channels}
+PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+# {EXR pixel type: bits}
+EXR_PIXEL_TYPES_BITS = {0: 32, 1: 16, 2: 32}
+
+# {TIFF type: (struct format, size)}
+TIFF_TYPES = {1: ('B', 1), 3: ('H', 2), 4: ('I', 4), 16: ('Q', 8)}
+
+
+def format_image_header(image_header: ImageHeader) -> str:
+    """Formats the image header: '4096 x 4096, 3 channels, 16 bits float, tiled, 13 mip levels'."""
+    text = (f'{image_header.width} x {image_header.height}, {image_header.channels} channels, '
+            f'{image_header.bit_depth} bits{" float" if image_header.is_float else ""}')
+
+    if image_header.is_tiled:
+        text += ', tiled'
+
+    if image_header.mip_levels > 1:
+        text += f', {image_header.mip_levels} mip levels'
+
+    return text
+
+
+def format_memory_size(size: int) -> str:
+    """Formats a memory size in bytes: '1.5 GB'."""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024:
+            return f'{size:.1f} {unit}' if unit != 'B' else f'{size} B'
+
+        size /= 1024
+
+    return f'{size:.1f} TB'
+
+
+def get_image_memory(image_header: ImageHeader) -> tuple:
+    """Gets the (memory, mipmapped memory) in bytes the image takes once loaded uncompressed.
+
+    The mipmapped memory is the one of its full mipmap chain, as the renderers build it for the images without one.
+    """
+    pixel_size = image_header.channels * ((image_header.bit_depth + 7) // 8)
+    memory = image_header.width * image_header.height * pixel_size
+    mipmapped_memory = 0
+
+    for level in range(get_mip_levels(image_header.width, image_header.height)):
+        mipmapped_memory += max(1, image_header.width >> level) * max(1, image_header.height >> level) * pixel_size
+
+    return memory, mipmapped_memory
+
+
+def get_mip_levels(width: int, height: int, round_up: bool = False) -> int:
+    """Gets the number of levels of a full mipmap chain."""
+    size = max(width, height, 1)
+
+    return (math.ceil(math.log2(size)) if round_up else size.bit_length() - 1) + 1
+
+
+def is_large_image(image_header: ImageHeader) -> bool:
+    """Checks if the image is as large as LARGE_IMAGE_SIZE."""
+    return max(image_header.width, image_header.height) >= LARGE_IMAGE_SIZE
+
+
+def read_exr_header(f: any, data: bytes) -> ImageHeader:
+    """Reads the header attributes of an OpenEXR image, the first part of multi-part ones."""
+    version_flags = struct.unpack_from('<I', data, 4)[0]
+    attributes = {}
+    offset = 8
+
+    while True:
+        if offset + 512 > len(data):
+            data += f.read(HEADER_READ_SIZE)
+
+        name_end = data.index(b'\0', offset)
+
+        if name_end == offset:
+            break
+
+        type_end = data.index(b'\0', name_end + 1)
+        size = struct.unpack_from('<i', data, type_end + 1)[0]
+        value_offset = type_end + 5
+
+        while value_offset + size > len(data):
+            chunk = f.read(HEADER_READ_SIZE)
+
+            if not chunk:
+                return None
+
+            data += chunk
+
+        attributes[data[offset:name_end]] = data[value_offset:value_offset + size]
+        offset = value_offset + size
+
+    channels = attributes.get(b'channels', b'')
+    channels_bits = []
+    offset = 0
+
+    while offset < len(channels) and channels[offset]:
+        name_end = channels.index(b'\0', offset)
+        channels_bits.append(struct.unpack_from('<i', channels, name_end + 1)[0])
+        offset = name_end + 17
+
+    x_min, y_min, x_max, y_max = struct.unpack('<4i', attributes[b'dataWindow'])
+    width = x_max - x_min + 1
+    height = y_max - y_min + 1
+
+    tiles = attributes.get(b'tiles')
+    mip_levels = 1
+
+    if tiles:
+        level_mode = tiles[8] & 0x0F
+
+        if level_mode in (1, 2):
+            mip_levels = get_mip_levels(width, height, round_up=bool(tiles[8] >> 4))
+
+    return ImageHeader(
+        format='exr',
+        width=width,
+        height=height,
+        channels=len(channels_bits),
+        bit_depth=max((EXR_PIXEL_TYPES_BITS.get(pixel_type, 32) for pixel_type in channels_bits), default=0),
+        is_float=any(pixel_type in (1, 2) for pixel_type in channels_bits),
+        is_tiled=bool(tiles) or bool(version_flags & 0x200),
+        mip_levels=mip_levels)
+
+
+def read_gif_header(f: any, data: bytes) -> ImageHeader:
+    """Reads the logical screen size of a GIF image."""
+    width, height = struct.unpack_from('<HH', data, 6)
+
+    return ImageHeader('gif', width, height, 3, 8, False, False, 1)
+
+
+def read_hdr_header(f: any, data: bytes) -> ImageHeader:
+    """Reads the resolution line of a Radiance HDR image, which follows the header lines."""
+    while b'\n\n' not in data and len(data) < 65536:
+        chunk = f.read(HEADER_READ_SIZE)
+
+        if not chunk:
+            break
+
+        data += chunk
+
+    header, separator, body = data.partition(b'\n\n')
+
+    if not separator:
+        return None
+
+    tokens = body.split(b'\n', 1)[0].split()
+
+    if len(tokens) != 4:
+        return None
+
+    sizes = {tokens[0][1:2]: int(tokens[1]), tokens[2][1:2]: int(tokens[3])}
+
+    return ImageHeader('hdr', sizes[b'X'], sizes[b'Y'], 3, 32, True, False, 1)
+
+
+def read_image_header(path: str) -> ImageHeader:
+    """Reads the header of an image without decoding it, the format is found from its first bytes.
+
+    Supports OpenEXR, PNG, TIFF (and .tx), JPEG, Radiance HDR and GIF images. Returns None if the file can not be read
+    or its format is not supported.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read(HEADER_READ_SIZE)
+
+            for magic, reader in IMAGE_HEADER_READERS:
+                if data.startswith(magic):
+                    return reader(f, data)
+    except (OSError, ValueError, KeyError, IndexError, struct.error):
+        pass
+
+    return None
+
+
+def read_jpeg_header(f: any, data: bytes) -> ImageHeader:
+    """Reads the frame header of a JPEG image, skipping the segments before it."""
+    offset = 2
+
+    while True:
+        if offset + 10 <= len(data):
+            segment = data[offset:offset + 10]
+        else:
+            f.seek(offset)
+            segment = f.read(10)
+
+        if len(segment) < 10 or segment[0] != 0xFF:
+            return None
+
+        marker = segment[1]
+
+        if marker == 0xFF:
+            offset += 1
+            continue
+
+        if marker in JPEG_FRAME_MARKERS:
+            bit_depth, height, width, channels = struct.unpack_from('>BHHB', segment, 4)
+
+            return ImageHeader('jpg', width, height, channels, bit_depth, False, False, 1)
+
+        offset += 2 + struct.unpack_from('>H', segment, 2)[0]
+
+
+def read_png_header(f: any, data: bytes) -> ImageHeader:
+    """Reads the IHDR chunk of a PNG image."""
+    width, height, bit_depth, color_type = struct.unpack_from('>IIBB', data, 16)
+
+    return ImageHeader('png', width, height, PNG_CHANNELS.get(color_type, 3), bit_depth, False, False, 1)
+
+
+def read_tiff_header(f: any, data: bytes) -> ImageHeader:
+    """Reads the first Image File Directory of a TIFF image, counting the following ones as mip levels."""
+    byte_order = '<' if data[:2] == b'II' else '>'
+    ifd_offset = struct.unpack_from(f'{byte_order}I', data, 4)[0]
+    tags = None
+    mip_levels = 0
+
+    while ifd_offset and mip_levels < MAX_TIFF_DIRECTORIES:
+        f.seek(ifd_offset)
+        count = struct.unpack(f'{byte_order}H', f.read(2))[0]
+        entries = f.read(count * 12 + 4)
+
+        if tags is None:
+            tags = {}
+
+            for i in range(count):
+                tag, tiff_type, value_count = struct.unpack_from(f'{byte_order}HHI', entries, i * 12)
+                value_format, value_size = TIFF_TYPES.get(tiff_type, (None, 0))
+
+                if value_format and value_count * value_size <= 4:
+                    tags[tag] = struct.unpack_from(f'{byte_order}{value_count}{value_format}', entries, i * 12 + 8)
+                elif value_format:
+                    f.seek(struct.unpack_from(f'{byte_order}I', entries, i * 12 + 8)[0])
+                    tags[tag] = struct.unpack(
+                        f'{byte_order}{value_count}{value_format}',
+                        f.read(value_count * value_size))
+
+        mip_levels += 1
+        ifd_offset = struct.unpack_from(f'{byte_order}I', entries, count * 12)[0]
+
+    bits_per_sample = tags.get(258, (1,))
+
+    return ImageHeader(
+        format='tif',
+        width=tags[256][0],
+        height=tags[257][0],
+        channels=tags.get(277, (len(bits_per_sample),))[0],
+        bit_depth=max(bits_per_sample),
+        is_float=tags.get(339, (1,))[0] == 3,
+        is_tiled=322 in tags,
+        mip_levels=mip_levels)
+
+
+# (magic bytes, header reader)
+IMAGE_HEADER_READERS = (
+    (b'\x76\x2f\x31\x01', read_exr_header),
+    (b'\x89PNG\r\n\x1a\n', read_png_header),
+    (b'II*\0', read_tiff_header),
+    (b'MM\0*', read_tiff_header),
+    (b'\xff\xd8', read_jpeg_header),
+    (b'#?RADIANCE', read_hdr_header),
+    (b'#?RGBE', read_hdr_header),
+    (b'GIF8', read_gif_header)
+)
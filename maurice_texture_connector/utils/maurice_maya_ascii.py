@@ -0,0 +1,175 @@
+"""
+========================================================================================================================
+Name: maurice_maya_ascii.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from collections import namedtuple
+import mmap
+import re
+import os
+
+import maurice_texture_connector.utils.maurice_paths as maurice_paths
+
+
+CREATE_FILE_NODE = b'createNode file '
+
+FILE_NODE_NAME_PATTERN = re.compile(rb'-n "((?:[^"\\]|\\.)*)"')
+FILE_TEXTURE_NAME_PATTERN = re.compile(rb'\s*setAttr "\.(?:ftn|fileTextureName)" -type "string" "((?:[^"\\]|\\.)*)"')
+
+ESCAPE_PATTERN = re.compile(r'\\(.)')
+
+TextureRepath = namedtuple(
+    'TextureRepath',
+    ('line_number', 'file_node', 'old_path', 'new_path', 'old_line', 'new_line'))
+
+
+def escape_string(value: str) -> bytes:
+    """Encodes a MEL string of a Maya ASCII scene."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').encode('utf-8')
+
+
+def find_project_path(scene_path: str) -> str:
+    """Finds the Maya project of a scene, the first folder above it with a 'workspace.mel', or '' if there is none."""
+    folder_path = os.path.dirname(os.path.abspath(scene_path))
+
+    while True:
+        if os.path.isfile(os.path.join(folder_path, 'workspace.mel')):
+            return folder_path.replace('\\', '/') + '/'
+
+        parent_folder_path = os.path.dirname(folder_path)
+
+        if parent_folder_path == folder_path:
+            return ''
+
+        folder_path = parent_folder_path
+
+
+def get_maya_ascii_file_textures(scene_path: str) -> list:
+    """Gets the (file node, file texture name) pairs of a Maya ASCII scene without Maya.
+
+    The scene is memory-mapped and only the lines of the 'createNode file' blocks are read, jumping from one block to
+    the next. File nodes without a texture are returned with ''.
+    """
+    file_textures = []
+
+    with open(scene_path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return file_textures
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as scene:
+            position = scene.find(CREATE_FILE_NODE)
+
+            while position != -1:
+                # Only the commands at the beginning of a line.
+                if position and scene[position - 1] not in b'\r\n':
+                    position = scene.find(CREATE_FILE_NODE, position + 1)
+                    continue
+
+                scene.seek(position)
+                line = scene.readline()
+
+                match = FILE_NODE_NAME_PATTERN.search(line)
+                file_node = unescape_string(match.group(1)) if match else ''
+                file_texture_name = ''
+
+                # The node attributes are the indented lines that follow.
+                while True:
+                    line_position = scene.tell()
+                    line = scene.readline()
+
+                    if not line or line[:1] not in b'\t ':
+                        scene.seek(line_position)
+                        break
+
+                    match = FILE_TEXTURE_NAME_PATTERN.match(line)
+
+                    if match:
+                        file_texture_name = unescape_string(match.group(1))
+
+                file_textures.append((file_node, file_texture_name))
+
+                position = scene.find(CREATE_FILE_NODE, scene.tell())
+
+    return file_textures
+
+
+def repath_maya_ascii_scene(scene_path: str, rules: list, ignore_case: bool = False, dry_run: bool = False) -> list:
+    """Replaces the path prefixes of the file nodes textures of a Maya ASCII scene without Maya.
+
+    The scene is streamed line by line to a temporary file next to it, which replaces the scene atomically only if a
+    texture changed. Nothing is written if 'dry_run' is True. Returns the TextureRepath of every texture changed.
+    """
+    # Imported here so the headless import of utils does not pull them.
+    import tempfile
+    import shutil
+
+    textures_repaths = []
+    temp_file = None
+
+    if not dry_run:
+        temp_file = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(os.path.abspath(scene_path)),
+            prefix='.',
+            suffix='.ma.tmp',
+            delete=False)
+
+    try:
+        with open(scene_path, 'rb') as f:
+            file_node = None
+
+            for line_number, line in enumerate(f, 1):
+                if line[:1] not in b'\t ':
+                    file_node = None
+
+                    if line.startswith(CREATE_FILE_NODE):
+                        match = FILE_NODE_NAME_PATTERN.search(line)
+                        file_node = unescape_string(match.group(1)) if match else ''
+                elif file_node is not None:
+                    match = FILE_TEXTURE_NAME_PATTERN.match(line)
+
+                    if match:
+                        old_path = unescape_string(match.group(1))
+                        new_path = maurice_paths.replace_path_prefix(
+                            path=old_path,
+                            rules=rules,
+                            ignore_case=ignore_case)
+
+                        if new_path != old_path:
+                            new_line = line[:match.start(1)] + escape_string(new_path) + line[match.end(1):]
+
+                            textures_repaths.append(TextureRepath(
+                                line_number=line_number,
+                                file_node=file_node,
+                                old_path=old_path,
+                                new_path=new_path,
+                                old_line=line.decode('utf-8', errors='replace'),
+                                new_line=new_line.decode('utf-8', errors='replace')))
+
+                            line = new_line
+
+                if temp_file:
+                    temp_file.write(line)
+
+        if temp_file:
+            temp_file.close()
+
+            if textures_repaths:
+                shutil.copymode(scene_path, temp_file.name)
+                os.replace(temp_file.name, scene_path)
+    finally:
+        if temp_file:
+            temp_file.close()
+
+            if os.path.exists(temp_file.name):
+                os.remove(temp_file.name)
+
+    return textures_repaths
+
+
+def unescape_string(value: bytes) -> str:
+    """Decodes a MEL string of a Maya ASCII scene."""
+    return ESCAPE_PATTERN.sub(r'\1', value.decode('utf-8', errors='replace'))
@@ -7,14 +7,69 @@ Updated Date: 11-11-2024
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
-from maya.cmds import internalVar
-from pathlib import Path
-from glob import glob
+from collections import namedtuple
+from functools import lru_cache
+import threading
+import time
 import os
 
+from maurice_texture_connector.utils.maurice_image_headers import read_image_header
+
+
+IMAGE_EXTENSIONS = frozenset(('.exr', '.gif', '.hdr', '.jpg', '.jpeg', '.png', '.tif', '.tiff'))
+
+FileEntry = namedtuple('FileEntry', ('name', 'path', 'size', 'mtime', 'is_folder'), defaults=(False,))
+
+# Seconds a stat result is reused by get_cached_stat.
+STAT_CACHE_TTL = 2.0
+
+# Threads reading the image headers of a folder, the reads wait on the disk or the network more than on Python.
+IMAGE_HEADERS_WORKERS = 8
+
+# {path: (time, os.stat_result or None)}
+stat_cache = {}
+stat_cache_lock = threading.Lock()
+
+
+def clear_stat_cache(path: str = '') -> None:
+    """Clears the cached stat of the path, or the whole cache if no path is given."""
+    with stat_cache_lock:
+        if path:
+            stat_cache.pop(os.path.normpath(path), None)
+        else:
+            stat_cache.clear()
+
+
+def get_cached_stat(path: str, ttl: float = STAT_CACHE_TTL) -> any:
+    """Gets the stat of the path, or None if it does not exist.
+
+    The result is cached for 'ttl' seconds, so the paths on remote shares are not stat'ed on every refresh. It is safe
+    to call from worker threads.
+    """
+    path = os.path.normpath(path)
+    current_time = time.monotonic()
+
+    with stat_cache_lock:
+        cached_stat = stat_cache.get(path)
+
+    if cached_stat and current_time - cached_stat[0] < ttl:
+        return cached_stat[1]
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        stat = None
+
+    with stat_cache_lock:
+        stat_cache[path] = (current_time, stat)
+
+    return stat
+
 
 def get_data_folder_path() -> str:
     """Gets the data folder path."""
+    from maya.cmds import internalVar
+
     user_pref_dir = internalVar(userPrefDir=True)
     data_folder_path = os.path.join(user_pref_dir, 'mauriceTextureConnector')
 
@@ -24,16 +79,30 @@ def get_data_folder_path() -> str:
 def get_files_in_folder(path: str) -> dict:
     """Gets files in folder."""
     files = {}
+    path = strip_trailing_slash(path)
+    folder_path = path if path.endswith('/') else f'{path}/'
 
-    for file_path in glob(os.path.join(path, '*')):
-        file_path = file_path.replace('\\', '/')
-        files[os.path.basename(file_path)] = file_path
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not entry.name.startswith('.'):
+                    files[entry.name] = f'{folder_path}{entry.name}'
+    except OSError:
+        pass
 
     return files
 
 
+def get_folder_images_headers(path: str, max_workers: int = IMAGE_HEADERS_WORKERS) -> dict:
+    """Gets the headers of the images of the folder: {path: ImageHeader or None}."""
+    images_paths = [file_entry.path for file_entry in scan_folder(path=path, extensions=IMAGE_EXTENSIONS)]
+
+    return get_images_headers(images_paths, max_workers=max_workers)
+
+
+@lru_cache(maxsize=None)
 def get_icons() -> dict:
-    """Gets the icons."""
+    """Gets the icons, the icons folder is listed once."""
     icons = get_files_in_folder(get_icons_folder_path())
 
     return icons
@@ -46,13 +115,28 @@ def get_icons_folder_path() -> str:
     return icons_folder_path
 
 
+@lru_cache(maxsize=None)
 def get_images() -> dict:
-    """Gets the images."""
+    """Gets the images, the images folder is listed once."""
     images = get_files_in_folder(get_images_folder_path())
 
     return images
 
 
+def get_image_header(path: str) -> any:
+    """Gets the ImageHeader of the image, or None if it can not be read.
+
+    Only the first bytes of the image are read. The header is cached by (path, mtime, size), so an image is read again
+    only once it changed, the stat itself being cached by get_cached_stat. It is safe to call from worker threads.
+    """
+    stat = get_cached_stat(path)
+
+    if not stat:
+        return None
+
+    return read_cached_image_header(os.path.normpath(path), stat.st_mtime_ns, stat.st_size)
+
+
 def get_images_folder_path() -> str:
     """Gets the images path."""
     images_folder_path = os.path.join(get_root_path(), 'images')
@@ -60,6 +144,27 @@ def get_images_folder_path() -> str:
     return images_folder_path
 
 
+def get_images_headers(paths: list, max_workers: int = IMAGE_HEADERS_WORKERS) -> dict:
+    """Gets the headers of the images in a thread pool: {path: ImageHeader or None}."""
+    paths = list(dict.fromkeys(paths))
+
+    if max_workers <= 1 or len(paths) <= 1:
+        return {path: get_image_header(path) for path in paths}
+
+    # Imported here so the headless import of utils does not pull concurrent.futures and its logging.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(get_image_header, paths)))
+
+
+def get_plugins_folder_path() -> str:
+    """Gets the plugins folder path."""
+    plugins_folder_path = os.path.join(get_root_path(), 'plugins')
+
+    return plugins_folder_path
+
+
 def get_root_path() -> str:
     """Gets the root path."""
     root_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -67,10 +172,105 @@ def get_root_path() -> str:
     return root_path
 
 
+def get_texture_status(file_path: str, exists: bool, project_path: str) -> str:
+    """Gets the status of a texture: 'check' if it is in the project, 'warning' if it is not, 'cross' if it is missing."""
+    if not exists:
+        return 'cross'
+
+    return 'check' if file_path.startswith(project_path) else 'warning'
+
+
 def is_image(path: str) -> bool:
     """Checks if the path is an image."""
-    if os.path.isfile(path):
-        if Path(path).suffix in ['.exr', '.gif', '.hdr', '.jpg', '.jpeg', '.png', '.tif', '.tiff']:
+    if os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS:
+        if os.path.isfile(path):
             return True
 
     return False
+
+
+@lru_cache(maxsize=16384)
+def read_cached_image_header(path: str, mtime: int, size: int) -> any:
+    """Reads the header of the image, cached by its mtime and size."""
+    return read_image_header(path)
+
+
+def replace_path_prefix(path: str, rules: list, ignore_case: bool = False) -> str:
+    """Replaces the prefix of the path with the first (old prefix, new prefix) rule matching it.
+
+    Slashes are compared as '/', so Windows and Maya paths match the same rules. Returns the path unchanged if no rule
+    matches.
+    """
+    normalized_path = path.replace('\\', '/')
+    compared_path = normalized_path.lower() if ignore_case else normalized_path
+
+    for old_prefix, new_prefix in rules:
+        old_prefix = old_prefix.replace('\\', '/')
+
+        if compared_path.startswith(old_prefix.lower() if ignore_case else old_prefix):
+            return new_prefix.replace('\\', '/') + normalized_path[len(old_prefix):]
+
+    return path
+
+
+def scan_folder(path: str, extensions: frozenset = None, include_unmatched: bool = False,
+                include_folders: bool = False) -> list:
+    """Scans the files of the folder.
+
+    Filters the directory entries by the extension of their name before any stat, so only the matched files are
+    stat'ed, and the type of the others is only checked if they are returned: on the file systems that do not give the
+    type of the entries, such as some NFS and SMB mounts, each type check is a stat. Returns FileEntry(name, path,
+    size, mtime, is_folder) tuples, mtime in nanoseconds. Files whose extension is not in 'extensions' are skipped, or
+    returned with no size and mtime if 'include_unmatched' is True. Sub folders are returned, with no size and mtime,
+    if 'include_folders' is True.
+    """
+    files = []
+    path = strip_trailing_slash(path)
+    folder_path = path if path.endswith('/') else f'{path}/'
+    check_unmatched = include_folders or include_unmatched
+
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+
+                try:
+                    file_path = f'{folder_path}{entry.name}'
+
+                    if extensions is None or os.path.splitext(entry.name)[1].lower() in extensions:
+                        # The type checks use the stat of the entry, once it is made.
+                        stat = entry.stat()
+
+                        if entry.is_file():
+                            files.append(FileEntry(entry.name, file_path, stat.st_size, stat.st_mtime_ns))
+                            continue
+                    elif not check_unmatched:
+                        continue
+
+                    if entry.is_dir():
+                        if include_folders:
+                            files.append(FileEntry(entry.name, file_path, None, None, True))
+                    elif include_unmatched and entry.is_file():
+                        files.append(FileEntry(entry.name, file_path, None, None))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+    return files
+
+
+def strip_trailing_slash(path: str) -> str:
+    """Uses forward slashes in the path and strips its trailing slashes, except the one of a root: '/' or 'C:/'."""
+    path = path.replace('\\', '/')
+
+    if len(path) > 1 and path.endswith('/'):
+        stripped_path = path.rstrip('/')
+
+        if not stripped_path or (len(stripped_path) == 2 and stripped_path[1] == ':'):
+            return f'{stripped_path}/'
+
+        return stripped_path
+
+    return path
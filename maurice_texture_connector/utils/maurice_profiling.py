@@ -0,0 +1,251 @@
+"""
+========================================================================================================================
+Name: maurice_profiling.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from functools import wraps
+import threading
+import json
+import time
+import os
+
+
+# Timing spans are recorded only if True, MAURICE_PROFILING=0 disables them.
+PROFILING = os.environ.get('MAURICE_PROFILING', '1') != '0'
+
+# {span name: [count, total seconds, min seconds, max seconds, {bucket: count}]}, the buckets are the bit length of
+# the duration in microseconds, so the bucket 'n' holds the durations below 2^n microseconds.
+histograms = {}
+histograms_lock = threading.Lock()
+
+# Last operation, the outermost span ended: (name, seconds, [(span name, depth, seconds)]).
+last_operation = None
+operation_listeners = []
+
+spans_stack = threading.local()
+profiler = None
+
+
+class TimingSpan(object):
+    """Timing span.
+
+    Times a block of code and adds its duration to the histogram of its name. The spans opened inside another span are
+    its children, the outermost span of a thread is an operation whose breakdown is kept as the last operation.
+    """
+    __slots__ = ('name', 'start_time')
+
+    def __init__(self, name: str) -> None:
+        """Initializes class attributes."""
+        self.name = name
+        self.start_time = 0.0
+
+    def __enter__(self) -> 'TimingSpan':
+        """Starts the span."""
+        if PROFILING:
+            stack = get_spans_stack()
+            stack.append([])
+
+            self.start_time = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Ends the span, recording it in its histogram and in its parent, or as the last operation."""
+        if not self.start_time:
+            return
+
+        duration = time.perf_counter() - self.start_time
+        stack = get_spans_stack()
+        children = stack.pop()
+
+        add_to_histogram(self.name, duration)
+
+        if stack:
+            stack[-1].append((self.name, 0, duration))
+            stack[-1].extend((name, depth + 1, child_duration) for name, depth, child_duration in children)
+        else:
+            set_last_operation((self.name, duration, children))
+
+
+def add_operation_listener(listener: callable) -> None:
+    """Adds a function called with the (name, seconds, spans) of every operation ended."""
+    if listener not in operation_listeners:
+        operation_listeners.append(listener)
+
+
+def add_to_histogram(name: str, duration: float) -> None:
+    """Adds a duration to the histogram of the span."""
+    bucket = int(duration * 1e6).bit_length()
+
+    with histograms_lock:
+        histogram = histograms.get(name)
+
+        if histogram is None:
+            histograms[name] = [1, duration, duration, duration, {bucket: 1}]
+            return
+
+        histogram[0] += 1
+        histogram[1] += duration
+        histogram[2] = min(histogram[2], duration)
+        histogram[3] = max(histogram[3], duration)
+        histogram[4][bucket] = histogram[4].get(bucket, 0) + 1
+
+
+def clear_histograms() -> None:
+    """Clears the histograms of the session."""
+    global last_operation
+
+    with histograms_lock:
+        histograms.clear()
+
+    last_operation = None
+
+
+def dump_histograms(folder_path: str) -> str:
+    """Writes the histograms of the session to a JSON file of the folder and returns its path."""
+    os.makedirs(folder_path, exist_ok=True)
+    path = os.path.join(folder_path, f'timings_{time.strftime("%Y%m%d_%H%M%S")}.json').replace('\\', '/')
+
+    with open(path, 'w') as f:
+        json.dump(get_histograms(), f, indent=4)
+
+    return path
+
+
+def format_operation(operation: tuple, max_spans: int = 0) -> str:
+    """Formats the operation and the total time of its direct children, the slowest first.
+
+    Only the 'max_spans' slowest children are formatted if it is not 0.
+    """
+    name, duration, spans = operation
+    children_durations = {}
+
+    for span_name, depth, span_duration in spans:
+        if not depth:
+            children_durations[span_name] = children_durations.get(span_name, 0.0) + span_duration
+
+    children = sorted(children_durations.items(), key=lambda child: -child[1])
+
+    if max_spans:
+        children = children[:max_spans]
+
+    return ' · '.join([f'{name} {duration * 1e3:.0f} ms'] + [
+        f'{child_name} {child_duration * 1e3:.0f}' for child_name, child_duration in children])
+
+
+def get_histograms() -> dict:
+    """Gets the histograms of the session: {span name: {count, total_ms, mean_ms, min_ms, max_ms, buckets}}.
+
+    The buckets are {upper bound in microseconds: count}.
+    """
+    with histograms_lock:
+        items = [(name, list(histogram[:4]), dict(histogram[4])) for name, histogram in histograms.items()]
+
+    return {name: {
+        'count': count,
+        'total_ms': total * 1e3,
+        'mean_ms': total * 1e3 / count,
+        'min_ms': minimum * 1e3,
+        'max_ms': maximum * 1e3,
+        'buckets': {str(2 ** bucket): buckets[bucket] for bucket in sorted(buckets)}
+    } for name, (count, total, minimum, maximum), buckets in sorted(items)}
+
+
+def get_last_operation() -> tuple:
+    """Gets the (name, seconds, [(span name, depth, seconds)]) of the last operation, or None."""
+    return last_operation
+
+
+def get_spans_stack() -> list:
+    """Gets the children lists of the spans open in the current thread."""
+    stack = getattr(spans_stack, 'stack', None)
+
+    if stack is None:
+        stack = spans_stack.stack = []
+
+    return stack
+
+
+def is_profiler_running() -> bool:
+    """Checks if the cProfile capture is running."""
+    return profiler is not None
+
+
+def remove_operation_listener(listener: callable) -> None:
+    """Removes an operation listener."""
+    if listener in operation_listeners:
+        operation_listeners.remove(listener)
+
+
+def set_last_operation(operation: tuple) -> None:
+    """Sets the last operation and calls the listeners."""
+    global last_operation
+
+    last_operation = operation
+
+    for listener in list(operation_listeners):
+        listener(operation)
+
+
+def set_profiling_enabled(enabled: bool) -> None:
+    """Enables or disables the timing spans."""
+    global PROFILING
+
+    PROFILING = enabled
+
+
+def start_profiler() -> None:
+    """Starts a cProfile capture of the main thread."""
+    import cProfile
+
+    global profiler
+
+    if profiler is None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+
+def stop_profiler(folder_path: str) -> str:
+    """Stops the cProfile capture and writes its '.prof' file, with a '.txt' summary, to the folder.
+
+    Returns the path of the '.prof' file, or '' if no capture was running.
+    """
+    import pstats
+
+    global profiler
+
+    if profiler is None:
+        return ''
+
+    capture = profiler
+    profiler = None
+    capture.disable()
+
+    os.makedirs(folder_path, exist_ok=True)
+    path = os.path.join(folder_path, f'profile_{time.strftime("%Y%m%d_%H%M%S")}').replace('\\', '/')
+
+    capture.dump_stats(f'{path}.prof')
+
+    with open(f'{path}.txt', 'w') as f:
+        pstats.Stats(capture, stream=f).sort_stats('cumulative').print_stats(60)
+
+    return f'{path}.prof'
+
+
+def timed(name: str = '') -> callable:
+    """Times every call of the function in a span, named like the function if no name is given."""
+    def decorator(function: callable) -> callable:
+        span_name = name or function.__name__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs) -> any:
+            with TimingSpan(span_name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -7,14 +7,24 @@ Updated Date: 11-05-2024
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================================================
 """
-from ctypes import windll
 from typing import Union
 
 import maurice_texture_connector as maurice
 
+try:
+    from ctypes import windll
+except ImportError:
+    windll = None
+
+
+DEFAULT_PPI = 96
+
 
 def get_ppi() -> int:
-    """Gets the PPI of the screen."""
+    """Gets the PPI of the screen, DEFAULT_PPI where it can not be queried (Linux, macOS, batch)."""
+    if not windll:
+        return DEFAULT_PPI
+
     user32 = windll.user32
     user32.SetProcessDPIAware()
     pix_per_inch = windll.gdi32.GetDeviceCaps(user32.GetDC(0), 88)
@@ -0,0 +1,213 @@
+"""
+========================================================================================================================
+Name: maurice_textures.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 11-12-2024
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================================================
+"""
+from collections import namedtuple
+from functools import lru_cache
+import re
+import os
+
+
+BASE_COLOR = 'base_color'
+ROUGHNESS = 'roughness'
+METALNESS = 'metalness'
+NORMAL = 'normal'
+HEIGHT = 'height'
+EMISSIVE = 'emissive'
+OPACITY = 'opacity'
+PACKED = 'packed'
+
+CHANNELS = (BASE_COLOR, ROUGHNESS, METALNESS, NORMAL, HEIGHT, EMISSIVE, OPACITY, PACKED)
+
+# Components of a packed texture: occlusion, roughness and metalness, as the 'ORM' and 'ARM' textures.
+PACKED_LAYOUT = 'ORM'
+
+# {letter of a packed layout: channel}, the other letters are components not connected, such as the occlusion.
+PACKED_LAYOUT_CHANNELS = {'R': ROUGHNESS, 'M': METALNESS}
+
+UDIM_TOKEN = '<UDIM>'
+FIRST_UDIM_TILE = 1001
+LAST_UDIM_TILE = 1999
+
+# Tokens a file texture name can have in place of its tile or frame number.
+SEQUENCE_TOKENS = ('<UDIM>', '<F>')
+
+# Largest ratio between the span of a frame sequence and its number of files, the numbered files of a sparser one,
+# such as date stamped files 'scan.1.jpg' and 'scan.20240101.jpg', are not a sequence.
+MAX_SEQUENCE_SPAN_RATIO = 16
+
+# Tiles or frames of a file name with a numeric suffix: 'name.1001.exr'. 'tiles' is a bitset, the bit 'i' is set if the
+# number 'start + i' exists. 'pattern' is the file name with the number replaced by '<UDIM>' or by a '#' per digit.
+TextureSequence = namedtuple('TextureSequence', ('pattern', 'path', 'start', 'tiles', 'padding', 'is_udim'))
+
+
+def format_sequence(sequence: TextureSequence) -> str:
+    """Formats the tiles or frames of the sequence, with the missing ones on a second line."""
+    tiles = get_sequence_tiles(sequence)
+    missing_tiles = get_missing_tiles(sequence)
+    kind = 'tiles' if sequence.is_udim else 'frames'
+    report = f'{len(tiles)} {kind}: {format_tiles(tiles)}'
+
+    if missing_tiles:
+        report += f'\nMissing {kind}: {format_tiles(missing_tiles)}'
+
+    return report
+
+
+def format_tiles(tiles: list) -> str:
+    """Formats sorted tiles or frames as ranges: '1001-1010, 1012'."""
+    ranges = []
+
+    for tile in tiles:
+        if ranges and tile == ranges[-1][1] + 1:
+            ranges[-1][1] = tile
+        else:
+            ranges.append([tile, tile])
+
+    return ', '.join(f'{first}-{last}' if first != last else f'{first}' for first, last in ranges)
+
+
+@lru_cache(maxsize=64)
+def get_channels_pattern(channels_suffixes: tuple, case_sensitive: bool) -> any:
+    """Gets the compiled pattern that matches every channel suffix in a single scan.
+
+    'channels_suffixes' is a tuple of (channel, suffix) pairs, the channel being used as the group name. Channels
+    without suffix are ignored.
+    """
+    groups = [f'(?P<{channel}>{re.escape(suffix)})' for channel, suffix in channels_suffixes if suffix]
+
+    if not groups:
+        return None
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+
+    return re.compile(f'_(?:{"|".join(groups)})(?:_|$)', flags)
+
+
+def get_missing_tiles(sequence: TextureSequence) -> list:
+    """Gets the tiles or frames missing between the first and the last ones of the sequence."""
+    missing_tiles = []
+    previous_tile = None
+
+    for tile in get_sequence_tiles(sequence):
+        if previous_tile is not None:
+            missing_tiles.extend(range(previous_tile + 1, tile))
+
+        previous_tile = tile
+
+    return missing_tiles
+
+
+def get_packed_channels(suffix: str) -> dict:
+    """Gets the {channel: component} of a packed texture: {'roughness': 'G', 'metalness': 'B'}.
+
+    The layout is the suffix itself when it is made of 3 letters with an 'R' and an 'M', such as 'ARM' or 'RMA',
+    PACKED_LAYOUT otherwise.
+    """
+    layout = suffix.upper()
+
+    if not (len(layout) == 3 and layout.isalpha() and all(letter in layout for letter in PACKED_LAYOUT_CHANNELS)):
+        layout = PACKED_LAYOUT
+
+    return {PACKED_LAYOUT_CHANNELS[letter]: component
+            for letter, component in zip(layout, 'RGB') if letter in PACKED_LAYOUT_CHANNELS}
+
+
+def get_sequence_key(file_name: str) -> str:
+    """Gets the key shared by the files of a sequence, its number or token replaced by '#'.
+
+    'name.1001.exr', 'name.<UDIM>.exr' and 'name.####.exr' have the same key, a file name without number is its own
+    key.
+    """
+    file_stem, extension = os.path.splitext(file_name)
+    head, separator, number = file_stem.rpartition('.')
+
+    if head and number and (number.isdigit() or number.upper() in SEQUENCE_TOKENS or number == '#' * len(number)):
+        return f'{head}.#{extension}'
+
+    return file_name
+
+
+def get_sequence_paths(sequence: TextureSequence) -> list:
+    """Gets the paths of the tiles or frames of the sequence."""
+    directory = os.path.dirname(sequence.path)
+    head, separator, extension = sequence.pattern.rpartition(UDIM_TOKEN if sequence.is_udim else '#' * sequence.padding)
+
+    return [f'{directory}/{head}{tile:0{sequence.padding}d}{extension}' for tile in get_sequence_tiles(sequence)]
+
+
+def get_sequence_tiles(sequence: TextureSequence) -> list:
+    """Gets the tiles or frames of the sequence, from the set bits of its bitset, lowest first."""
+    tiles = sequence.tiles
+    sequence_tiles = []
+
+    while tiles:
+        low_bit = tiles & -tiles
+        sequence_tiles.append(sequence.start + low_bit.bit_length() - 1)
+        tiles ^= low_bit
+
+    return sequence_tiles
+
+
+def get_texture_sequences(files_numbers: dict) -> dict:
+    """Gets the sequences of numbered files.
+
+    'files_numbers' is {sequence key: [(number, file name, file path)]}. The sequence is a UDIM one if all its numbers
+    are UDIM tiles, else a frame sequence. Returns {sequence key: TextureSequence}, without the frame sequences whose
+    span is larger than MAX_SEQUENCE_SPAN_RATIO times their number of files.
+    """
+    sequences = {}
+
+    for sequence_key, numbers in files_numbers.items():
+        numbers.sort()
+
+        first_number, file_name, file_path = numbers[0]
+        last_number = numbers[-1][0]
+        padding = len(file_name.rsplit('.', 2)[-2])
+        is_udim = padding == 4 and FIRST_UDIM_TILE <= first_number and last_number <= LAST_UDIM_TILE
+        start = FIRST_UDIM_TILE if is_udim else first_number
+
+        if not is_udim and last_number - first_number + 1 > MAX_SEQUENCE_SPAN_RATIO * len(numbers):
+            continue
+
+        tiles = 0
+
+        for number, _, _ in numbers:
+            tiles |= 1 << (number - start)
+
+        file_stem, extension = os.path.splitext(file_name)
+        pattern = f'{file_stem.rpartition(".")[0]}.{UDIM_TOKEN if is_udim else "#" * padding}{extension}'
+
+        sequences[sequence_key] = TextureSequence(pattern, file_path, start, tiles, padding, is_udim)
+
+    return sequences
+
+
+def is_sequence_pattern(file_name: str) -> bool:
+    """Checks if the file name has a tile or frame token instead of a number."""
+    file_stem = os.path.splitext(file_name)[0]
+    number = file_stem.rpartition('.')[2]
+
+    return bool(number) and (number.upper() in SEQUENCE_TOKENS or number == '#' * len(number))
+
+
+def match_texture_channel(file_stem: str, channels_suffixes: tuple, case_sensitive: bool = False) -> tuple:
+    """Matches the file stem against the channels suffixes.
+
+    Returns a (channel, base name) tuple, or ('', '') if no suffix is found. When the stem contains more than one
+    suffix the left-most one wins.
+    """
+    pattern = get_channels_pattern(channels_suffixes, case_sensitive)
+
+    if pattern:
+        match = pattern.search(file_stem)
+
+        if match:
+            return match.lastgroup, file_stem[:match.start()]
+
+    return '', ''